@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import TypeVar, List, Set, Union, Any, Dict
+from threading import Lock
+from types import GeneratorType
+from typing import TypeVar, List, Set, Tuple, Union, Any, Dict, Callable, Iterable, Iterator, TextIO
 from functools import reduce
+from weakref import WeakValueDictionary
 
 
 # This file contains some classes which present EBNF syntax features
@@ -12,100 +16,329 @@ from functools import reduce
 # Expressions elements
 
 TExpression = TypeVar("TExpression", bound="Expression")
-
-@dataclass
-class Eps:
+TVertex = TypeVar("TVertex")
+
+
+class Node:
+    """
+    Base of expression nodes. Nodes are immutable and hash-consed:
+    constructing a node structurally equal to a living one returns that
+    same object, so equality is identity and the hash is computed once.
+    Lists of children are stored as tuples.
+    """
+    __slots__ = ("_hash", "__weakref__")
+
+    _interned: "WeakValueDictionary[Tuple, Node]" = WeakValueDictionary()
+    _intern_lock = Lock()
+    # Whether the only field is a sequence of children
+    _sequence = False
+
+    def __new__(cls, *fields):
+        if cls._sequence:
+            fields = (tuple(fields[0]),)
+        key = (cls, fields)
+        node = Node._interned.get(key)
+        if node is not None:
+            return node
+        with Node._intern_lock:
+            node = Node._interned.get(key)
+            if node is None:
+                node = object.__new__(cls)
+                for name, field in zip(cls.__match_args__, fields):
+                    object.__setattr__(node, name, field)
+                object.__setattr__(node, "_hash", hash(key))
+                Node._interned[key] = node
+        return node
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        return type(self), tuple(getattr(self, name) for name in self.__match_args__)
+
+
+def node(cls):
+    return dataclass(cls, init=False, eq=False, frozen=True, slots=True)
+
+
+@node
+class Eps(Node):
   pass
 EPS : Eps = Eps()
 
-@dataclass
-class Terminal:
+@node
+class Terminal(Node):
     value : str
 
-@dataclass
-class NonTerminal:
+@node
+class NonTerminal(Node):
     value : str
 
-@dataclass
-class Name:
+@node
+class Name(Node):
     value : str
 
-@dataclass
-class Optional:
+@node
+class Optional(Node):
     value : TExpression
 
-@dataclass
-class KleeneStar:
+@node
+class KleeneStar(Node):
     value : TExpression
 
 SeqElement = Union[Eps, NonTerminal, Terminal, Name, Optional, KleeneStar] 
 
-@dataclass
-class Seq:
-    vals : List[TExpression]
+@node
+class Seq(Node):
+    vals : Tuple[TExpression, ...]
+    _sequence = True
 
-@dataclass
-class Alt:
-    vals : List[TExpression]
+@node
+class Alt(Node):
+    vals : Tuple[TExpression, ...]
+    _sequence = True
 
 
 Expression = Union[Eps, NonTerminal, Terminal, Name, Optional, KleeneStar, Seq, Alt]
 
 
+# Traversals
+#
+# Expressions are traversed with an explicit stack, so nesting depth is not
+# limited by the interpreter recursion limit. What to do with each kind of
+# node is given by dispatch tables mapping node types to functions.
+
+NO_CHILDREN = ()
+
+CHILDREN: Dict[type, Callable[[Expression], Tuple[Expression, ...]]] = {
+    Eps: lambda expr: NO_CHILDREN,
+    Terminal: lambda expr: NO_CHILDREN,
+    NonTerminal: lambda expr: NO_CHILDREN,
+    Name: lambda expr: NO_CHILDREN,
+    Optional: lambda expr: (expr.value,),
+    KleeneStar: lambda expr: (expr.value,),
+    Seq: lambda expr: expr.vals,
+    Alt: lambda expr: expr.vals,
+}
+
+# Descend only into sequences or only into alternatives
+SEQ_CHILDREN = dict.fromkeys(CHILDREN, lambda expr: NO_CHILDREN)
+SEQ_CHILDREN[Seq] = CHILDREN[Seq]
+ALT_CHILDREN = dict.fromkeys(CHILDREN, lambda expr: NO_CHILDREN)
+ALT_CHILDREN[Alt] = CHILDREN[Alt]
+
+
+def walk(expr: Expression,
+         children: Dict[type, Callable[[Expression], Tuple[Expression, ...]]] = CHILDREN
+         ) -> Iterator[Expression]:
+    """
+    Yields `expr` and its descendants in pre-order.
+    """
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        get_children = children.get(type(node))
+        if get_children is None:
+            raise ValueError("Expression is not valid")
+        yield node
+        stack.extend(reversed(get_children(node)))
+
+
+def fold(expr: Expression,
+         algebra: Dict[type, Callable[[Expression, List[Any]], Any]],
+         children: Dict[type, Callable[[Expression], Tuple[Expression, ...]]] = CHILDREN,
+         memo: Dict[Expression, Any] = None) -> Any:
+    """
+    Computes `algebra[type(node)](node, results for children of node)`
+    bottom-up for every node of `expr`. Since equal subexpressions are the
+    same object, results can be shared between them through `memo`.
+    """
+    results = []
+    stack = [(expr, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            count = len(children[type(node)](node))
+            if count:
+                args = results[-count:]
+                del results[-count:]
+            else:
+                args = []
+            value = algebra[type(node)](node, args)
+            if memo is not None:
+                memo[node] = value
+            results.append(value)
+        elif memo is not None and node in memo:
+            results.append(memo[node])
+        else:
+            get_children = children.get(type(node))
+            if get_children is None or type(node) not in algebra:
+                raise ValueError("Expression is not valid")
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(get_children(node)))
+    return results[0]
+
+
+def trampoline(task: Any) -> Any:
+    """
+    Runs `task`, a generator that yields the generators of its subtasks
+    and is sent back their results, with an explicit stack of generators
+    instead of nested calls. Yielded values other than generators, and
+    `task` itself if it is not a generator, are results already.
+    """
+    if not isinstance(task, GeneratorType):
+        return task
+    stack = [task]
+    result = None
+    while stack:
+        try:
+            subtask = stack[-1].send(result)
+        except StopIteration as stop:
+            stack.pop()
+            result = stop.value
+            continue
+        if isinstance(subtask, GeneratorType):
+            stack.append(subtask)
+            result = None
+        else:
+            result = subtask
+    return result
+
+
+def strongly_connected_components(vertices: Iterable[TVertex],
+                                  successors: Callable[[TVertex], Iterable[TVertex]]
+                                  ) -> Iterator[List[TVertex]]:
+    """
+    Yields strongly connected components of the graph reachable from
+    `vertices` by Tarjan's algorithm with an explicit stack, every
+    component after all components reachable from it, its members in order
+    of discovery.
+    """
+    index: Dict[TVertex, int] = {}
+    low: Dict[TVertex, int] = {}
+    component_stack: List[TVertex] = []
+    on_stack: Set[TVertex] = set()
+    for root in vertices:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        component_stack.append(root)
+        on_stack.add(root)
+        stack = [(root, iter(successors(root)))]
+        while stack:
+            v, rest = stack[-1]
+            for w in rest:
+                if w not in index:
+                    index[w] = low[w] = len(index)
+                    component_stack.append(w)
+                    on_stack.add(w)
+                    stack.append((w, iter(successors(w))))
+                    break
+                if w in on_stack:
+                    low[v] = min(low[v], index[w])
+            else:
+                stack.pop()
+                if stack:
+                    u = stack[-1][0]
+                    low[u] = min(low[u], low[v])
+                if low[v] == index[v]:
+                    component = []
+                    while not component or component[-1] is not v:
+                        component.append(component_stack.pop())
+                        on_stack.discard(component[-1])
+                    yield component[::-1]
+
+# Expressions are printed as a stream of fragments, written out in chunks,
+# so that the text of a large grammar is never built whole in memory
+
+SHOW_PARTS: Dict[type, Callable[[Expression], Tuple[Union[str, Expression], ...]]] = {
+    Eps: lambda expr: ("EPS",),
+    Terminal: lambda expr: (f"\"{expr.value}\"",),
+    Name: lambda expr: (f"${expr.value}",),
+    NonTerminal: lambda expr: (f"<{expr.value}>",),
+    Optional: lambda expr: ("[", expr.value, "]"),
+    KleeneStar: lambda expr: ("{", expr.value, "}"),
+    Seq: lambda expr: ("(", *separated(expr.vals, " "), ")"),
+    Alt: lambda expr: ("(", *separated(expr.vals, " | "), ")"),
+}
+
+# Characters of fragments buffered before a write
+WRITE_CHUNK = 1 << 16
+
+
+def separated(exprs: Tuple[Expression, ...], separator: str) -> Iterator[Union[str, Expression]]:
+    for index, expr in enumerate(exprs):
+        if index:
+            yield separator
+        yield expr
+
+
+def show_fragments(expr: Expression) -> Iterator[str]:
+    """
+    Yields the text of `expr` piece by piece, left to right.
+    """
+    stack: List[Union[str, Expression]] = [expr]
+    while stack:
+        part = stack.pop()
+        if isinstance(part, str):
+            yield part
+            continue
+        get_parts = SHOW_PARTS.get(type(part))
+        if get_parts is None:
+            raise ValueError("Expression is not valid")
+        stack.extend(reversed(get_parts(part)))
+
+
 def show(expr: Expression) -> str:
-    if isinstance(expr, Eps):
-        return "EPS"
-    elif isinstance(expr, Terminal):
-        return f"\"{expr.value}\""
-    elif isinstance(expr, Name):
-        return f"${expr.value}"
-    elif isinstance(expr, NonTerminal):
-        return f"<{expr.value}>"
-    elif isinstance(expr, Optional):
-        return f"[{show(expr.value)}]"
-    elif isinstance(expr, KleeneStar):
-        return "{" + show(expr.value) + "}"
-    elif isinstance(expr, Seq):
-        return "(" + " ".join(map(show, expr.vals)) + ")"
-    elif isinstance(expr, Alt):
-        return "(" + " | ".join(map(show, expr.vals)) + ")"
-    else:
-        raise ValueError("Expression is not valid")
+    return "".join(show_fragments(expr))
+
+
+def write_fragments(fragments: Iterable[str], output: TextIO):
+    """
+    Writes `fragments` to `output` in chunks of about `WRITE_CHUNK` characters.
+    """
+    chunk: List[str] = []
+    size = 0
+    for fragment in fragments:
+        chunk.append(fragment)
+        size += len(fragment)
+        if size >= WRITE_CHUNK:
+            output.write("".join(chunk))
+            chunk.clear()
+            size = 0
+    output.write("".join(chunk))
 
 
 def make_seq(lhs : Expression, rhs : Expression) -> Seq:
     if isinstance(lhs, Seq):
-        return Seq(lhs.vals + [rhs])
+        return Seq(lhs.vals + (rhs,))
     return Seq([lhs, rhs])
 
 def make_alt(lhs : Expression, rhs : Expression) -> Alt:
     if isinstance(lhs, Alt):
-        return Alt(lhs.vals + [rhs])
+        return Alt(lhs.vals + (rhs,))
     return Alt([lhs, rhs])
 
+# Linear-time equivalents of `reduce(make_seq, exprs)` and `reduce(make_alt, exprs)`:
+# folding one element at a time copies the accumulated children on every step
+
+def fold_seq(exprs : List[Expression]) -> Expression:
+    if len(exprs) == 1:
+        return exprs[0]
+    head = exprs[0].vals if isinstance(exprs[0], Seq) else (exprs[0],)
+    return Seq(head + tuple(exprs[1:]))
+
+def fold_alt(exprs : List[Expression]) -> Expression:
+    if len(exprs) == 1:
+        return exprs[0]
+    head = exprs[0].vals if isinstance(exprs[0], Alt) else (exprs[0],)
+    return Alt(head + tuple(exprs[1:]))
+
 def collect_non_terminals(expr : Expression) -> Set[str]:
-    if isinstance(expr, Eps) or isinstance(expr, Terminal) or isinstance(expr, Name):
-        return set()
-    elif isinstance(expr, NonTerminal):
-        return {expr.value}
-    elif isinstance(expr, Optional) or isinstance(expr, KleeneStar):
-        return collect_non_terminals(expr.value)
-    elif isinstance(expr, Seq) or isinstance(expr, Alt):
-        return reduce(lambda lhs, rhs: lhs | rhs, map(collect_non_terminals, expr.vals))
-    else:
-        raise ValueError("Expression is not valid")
+    return {node.value for node in walk(expr) if type(node) is NonTerminal}
 
 def collect_terminals(expr : Expression) -> Set[str]:
-    if isinstance(expr, Eps) or isinstance(expr, NonTerminal) or isinstance(expr, Name):
-        return set()
-    elif isinstance(expr, Terminal):
-        return {expr.value}
-    elif isinstance(expr, Optional) or isinstance(expr, KleeneStar):
-        return collect_non_terminals(expr.value)
-    elif isinstance(expr, Seq) or isinstance(expr, Alt):
-        return reduce(lambda lhs, rhs: lhs | rhs, map(collect_non_terminals, expr.vals))
-    else:
-        raise ValueError("Expression is not valid")
+    return {node.value for node in walk(expr) if type(node) is Terminal}
     
 # Rule class
 
@@ -139,30 +372,41 @@ class EBNF:
 def make_grammar(start: NonTerminal, rules : List[Rule], bindings : List[NameBinding]) -> EBNF:
     name_bindings = collect_macros(bindings)
 
-    terminals = (reduce(lambda lhs, rhs: lhs | rhs,
-                       map(lambda rule: collect_terminals(rule.definition),
-                           rules))
-                | set(map(lambda terminal: terminal.value, name_bindings.values())))
+    terminals = (set().union(*(collect_terminals(rule.definition) for rule in rules))
+                 | {terminal.value for terminal in name_bindings.values()})
 
-    non_terminals = (reduce(lambda lhs, rhs: lhs | rhs,
-                            map(lambda rule: collect_non_terminals(rule.definition),
-                                rules))
-                    | set(map(lambda rule: rule.defined.value, rules)))
+    non_terminals = (set().union(*(collect_non_terminals(rule.definition) for rule in rules))
+                     | {rule.defined.value for rule in rules})
     return EBNF(start, terminals, non_terminals, rules, name_bindings)
 
 
+def grammar_fragments(grammar : EBNF) -> Iterator[str]:
+    yield from ("start:\n  ", *show_fragments(grammar.start), ";\nnames:\n")
+    for name, value in grammar.name_bindings.items():
+        yield from (f" ${name} := ", *show_fragments(value), ";\n")
+    yield "rules:\n"
+    for rule in grammar.rules:
+        yield from ("  ", *show_fragments(rule.defined), " := ", *show_fragments(rule.definition), ";\n")
+
+
 def show_grammar(grammar : EBNF) -> str:
-    nl = "\n"
-    bindings = "".join([f" ${name} := {show(grammar.name_bindings[name])};{nl}" for name in grammar.name_bindings])
-   # bindings = "".join(map(lambda binding: f"  ${binding} := {show(grammar.name_bindings[binding]}{nl}" , grammar.name_bindings))
-    rules = "".join(map(lambda rule: f"  {show(rule.defined)} := {show(rule.definition)};{nl}" , grammar.rules))
-    return f"start:{nl}  {show(grammar.start)};{nl}names:{nl}{bindings}rules:{nl}{rules}"
+    return "".join(grammar_fragments(grammar))
+
+
+def print_grammar(grammar : EBNF, output : TextIO):
+    """
+    Writes the grammar to `output` as `print(show_grammar(grammar), file=output)`
+    does, without building its text first.
+    """
+    write_fragments(grammar_fragments(grammar), output)
+    output.write("\n")
+
 
 def main():
    rule1 = Rule(NonTerminal("ABOBA"), Alt([Seq([KleeneStar(Terminal("a")), Optional(Name("bbb"))]), NonTerminal("c")]))
    rule2 = rule2 = Rule(NonTerminal("S"), Alt([Seq([Terminal("("), NonTerminal("S"), Terminal(")"), NonTerminal("S")]), EPS]))
    grammar = make_grammar(NonTerminal("S"), [rule1, rule2], [])
-   print(show_grammar(grammar))
+   print_grammar(grammar, sys.stdout)
 
 
 if __name__ == "__main__":
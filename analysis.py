@@ -0,0 +1,192 @@
+import argparse
+import sys
+from collections import deque
+from typing import List, Iterator, Tuple
+
+import ebnf_parser
+from compiled_grammar import CompiledGrammar, compile_grammar
+from converter import Converter
+from EBNF import show
+
+# Nullable, FIRST and FOLLOW sets of a compiled grammar.
+#
+# Sets of terminals are bitsets stored in Python integers: bit `t` stands
+# for terminal `t` and bit `terminal_count` for the end of input. Sets are
+# computed by propagating values along dependency edges with a worklist, so
+# a symbol is only re-evaluated when something it depends on has changed.
+
+END = "$end"
+
+
+def compute_nullable(grammar: CompiledGrammar) -> bytearray:
+    """
+    Returns a flag for every symbol telling whether it derives the empty
+    string. Every production keeps the count of its symbols not yet known
+    to be nullable, so each occurrence of a symbol is visited once.
+    """
+    nullable = bytearray(grammar.symbol_count)
+    remaining = [0] * grammar.production_count
+    occurrences: List[List[int]] = [[] for _ in range(grammar.symbol_count)]
+    worklist = []
+    for production in range(grammar.production_count):
+        begin, end = grammar.rhs_offsets[production], grammar.rhs_offsets[production + 1]
+        if any(grammar.is_terminal(symbol) for symbol in grammar.rhs[begin:end]):
+            remaining[production] = -1
+            continue
+        remaining[production] = end - begin
+        for symbol in grammar.rhs[begin:end]:
+            occurrences[symbol].append(production)
+        if begin == end and not nullable[grammar.lhs[production]]:
+            nullable[grammar.lhs[production]] = 1
+            worklist.append(grammar.lhs[production])
+
+    while worklist:
+        symbol = worklist.pop()
+        for production in occurrences[symbol]:
+            remaining[production] -= 1
+            lhs = grammar.lhs[production]
+            if remaining[production] == 0 and not nullable[lhs]:
+                nullable[lhs] = 1
+                worklist.append(lhs)
+    return nullable
+
+
+def propagate(values: List[int], edges: List[List[int]]):
+    """
+    Makes `values[v]` include `values[u]` for every edge `u -> v`, in place.
+    """
+    queued = bytearray(len(values))
+    worklist = deque(node for node in range(len(values)) if values[node] and edges[node])
+    for node in worklist:
+        queued[node] = 1
+    while worklist:
+        node = worklist.popleft()
+        queued[node] = 0
+        value = values[node]
+        for dependent in edges[node]:
+            updated = values[dependent] | value
+            if updated != values[dependent]:
+                values[dependent] = updated
+                if not queued[dependent]:
+                    queued[dependent] = 1
+                    worklist.append(dependent)
+
+
+def compute_first(grammar: CompiledGrammar, nullable: bytearray) -> List[int]:
+    first = [1 << symbol if grammar.is_terminal(symbol) else 0
+             for symbol in range(grammar.symbol_count)]
+    # FIRST(X) is included in FIRST(A) for every X in a nullable prefix
+    # of a production of A
+    edges: List[List[int]] = [[] for _ in range(grammar.symbol_count)]
+    for production in range(grammar.production_count):
+        lhs = grammar.lhs[production]
+        for symbol in grammar.production_rhs(production):
+            if symbol != lhs:
+                edges[symbol].append(lhs)
+            if not nullable[symbol]:
+                break
+    propagate(first, edges)
+    return first
+
+
+def compute_follow(grammar: CompiledGrammar, nullable: bytearray, first: List[int]) -> List[int]:
+    follow = [0] * grammar.symbol_count
+    follow[grammar.start] = 1 << grammar.terminal_count
+    # FOLLOW(A) is included in FOLLOW(B) for every production A := ... B beta
+    # with a nullable beta
+    edges: List[List[int]] = [[] for _ in range(grammar.symbol_count)]
+    for production in range(grammar.production_count):
+        lhs = grammar.lhs[production]
+        suffix_first = 0
+        suffix_nullable = True
+        for symbol in reversed(grammar.production_rhs(production)):
+            if not grammar.is_terminal(symbol):
+                follow[symbol] |= suffix_first
+                if suffix_nullable and symbol != lhs:
+                    edges[lhs].append(symbol)
+            if nullable[symbol]:
+                suffix_first |= first[symbol]
+            else:
+                suffix_first = first[symbol]
+                suffix_nullable = False
+    propagate(follow, edges)
+    return follow
+
+
+class GrammarAnalysis:
+    """
+    Nullable flags and FIRST and FOLLOW sets of all symbols of a grammar,
+    indexed by symbol id.
+    """
+
+    grammar: CompiledGrammar
+    nullable: bytearray
+    first: List[int]
+    follow: List[int]
+
+    def __init__(self, grammar: CompiledGrammar):
+        self.grammar = grammar
+        self.nullable = compute_nullable(grammar)
+        self.first = compute_first(grammar, self.nullable)
+        self.follow = compute_follow(grammar, self.nullable, self.first)
+
+    def first_of_sequence(self, symbols) -> Tuple[int, bool]:
+        """
+        Returns FIRST of a sequence of symbols and whether it is nullable.
+        """
+        result = 0
+        for symbol in symbols:
+            result |= self.first[symbol]
+            if not self.nullable[symbol]:
+                return result, False
+        return result, True
+
+    def terminals(self, bits: int) -> Iterator[int]:
+        """
+        Yields ids of the terminals in a bitset, `terminal_count` standing
+        for the end of input.
+        """
+        while bits:
+            low = bits & -bits
+            yield low.bit_length() - 1
+            bits ^= low
+
+    def terminal_names(self, bits: int) -> List[str]:
+        return [END if terminal == self.grammar.terminal_count
+                else show(self.grammar.symbol_expr(terminal))
+                for terminal in self.terminals(bits)]
+
+
+def show_analysis(analysis: GrammarAnalysis) -> str:
+    nl = "\n"
+    grammar = analysis.grammar
+    non_terminals = range(grammar.terminal_count, grammar.symbol_count)
+    names = [show(grammar.symbol_expr(symbol)) for symbol in range(grammar.symbol_count)]
+    nullable = "".join(f"  {names[symbol]};{nl}" for symbol in non_terminals
+                       if analysis.nullable[symbol])
+    first = "".join(f"  {names[symbol]} : {' '.join(analysis.terminal_names(analysis.first[symbol]))};{nl}"
+                    for symbol in non_terminals)
+    follow = "".join(f"  {names[symbol]} : {' '.join(analysis.terminal_names(analysis.follow[symbol]))};{nl}"
+                     for symbol in non_terminals)
+    return f"nullable:{nl}{nullable}first:{nl}{first}follow:{nl}{follow}"
+
+
+def main():
+    p = argparse.ArgumentParser("Computes nullable, FIRST and FOLLOW sets of a grammar converted to classic form")
+    p.add_argument('input', nargs=1, type=str)
+    p.add_argument('output', nargs='?')
+    args = p.parse_args()
+    if not args.output:
+        args.output = args.input[0] + ".out"
+    ebnf, diagnostics = ebnf_parser.parse_ebnf(args.input[0])
+    diagnostics.write(sys.stderr)
+    with open(args.output, "w") as processed_grammar:
+        if ebnf is None:
+            print("Grammar is incorrect, cannot parse", file=processed_grammar)
+        else:
+            compiled = compile_grammar(Converter(ebnf, False).convert())
+            print(show_analysis(GrammarAnalysis(compiled)), file=processed_grammar)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,422 @@
+import argparse
+import io
+import os
+import random
+import time
+from typing import Callable, List, Tuple
+
+from EBNF import *
+from analysis import GrammarAnalysis
+from compiled_grammar import compile_grammar
+from ll1 import build_table
+from cnf import CYKRecognizer, to_cnf
+from codegen import EBNFInterpreter, generate_parser, load_parser
+from converter import Converter
+from earley import EarleyParser
+from grammar_image import GrammarImage, write_grammar
+from minimize import minimize
+from packrat import MemoStats, PackratParser
+from transform import to_predictive
+from ebnf_parser import GrammarParser
+
+TESTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tests")
+
+# Benchmarks on generated grammars. Every benchmark runs on inputs of
+# growing size and prints the time per element: a flat column means the
+# measured operation scales linearly.
+
+SIZES = [2000, 4000, 8000, 16000, 32000]
+
+
+def long_sequence_grammar(size: int) -> str:
+    symbols = " ".join(f"\"t{i}\" <A>" for i in range(size // 2))
+    return f"start:\n  <S>;\nnames:\nrules:\n  <S> := {symbols};\n  <A> := \"a\";\n"
+
+
+def many_alternatives_grammar(size: int) -> str:
+    alternatives = " | ".join(f"\"t{i}\" <A>" for i in range(size))
+    return f"start:\n  <S>;\nnames:\nrules:\n  <S> := {alternatives};\n  <A> := \"a\";\n"
+
+
+def deep_nesting_grammar(size: int) -> str:
+    nested = "(" * (size // 2) + "\"a\" <S>" + ")" * (size // 2)
+    optional = "[" * (size // 2) + "\"b\"" + "]" * (size // 2)
+    return f"start:\n  <S>;\nnames:\nrules:\n  <S> := {nested} | {optional};\n"
+
+
+def shared_subexpressions_grammar(size: int) -> str:
+    # Every rule repeats the same optional part and repetition
+    rules = "".join(f"  <N{i}> := \"t{i}\" [\"-\"] <Digit> {{<Digit>}};\n" for i in range(size))
+    return (f"start:\n  <N0>;\nnames:\nrules:\n{rules}"
+            f"  <Digit> := \"0\" | \"1\";\n")
+
+
+def chain_grammar(size: int) -> EBNF:
+    # Built directly in classic form: converting it would dominate the timing
+    def a(i: int) -> NonTerminal:
+        return NonTerminal(f"A{i}")
+    rules = [Rule(a(i), fold_alt([Seq([a(i + 1), Terminal(f"t{i % 256}")]),
+                                  Seq([a(i * 7 % size), a(i + 1)]), EPS]))
+             for i in range(size)]
+    rules.append(Rule(a(size), Terminal("end")))
+    return make_grammar(a(0), rules, [])
+
+
+def equivalent_grammar(size: int) -> EBNF:
+    # Two interleaved cycles of non-terminals all deriving "x"* "y", and
+    # one cycle differing from them at its last non-terminal
+    def a(i: int) -> NonTerminal:
+        return NonTerminal(f"A{i}")
+
+    def b(i: int) -> NonTerminal:
+        return NonTerminal(f"B{i}")
+    half = size // 2
+    rules = [Rule(a(i), Alt([Seq([Terminal("x"), b((i + 1) % half)]), Terminal("y")])) for i in range(half)]
+    rules += [Rule(b(i), Alt([Seq([Terminal("x"), a((i + 1) % half)]), Terminal("y")])) for i in range(half - 1)]
+    rules.append(Rule(b(half - 1), Alt([Seq([Terminal("x"), a(0)]), Terminal("z")])))
+    rules.append(Rule(NonTerminal("S"), fold_alt([Seq([a(i), b(i)]) for i in range(half)])))
+    return make_grammar(NonTerminal("S"), rules, [])
+
+
+def unit_cycles_grammar(size: int) -> EBNF:
+    # Pairs of non-terminals deriving each other by chain rules, each pair
+    # with an unproductive non-terminal used next to it
+    def a(i: int) -> NonTerminal:
+        return NonTerminal(f"A{i}")
+
+    def b(i: int) -> NonTerminal:
+        return NonTerminal(f"B{i}")
+
+    def c(i: int) -> NonTerminal:
+        return NonTerminal(f"C{i}")
+    rules = []
+    for i in range(size):
+        rules.append(Rule(a(i), Alt([b(i), Seq([Terminal("a"), a(i + 1)])])))
+        rules.append(Rule(b(i), Alt([a(i), Terminal("b"), Seq([c(i), b(i)])])))
+        rules.append(Rule(c(i), Seq([c(i), Terminal("c")])))
+    rules.append(Rule(a(size), Terminal("end")))
+    return make_grammar(a(0), rules, [])
+
+
+def left_recursive_grammar(size: int) -> EBNF:
+    # Pairs of non-terminals, left-recursive directly and through each
+    # other, with alternatives sharing prefixes
+    def a(i: int) -> NonTerminal:
+        return NonTerminal(f"A{i}")
+
+    def b(i: int) -> NonTerminal:
+        return NonTerminal(f"B{i}")
+    rules = []
+    for i in range(size):
+        rules.append(Rule(a(i), fold_alt([Seq([a(i), Terminal("x"), a(i + 1)]), Seq([b(i), Terminal("y")]),
+                                          Seq([b(i), Terminal("y"), Terminal("w")])])))
+        rules.append(Rule(b(i), Alt([Seq([a(i), Terminal("z")]), Terminal("t")])))
+    rules.append(Rule(a(size), Terminal("end")))
+    return make_grammar(a(0), rules, [])
+
+
+def expression_grammar() -> EBNF:
+    e, t, f = NonTerminal("E"), NonTerminal("T"), NonTerminal("F")
+    return make_grammar(e, [
+        Rule(e, Alt([Seq([e, Terminal("+"), t]), t])),
+        Rule(t, Alt([Seq([t, Terminal("*"), f]), f])),
+        Rule(f, Alt([Seq([Terminal("("), e, Terminal(")")]), Terminal("n")])),
+    ], [])
+
+
+def statements_grammar() -> EBNF:
+    # Assignments and expressions without left recursion, alternatives are
+    # tried last first: an expression statement is parsed again after
+    # failing to be an assignment
+    p, s, e, t, f = (NonTerminal(name) for name in "PSETF")
+    return make_grammar(p, [
+        Rule(p, KleeneStar(s)),
+        Rule(s, Alt([Seq([e, Terminal(";")]), Seq([e, Terminal("="), e, Terminal(";")])])),
+        Rule(e, Seq([t, KleeneStar(Seq([Terminal("+"), t]))])),
+        Rule(t, Seq([f, KleeneStar(Seq([Terminal("*"), f]))])),
+        Rule(f, Alt([Terminal("n"), Seq([Terminal("("), e, Terminal(")")])])),
+    ], [])
+
+
+def statements_words(size: int) -> List[str]:
+    statements = [["n", "=", "n", "+", "n", ";"], ["n", "*", "(", "n", "+", "n", ")", ";"]]
+    words = []
+    count = 0
+    while len(words) < size:
+        words += statements[count % 2]
+        count += 1
+    return words
+
+
+def expression_words(size: int) -> List[str]:
+    # "n + n * ( n + n * ( ... n ) )", about `size` words long
+    depth = size // 6
+    return ["n", "+", "n", "*", "("] * depth + ["n"] + [")"] * depth
+
+
+def expression_corpus(size: int, length: int = 24) -> List[List[str]]:
+    # Random words over the expression alphabet, a part of them valid
+    generator = random.Random(size)
+    corpus = [expression_words(length) for _ in range(size // 4)]
+    corpus += [[generator.choice("n+*()") for _ in range(length)] for _ in range(size - len(corpus))]
+    return corpus
+
+
+def measure(action: Callable[[], Any]) -> float:
+    begin = time.perf_counter()
+    action()
+    return time.perf_counter() - begin
+
+
+def report(title: str, sizes: List[int], timings: List[float]):
+    print(title)
+    for size, elapsed in zip(sizes, timings):
+        print(f"  {size:>8} elements: {elapsed * 1000:10.2f} ms, "
+              f"{elapsed / size * 1e6:8.3f} us per element")
+
+
+def bench_construction(sizes: List[int]):
+    parser = GrammarParser()
+    parse_timings = []
+    convert_timings = []
+    for size in sizes:
+        text = long_sequence_grammar(size)
+        parse_timings.append(measure(lambda: parser.parse(text)))
+        grammar = parser.parse(text)
+        convert_timings.append(measure(lambda: Converter(grammar, False).convert()))
+    report("Parsing a rule with a long sequence", sizes, parse_timings)
+    report("Converting a rule with a long sequence", sizes, convert_timings)
+
+
+def bench_alternatives(sizes: List[int]):
+    parser = GrammarParser()
+    parse_timings = []
+    convert_timings = []
+    for size in sizes:
+        text = many_alternatives_grammar(size)
+        parse_timings.append(measure(lambda: parser.parse(text)))
+        grammar = parser.parse(text)
+        convert_timings.append(measure(lambda: Converter(grammar, True).convert()))
+    report("Parsing a rule with many alternatives", sizes, parse_timings)
+    report("Converting a rule with many alternatives (readable names)", sizes, convert_timings)
+
+
+def bench_nesting(sizes: List[int]):
+    parser = GrammarParser()
+    parse_timings = []
+    convert_timings = []
+    for size in sizes:
+        text = deep_nesting_grammar(size)
+        parse_timings.append(measure(lambda: parser.parse(text)))
+        grammar = parser.parse(text)
+        convert_timings.append(measure(lambda: Converter(grammar, False).convert()))
+    report("Parsing a rule with deeply nested brackets", sizes, parse_timings)
+    report("Converting a rule with deeply nested brackets", sizes, convert_timings)
+
+
+def bench_sharing(sizes: List[int]):
+    parser = GrammarParser()
+    timings = []
+    for size in sizes:
+        grammar = parser.parse(shared_subexpressions_grammar(size))
+        timings.append(measure(lambda: Converter(grammar, False).convert()))
+        converter = Converter(parser.parse(shared_subexpressions_grammar(size)), False)
+        converter.convert()
+        print(f"  {size:>8} rules: {len(converter.rules) - size - 1} helper rules created")
+    report("Converting rules sharing subexpressions", sizes, timings)
+
+
+def bench_parallel(sizes: List[int]):
+    # Converting in parallel must give the same grammar as sequentially
+    parser = GrammarParser()
+    modes = [("sequentially", 1), ("on 2 processes", 2), ("on a process per CPU", None)]
+    timings = {title: [] for title, _ in modes}
+    for size in sizes:
+        grammar = parser.parse(shared_subexpressions_grammar(size))
+        results = []
+        for title, jobs in modes:
+            timings[title].append(measure(lambda: results.append(Converter(grammar, False, jobs).convert())))
+        if any(result != results[0] for result in results):
+            raise AssertionError(f"parallel conversion of {size} rules differs from the sequential one")
+    for title, _ in modes:
+        report(f"Converting many rules {title}", sizes, timings[title])
+    for title, _ in modes[1:]:
+        speedups = ", ".join(f"{sequential / parallel:.2f}"
+                             for sequential, parallel in zip(timings[modes[0][0]], timings[title]))
+        print(f"Speedup {title}: {speedups}")
+
+
+def bench_chains(sizes: List[int]):
+    timings = []
+    for size in sizes:
+        grammar = unit_cycles_grammar(size)
+        timings.append(measure(lambda: Converter(grammar, False).convert()))
+    report("Converting grammars with cycles of chain rules", sizes, timings)
+
+
+def bench_minimize(sizes: List[int]):
+    timings = []
+    for size in sizes:
+        grammar = equivalent_grammar(size)
+        timings.append(measure(lambda: minimize(grammar)))
+        print(f"  {size:>8} non-terminals: {minimize(grammar)[1]}")
+    report("Minimizing grammars with equivalent non-terminals", sizes, timings)
+
+
+def bench_transform(sizes: List[int]):
+    timings = []
+    for size in sizes:
+        grammar = left_recursive_grammar(size)
+        timings.append(measure(lambda: to_predictive(grammar)))
+    report("Removing left recursion and left factoring", sizes, timings)
+
+
+def bench_image(sizes: List[int]):
+    parser = GrammarParser()
+    parse_timings = []
+    load_timings = []
+    for size in sizes:
+        grammar = chain_grammar(size)
+        text = show_grammar(grammar)
+        image = io.BytesIO()
+        write_grammar(grammar, image)
+        parse_timings.append(measure(lambda: parser.parse(text)))
+        load_timings.append(measure(lambda: GrammarImage(image.getvalue()).to_grammar()))
+        print(f"  {size:>8} rules: {len(text)} bytes of text, {len(image.getvalue())} bytes of image")
+    report("Parsing grammars in classic form printed as text", sizes, parse_timings)
+    report("Loading grammars in classic form from binary images", sizes, load_timings)
+
+
+def bench_printing(sizes: List[int]):
+    parser = GrammarParser()
+    rules_timings = []
+    nesting_timings = []
+    for size in sizes:
+        grammar = chain_grammar(size)
+        rules_timings.append(measure(lambda: print_grammar(grammar, io.StringIO())))
+        nested = parser.parse(deep_nesting_grammar(size))
+        nesting_timings.append(measure(lambda: print_grammar(nested, io.StringIO())))
+    report("Printing grammars with many rules", sizes, rules_timings)
+    report("Printing a rule with deeply nested brackets", sizes, nesting_timings)
+
+
+def bench_analysis(sizes: List[int]):
+    timings = []
+    for size in sizes:
+        compiled = compile_grammar(chain_grammar(size))
+        timings.append(measure(lambda: GrammarAnalysis(compiled)))
+    report("Computing nullable, FIRST and FOLLOW sets of chained non-terminals", sizes, timings)
+
+
+def bench_ll1(sizes: List[int]):
+    timings = []
+    for size in sizes:
+        analysis = GrammarAnalysis(compile_grammar(chain_grammar(size)))
+        timings.append(measure(lambda: build_table(analysis)))
+    report("Building LL(1) table of chained non-terminals", sizes, timings)
+
+
+def bench_earley(sizes: List[int]):
+    parser = EarleyParser.from_grammar(expression_grammar())
+    parse_timings = []
+    forest_timings = []
+    for size in sizes:
+        words = expression_words(size)
+        tokens = parser.tokens(words)
+        parse_timings.append(measure(lambda: parser.parse(tokens)))
+        chart = parser.parse(tokens)
+        assert chart.accepted
+        forest_timings.append(measure(lambda: chart.forest()))
+    report("Earley parsing of expressions", sizes, parse_timings)
+    report("Building parse forest of expressions", sizes, forest_timings)
+
+
+def bench_cyk(sizes: List[int]):
+    recognizer = CYKRecognizer(to_cnf(expression_grammar()))
+    timings = []
+    for size in sizes:
+        corpus = expression_corpus(size)
+        timings.append(measure(lambda: [recognizer.recognize(words) for words in corpus]))
+    report("CYK membership testing of a corpus of expressions", sizes, timings)
+
+
+def bench_packrat(sizes: List[int]):
+    grammar = statements_grammar()
+    modes = [("unbounded memo", {}), ("memo window of 16 tokens", {"window": 16}),
+             ("memoizing only <E>", {"hot": ["E"]})]
+    for title, options in modes:
+        parser = PackratParser(grammar, **options)
+        timings = []
+        for size in sizes:
+            words = statements_words(size)
+            timings.append(measure(lambda: parser.recognize(words)))
+        report(f"Packrat parsing of statements, {title}", sizes, timings)
+        stats = MemoStats()
+        assert parser.recognize(statements_words(sizes[-1]), stats)
+        print(f"  {stats}")
+
+
+def test_grammars() -> List[Tuple[str, EBNF, List[List[str]]]]:
+    # Test grammars having sample words, with their words
+    parser = GrammarParser()
+    with open(os.path.join(TESTS_DIR, "tests.txt")) as names:
+        tests = names.read().split()
+    grammars = []
+    for test in tests:
+        words_file = os.path.join(TESTS_DIR, test + ".words")
+        if not os.path.exists(words_file):
+            continue
+        with open(os.path.join(TESTS_DIR, test + ".in")) as grammar_file:
+            grammar = parser.parse(grammar_file.read())
+        with open(words_file) as words:
+            grammars.append((test, grammar, [line.split() for line in words]))
+    return grammars
+
+
+def bench_codegen(sizes: List[int]):
+    for test, grammar, samples in test_grammars():
+        interpreter = EBNFInterpreter(grammar)
+        generated = load_parser(generate_parser(grammar))
+        interpreted_timings = []
+        generated_timings = []
+        for size in sizes:
+            corpus = [samples[i % len(samples)] for i in range(size)]
+            interpreted_timings.append(measure(lambda: [interpreter.recognize(words) for words in corpus]))
+            generated_timings.append(measure(lambda: [generated.recognize(words) for words in corpus]))
+        report(f"Interpreting {test} on a corpus of its sample words", sizes, interpreted_timings)
+        report(f"Generated parser of {test} on a corpus of its sample words", sizes, generated_timings)
+
+
+BENCHMARKS = {
+    "construction": bench_construction,
+    "alternatives": bench_alternatives,
+    "nesting": bench_nesting,
+    "sharing": bench_sharing,
+    "parallel": bench_parallel,
+    "chains": bench_chains,
+    "minimize": bench_minimize,
+    "image": bench_image,
+    "printing": bench_printing,
+    "transform": bench_transform,
+    "analysis": bench_analysis,
+    "ll1": bench_ll1,
+    "earley": bench_earley,
+    "cyk": bench_cyk,
+    "codegen": bench_codegen,
+    "packrat": bench_packrat,
+}
+
+
+def main():
+    p = argparse.ArgumentParser("Runs benchmarks on generated grammars")
+    p.add_argument('benchmarks', nargs='*', help="any of: " + ", ".join(BENCHMARKS))
+    p.add_argument('-s', '--sizes', type=int, nargs='+', default=SIZES)
+    args = p.parse_args()
+    for name in args.benchmarks or BENCHMARKS:
+        if name not in BENCHMARKS:
+            p.error(f"unknown benchmark {name}")
+        BENCHMARKS[name](args.sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+import hashlib
+import io
+import os
+import pickle
+import tempfile
+from functools import lru_cache
+from typing import Any, Callable, TypeVar
+
+from EBNF import Node
+from node_table import NodeTable, NodeTableWriter
+
+# Content-addressed cache of results of parsing and converting grammars.
+#
+# An entry is keyed by a digest of the contents of the grammar file, of
+# the step and the options producing it, and of the tool version: the
+# sources of the modules the results depend on, so that changing any of
+# them invalidates old entries. Entries are pickled; expression nodes are
+# hash-consed, so equal subexpressions are stored once and shared again
+# when loaded. A damaged or unreadable entry counts as missing.
+
+# Modules whose sources make up the tool version
+SOURCES = ("EBNF.py", "diagnostics.py", "tokens.py", "scanner.py", "lexer.py",
+           "ebnf_parser.py", "converter.py", "node_table.py", "cache.py")
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=None)
+def tool_version() -> str:
+    digest = hashlib.sha256()
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for source in SOURCES:
+        with open(os.path.join(directory, source), "rb") as module:
+            digest.update(hashlib.sha256(module.read()).digest())
+    return digest.hexdigest()
+
+
+class NodePickler(pickle.Pickler):
+    """
+    Pickles expression nodes as persistent ids, their indices in `table`
+    """
+
+    def __init__(self, output, table: NodeTableWriter):
+        super().__init__(output, pickle.HIGHEST_PROTOCOL)
+        self.table = table
+
+    def persistent_id(self, obj: Any) -> Any:
+        return self.table.node(obj) if isinstance(obj, Node) else None
+
+
+def dump_entry(value: Any, output):
+    table = NodeTableWriter()
+    pickled = io.BytesIO()
+    NodePickler(pickled, table).dump(value)
+    string_offsets, string_bytes = table.string_table()
+    pickle.dump((string_offsets, string_bytes, bytes(table.kinds), table.node_offsets, table.payload,
+                 pickled.getvalue()), output, pickle.HIGHEST_PROTOCOL)
+
+
+def load_entry(entry) -> Any:
+    *arrays, pickled = pickle.load(entry)
+    unpickler = pickle.Unpickler(io.BytesIO(pickled))
+    unpickler.persistent_load = NodeTable(*arrays).node
+    return unpickler.load()
+
+
+class GrammarCache:
+    """
+    Entries are files named after their keys in `directory`, created when
+    needed; they are written to a temporary file first and moved into
+    place, so concurrent runs never see a partial entry.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, content: bytes, step: str, *options: Any) -> str:
+        digest = hashlib.sha256()
+        digest.update(tool_version().encode())
+        digest.update(repr((step,) + options).encode())
+        digest.update(hashlib.sha256(content).digest())
+        return digest.hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + ".pickle")
+
+    def load(self, key: str) -> Any:
+        try:
+            with open(self.path(key), "rb") as entry:
+                return load_entry(entry)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, IndexError, TypeError,
+                ValueError):
+            return None
+
+    def store(self, key: str, value: Any):
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as entry:
+                dump_entry(value, entry)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def cached(self, key: str, compute: Callable[[], T]) -> T:
+        """
+        Returns the value stored under `key`, computing and storing it when
+        there is none
+        """
+        value = self.load(key)
+        if value is not None:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = compute()
+        self.store(key, value)
+        return value
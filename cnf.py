@@ -0,0 +1,306 @@
+import argparse
+import sys
+from typing import Iterable
+
+import ebnf_parser
+from analysis import compute_nullable
+from compiled_grammar import compile_grammar
+from converter import Converter
+from EBNF import *
+
+# Chomsky normal form of grammars in classic form, and CYK membership
+# testing over it.
+#
+# CYK chart cells are bitsets of non-terminals stored in Python integers:
+# bit `n` stands for the `n`-th non-terminal of the compiled grammar.
+
+Production = Tuple[int, ...]
+
+
+class CNFConverter:
+    """
+    Converts a grammar in classic form (as produced by `Converter.convert`)
+    by the usual sequence of passes: START, TERM, BIN, DEL and UNIT, and
+    drops the symbols that became useless. Helper non-terminals are named
+    after what they derive, primed when the name is taken.
+    """
+
+    def __init__(self, grammar: EBNF):
+        compiled = compile_grammar(grammar)
+        self.terminal_count = compiled.terminal_count
+        # Kept up to date for helper non-terminals as they are created
+        self.nullable = compute_nullable(compiled)
+        self.names: List[str] = list(compiled.symbols)
+        self.used_names = set(compiled.symbols[compiled.terminal_count:])
+        self.start = compiled.start
+        self.productions: Dict[int, Dict[Production, None]] = {
+            non_terminal: {tuple(compiled.production_rhs(production)): None
+                           for production in compiled.productions(non_terminal)}
+            for non_terminal in range(compiled.terminal_count, compiled.symbol_count)}
+
+    def is_terminal(self, symbol: int) -> bool:
+        return symbol < self.terminal_count
+
+    def new_non_terminal(self, name: str, nullable: bool = False) -> int:
+        while name in self.used_names:
+            name += "'"
+        self.used_names.add(name)
+        self.names.append(name)
+        self.nullable.append(nullable)
+        self.productions[len(self.names) - 1] = {}
+        return len(self.names) - 1
+
+    def add_start(self):
+        if any(self.start in rhs for productions in self.productions.values() for rhs in productions):
+            start = self.new_non_terminal(self.names[self.start], self.nullable[self.start])
+            self.productions[start][(self.start,)] = None
+            self.start = start
+
+    def replace_terminals(self):
+        replacements: Dict[int, int] = {}
+        for non_terminal in list(self.productions):
+            productions = self.productions[non_terminal]
+            if all(len(rhs) < 2 for rhs in productions):
+                continue
+            replaced = {}
+            for rhs in productions:
+                if len(rhs) >= 2:
+                    for symbol in rhs:
+                        if self.is_terminal(symbol) and symbol not in replacements:
+                            replacements[symbol] = self.new_non_terminal(self.names[symbol])
+                            self.productions[replacements[symbol]][(symbol,)] = None
+                    rhs = tuple(replacements.get(symbol, symbol) for symbol in rhs)
+                replaced[rhs] = None
+            self.productions[non_terminal] = replaced
+
+    def binarize(self):
+        # Equal suffixes of different productions share their helper
+        suffixes: Dict[Production, int] = {}
+        for non_terminal in list(self.productions):
+            binarized = {}
+            for rhs in self.productions[non_terminal]:
+                if len(rhs) > 2:
+                    rhs = (rhs[0], self.suffix(rhs[1:], suffixes))
+                binarized[rhs] = None
+            self.productions[non_terminal] = binarized
+
+    def suffix(self, rhs: Production, suffixes: Dict[Production, int]) -> int:
+        # Built from the end, so shorter suffixes are created first
+        tail = rhs[-1]
+        for begin in range(len(rhs) - 2, -1, -1):
+            pair = (rhs[begin], tail)
+            key = rhs[begin:]
+            if key not in suffixes:
+                name = "(" + " ".join(self.names[symbol] for symbol in key) + ")"
+                suffixes[key] = self.new_non_terminal(name, self.nullable[rhs[begin]] and self.nullable[tail])
+                self.productions[suffixes[key]][pair] = None
+            tail = suffixes[key]
+        return tail
+
+    def remove_epsilons(self):
+        nullable = self.nullable
+        for non_terminal, productions in self.productions.items():
+            expanded = {}
+            for rhs in productions:
+                if len(rhs) == 2:
+                    if nullable[rhs[0]]:
+                        expanded[rhs[1:]] = None
+                    if nullable[rhs[1]]:
+                        expanded[rhs[:1]] = None
+                if rhs:
+                    expanded[rhs] = None
+            self.productions[non_terminal] = expanded
+        if nullable[self.start]:
+            self.productions[self.start][()] = None
+
+    def remove_units(self):
+        units = {non_terminal: [rhs[0] for rhs in productions
+                                if len(rhs) == 1 and not self.is_terminal(rhs[0])]
+                 for non_terminal, productions in self.productions.items()}
+        replaced = {}
+        for non_terminal in self.productions:
+            reached = [non_terminal]
+            seen = {non_terminal}
+            for current in reached:
+                for unit in units[current]:
+                    if unit not in seen:
+                        seen.add(unit)
+                        reached.append(unit)
+            replaced[non_terminal] = {rhs: None for current in reached for rhs in self.productions[current]
+                                      if len(rhs) != 1 or self.is_terminal(rhs[0])}
+        self.productions = replaced
+
+    def remove_useless(self):
+        # Every production counts its symbols not yet known to be productive
+        productive = bytearray(len(self.names))
+        remaining: Dict[Tuple[int, Production], int] = {}
+        occurrences: Dict[int, List[Tuple[int, Production]]] = {}
+        worklist = list(range(self.terminal_count))
+        for terminal in worklist:
+            productive[terminal] = 1
+        for non_terminal, productions in self.productions.items():
+            for rhs in productions:
+                remaining[non_terminal, rhs] = len(rhs)
+                for symbol in rhs:
+                    occurrences.setdefault(symbol, []).append((non_terminal, rhs))
+                if not rhs and not productive[non_terminal]:
+                    productive[non_terminal] = 1
+                    worklist.append(non_terminal)
+        while worklist:
+            for production in occurrences.get(worklist.pop(), ()):
+                remaining[production] -= 1
+                if remaining[production] == 0 and not productive[production[0]]:
+                    productive[production[0]] = 1
+                    worklist.append(production[0])
+        reachable = [self.start] if productive[self.start] else []
+        seen = set(reachable)
+        for non_terminal in reachable:
+            for rhs in self.productions[non_terminal]:
+                if all(productive[symbol] for symbol in rhs):
+                    for symbol in rhs:
+                        if not self.is_terminal(symbol) and symbol not in seen:
+                            seen.add(symbol)
+                            reachable.append(symbol)
+        self.productions = {non_terminal: {rhs: None for rhs in productions
+                                           if all(productive[symbol] for symbol in rhs)}
+                            for non_terminal, productions in self.productions.items()
+                            if non_terminal in seen}
+
+    def symbol_expr(self, symbol: int) -> Union[Terminal, NonTerminal]:
+        if self.is_terminal(symbol):
+            return Terminal(self.names[symbol])
+        return NonTerminal(self.names[symbol])
+
+    def to_grammar(self) -> EBNF:
+        order = sorted(self.productions, key=lambda non_terminal: non_terminal != self.start)
+        rules = [Rule(NonTerminal(self.names[non_terminal]),
+                      fold_alt([fold_seq([self.symbol_expr(symbol) for symbol in rhs]) if rhs else EPS
+                                for rhs in self.productions[non_terminal]]))
+                 for non_terminal in order if self.productions[non_terminal]]
+        return make_grammar(NonTerminal(self.names[self.start]), rules, [])
+
+    def convert(self) -> EBNF:
+        self.add_start()
+        self.replace_terminals()
+        self.binarize()
+        self.remove_epsilons()
+        self.remove_units()
+        self.remove_useless()
+        return self.to_grammar()
+
+
+def to_cnf(grammar: EBNF) -> EBNF:
+    return CNFConverter(grammar).convert()
+
+
+class CYKRecognizer:
+    """
+    Membership testing with a grammar in Chomsky normal form. Combining two
+    cells looks up, for every non-terminal `B` of the left cell, the
+    non-terminals `C` of the right cell that follow `B` in some production
+    `A := B C`; results are cached, as the same pairs of cells recur.
+    """
+
+    CACHE_LIMIT = 1 << 16
+
+    def __init__(self, cnf: EBNF):
+        compiled = compile_grammar(cnf)
+        self.grammar = compiled
+        self.terminal_ids = {compiled.symbols[terminal]: terminal for terminal in range(compiled.terminal_count)}
+        offset = compiled.terminal_count
+        self.terminal_bits = [0] * compiled.terminal_count
+        # right_mask[B] has the bits of C in productions `A := B C`,
+        # pairs[B][C] the bits of their left-hand sides A
+        self.right_mask = [0] * compiled.non_terminal_count
+        self.pairs: List[Dict[int, int]] = [{} for _ in range(compiled.non_terminal_count)]
+        self.accepts_empty = False
+        for production in range(compiled.production_count):
+            lhs_bit = 1 << (compiled.lhs[production] - offset)
+            rhs = compiled.production_rhs(production)
+            if len(rhs) == 1 and compiled.is_terminal(rhs[0]):
+                self.terminal_bits[rhs[0]] |= lhs_bit
+            elif len(rhs) == 2 and not compiled.is_terminal(rhs[0]) and not compiled.is_terminal(rhs[1]):
+                left, right = rhs[0] - offset, rhs[1] - offset
+                self.right_mask[left] |= 1 << right
+                self.pairs[left][right] = self.pairs[left].get(right, 0) | lhs_bit
+            elif not rhs and compiled.lhs[production] == compiled.start:
+                self.accepts_empty = True
+            else:
+                raise ValueError("Grammar is not in Chomsky normal form")
+        self.start_bit = 1 << (compiled.start - offset)
+        self.combinations: Dict[Tuple[int, int], int] = {}
+
+    def combine(self, left: int, right: int) -> int:
+        key = (left, right)
+        result = self.combinations.get(key)
+        if result is not None:
+            return result
+        result = 0
+        bits = left
+        while bits:
+            low = bits & -bits
+            bits ^= low
+            b = low.bit_length() - 1
+            matches = right & self.right_mask[b]
+            while matches:
+                low = matches & -matches
+                matches ^= low
+                result |= self.pairs[b][low.bit_length() - 1]
+        if len(self.combinations) >= self.CACHE_LIMIT:
+            self.combinations.clear()
+        self.combinations[key] = result
+        return result
+
+    def recognize(self, words: Iterable[str]) -> bool:
+        tokens = [self.terminal_ids.get(word) for word in words]
+        if not tokens:
+            return self.accepts_empty
+        if None in tokens:
+            return False
+        # chart[length - 1][begin] holds the non-terminals deriving the
+        # `length` words from `begin`
+        chart = [[self.terminal_bits[token] for token in tokens]]
+        size = len(tokens)
+        for length in range(2, size + 1):
+            row = []
+            for begin in range(size - length + 1):
+                bits = 0
+                for split in range(1, length):
+                    left = chart[split - 1][begin]
+                    if left:
+                        right = chart[length - split - 1][begin + split]
+                        if right:
+                            bits |= self.combine(left, right)
+                row.append(bits)
+            chart.append(row)
+        return bool(chart[-1][0] & self.start_bit)
+
+
+def main():
+    p = argparse.ArgumentParser("Converts CF formal grammar from EBNF to Chomsky normal form")
+    p.add_argument('input', nargs=1, type=str)
+    p.add_argument('output', nargs='?')
+    p.add_argument("-w", "--words", metavar="FILE",
+                   help="recognize every line of a file as a sequence of space separated terminals")
+    args = p.parse_args()
+    if not args.output:
+        args.output = args.input[0] + ".out"
+    ebnf, diagnostics = ebnf_parser.parse_ebnf(args.input[0])
+    diagnostics.write(sys.stderr)
+    with open(args.output, "w") as processed_grammar:
+        if ebnf is None:
+            print("Grammar is incorrect, cannot parse", file=processed_grammar)
+            return
+        cnf = to_cnf(Converter(ebnf, False).convert())
+        if not args.words:
+            print_grammar(cnf, processed_grammar)
+            return
+        recognizer = CYKRecognizer(cnf)
+        with open(args.words) as words:
+            for line in words:
+                result = "accepted" if recognizer.recognize(line.split()) else "rejected"
+                print(f"{result}: {line.strip()}", file=processed_grammar)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,581 @@
+import argparse
+import importlib.util
+import os
+import re
+import sys
+from importlib.machinery import SourceFileLoader
+from types import ModuleType
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Set, Tuple
+
+import ebnf_parser
+from EBNF import *
+
+# Recursive descent parsers generated from grammars in EBNF.
+#
+# Every non-terminal becomes a function from a start position to the set
+# of positions where its derivations may end, memoized per input, so any
+# grammar without left recursion is parsed, ambiguous ones included.
+# Optional parts, repetitions and alternatives are compiled to branches
+# and loops over sets of positions, without converting the grammar first.
+# `EBNFInterpreter` walks the expressions with the same semantics and
+# serves as the reference to compare generated parsers against.
+
+# Input of the definition of a non-terminal: its start position
+START_SET = "{position}"
+
+PREAMBLE = '''\
+import sys
+from typing import FrozenSet, Iterable
+
+# Parser of {start} generated by codegen.py: every non-terminal is a
+# function returning the positions where its derivations starting at a
+# given position may end, memoized per input.
+
+
+def ends(words: Iterable[str]) -> FrozenSet[int]:
+    """
+    Lengths of the prefixes of `words` derived from {start}
+    """
+    tokens = list(words)
+    tokens.append(None)
+'''
+
+EPILOGUE = '''\
+
+
+def recognize(words: Iterable[str]) -> bool:
+    tokens = list(words)
+    return len(tokens) in ends(tokens)
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Expected at least one argument: file with a sequence of space separated terminals on every line")
+        return
+    output_file = sys.argv[2] if len(sys.argv) > 2 else sys.argv[1] + ".out"
+    with open(sys.argv[1]) as words, open(output_file, "w") as processed_words:
+        for line in words:
+            result = "accepted" if recognize(line.split()) else "rejected"
+            print(f"{{result}}: {{line.strip()}}", file=processed_words)
+
+
+if __name__ == "__main__":
+    main()
+'''
+
+
+def rule_definitions(grammar: EBNF) -> Dict[str, Expression]:
+    """
+    Definition of every defined non-terminal, the rules of one non-terminal
+    joined into alternatives
+    """
+    definitions: Dict[str, List[Expression]] = {}
+    for rule in grammar.rules:
+        definitions.setdefault(rule.defined.value, []).append(rule.definition)
+    return {name: fold_alt(exprs) for name, exprs in definitions.items()}
+
+
+def resolve_name(grammar: EBNF, name: Name) -> Terminal:
+    terminal = grammar.name_bindings.get(name.value)
+    if terminal is None:
+        raise ValueError(f"Name {show(name)} is not defined")
+    return terminal
+
+
+def nullable_non_terminals(definitions: Dict[str, Expression]) -> Set[str]:
+    nullable: Set[str] = set()
+    algebra = {
+        Eps: lambda expr, args: True,
+        Terminal: lambda expr, args: False,
+        Name: lambda expr, args: False,
+        NonTerminal: lambda expr, args: expr.value in nullable,
+        Optional: lambda expr, args: True,
+        KleeneStar: lambda expr, args: True,
+        Seq: lambda expr, args: all(args),
+        Alt: lambda expr, args: any(args),
+    }
+    changed = True
+    while changed:
+        changed = False
+        for name, definition in definitions.items():
+            if name not in nullable and fold(definition, algebra):
+                nullable.add(name)
+                changed = True
+    return nullable
+
+
+def leftmost_non_terminals(expr: Expression, nullable: Set[str]) -> Set[str]:
+    """
+    Non-terminals `expr` may call without consuming input first
+    """
+    algebra = {
+        Eps: lambda expr, args: (True, set()),
+        Terminal: lambda expr, args: (False, set()),
+        Name: lambda expr, args: (False, set()),
+        NonTerminal: lambda expr, args: (expr.value in nullable, {expr.value}),
+        Optional: lambda expr, args: (True, args[0][1]),
+        KleeneStar: lambda expr, args: (True, args[0][1]),
+        Alt: lambda expr, args: (any(empty for empty, _ in args),
+                                 set().union(*(calls for _, calls in args))),
+    }
+
+    def seq(expr, args):
+        calls = set()
+        for empty, element_calls in args:
+            calls |= element_calls
+            if not empty:
+                return False, calls
+        return True, calls
+
+    algebra[Seq] = seq
+    return fold(expr, algebra)[1]
+
+
+def check_left_recursion(definitions: Dict[str, Expression]):
+    nullable = nullable_non_terminals(definitions)
+    calls = {name: leftmost_non_terminals(definition, nullable)
+             for name, definition in definitions.items()}
+    # Depth-first search with an explicit stack of (non-terminal, iterator over its calls)
+    finished: Set[str] = set()
+    for root in calls:
+        if root in finished:
+            continue
+        path = [root]
+        stack = [(root, iter(sorted(calls[root])))]
+        while stack:
+            name, callees = stack[-1]
+            for callee in callees:
+                if callee in path:
+                    cycle = path[path.index(callee):] + [callee]
+                    raise ValueError("Grammar is left-recursive: " +
+                                     " -> ".join(f"<{nt}>" for nt in cycle))
+                if callee not in finished and callee in calls:
+                    path.append(callee)
+                    stack.append((callee, iter(sorted(calls[callee]))))
+                    break
+            else:
+                stack.pop()
+                path.pop()
+                finished.add(name)
+
+
+class ParserGenerator:
+    """
+    Emits the source of a parser module. Every expression is compiled to
+    statements computing a fresh variable holding the set of positions
+    where it may end from the positions held by an input variable; only
+    sets created by the statements of the same expression are updated in
+    place, so variables may be shared. Expressions applied to the start
+    position alone test it directly instead of looping over a set.
+
+    The body of every repetition is a function of its own, defined next to
+    the function of the non-terminal, so nested repetitions nest neither
+    loops nor indentation.
+    """
+
+    def __init__(self, grammar: EBNF):
+        self.grammar = grammar
+        self.definitions = rule_definitions(grammar)
+        check_left_recursion(self.definitions)
+        self.function_names = {name: f"nt_{index}" for index, name in enumerate(self.definitions)}
+        self.variable_count = 0
+        # Functions of repetition bodies of the non-terminal being emitted,
+        # named after it and their parameter
+        self.function = ""
+        self.body_functions: List[List[str]] = []
+        self.emitters = {
+            Eps: self.emit_eps,
+            Terminal: self.emit_terminal,
+            Name: self.emit_name,
+            NonTerminal: self.emit_non_terminal,
+            Optional: self.emit_optional,
+            KleeneStar: self.emit_kleene_star,
+            Seq: self.emit_seq,
+            Alt: self.emit_alt,
+        }
+
+    def variable(self) -> str:
+        self.variable_count += 1
+        return f"s{self.variable_count}"
+
+    def emit(self, expr: Expression, source: str, lines: List[str], indent: str) -> Union[str, Iterator]:
+        # Emitters of compound expressions are generators yielding the
+        # emission of their parts, run by `trampoline`
+        emitter = self.emitters.get(type(expr))
+        if emitter is None:
+            raise ValueError("Expression is not valid")
+        return emitter(expr, source, lines, indent)
+
+    def emit_eps(self, expr: Eps, source: str, lines: List[str], indent: str) -> str:
+        return source
+
+    def emit_terminal(self, expr: Terminal, source: str, lines: List[str], indent: str) -> str:
+        result = self.variable()
+        if source == START_SET:
+            lines.append(f"{indent}{result} = {{position + 1}} if tokens[position] == {expr.value!r} else set()")
+            return result
+        lines.append(f"{indent}{result} = {{p + 1 for p in {source} if tokens[p] == {expr.value!r}}}")
+        return result
+
+    def emit_name(self, expr: Name, source: str, lines: List[str], indent: str) -> str:
+        return self.emit_terminal(resolve_name(self.grammar, expr), source, lines, indent)
+
+    def emit_non_terminal(self, expr: NonTerminal, source: str, lines: List[str], indent: str) -> str:
+        result = self.variable()
+        function = self.function_names.get(expr.value)
+        if function is None:
+            # Undefined non-terminals derive nothing
+            lines.append(f"{indent}{result} = set()")
+            return result
+        if source == START_SET:
+            lines.append(f"{indent}{result} = {function}(position)")
+            return result
+        lines.append(f"{indent}{result} = set()")
+        lines.append(f"{indent}for p in {source}:")
+        lines.append(f"{indent}    {result} |= {function}(p)")
+        return result
+
+    def emit_optional(self, expr: Optional, source: str, lines: List[str], indent: str) -> Iterator:
+        value = yield self.emit(expr.value, source, lines, indent)
+        result = self.variable()
+        lines.append(f"{indent}{result} = {source} | {value}")
+        return result
+
+    def emit_kleene_star(self, expr: KleeneStar, source: str, lines: List[str], indent: str) -> Iterator:
+        # Positions reached for the first time are the next iteration's input
+        parameter, result, frontier = self.variable(), self.variable(), self.variable()
+        function = f"{self.function}_{parameter[1:]}"
+        body = [f"    def {function}({parameter}):"]
+        value = yield self.emit(expr.value, parameter, body, " " * 8)
+        body.append(f"        return {value}")
+        self.body_functions.append(body)
+        lines.append(f"{indent}{result} = set({source})")
+        lines.append(f"{indent}{frontier} = {source}")
+        lines.append(f"{indent}while {frontier}:")
+        lines.append(f"{indent}    {frontier} = {function}({frontier}) - {result}")
+        lines.append(f"{indent}    {result} |= {frontier}")
+        return result
+
+    def emit_seq(self, expr: Seq, source: str, lines: List[str], indent: str) -> Iterator:
+        for element in expr.vals:
+            source = yield self.emit(element, source, lines, indent)
+        return source
+
+    def emit_alt(self, expr: Alt, source: str, lines: List[str], indent: str) -> Iterator:
+        result = self.variable()
+        lines.append(f"{indent}{result} = set()")
+        for alternative in expr.vals:
+            value = yield self.emit(alternative, source, lines, indent)
+            lines.append(f"{indent}{result} |= {value}")
+        return result
+
+    def emit_function(self, name: str, definition: Expression, lines: List[str]):
+        function = self.function_names[name]
+        memo = f"memo_{function[3:]}"
+        lines.append("")
+        lines.append(f"    {memo} = {{}}")
+        lines.append("")
+        lines.append(f"    def {function}(position):")
+        lines.append(f"        # <{name}> := {show(definition)}")
+        lines.append(f"        result = {memo}.get(position)")
+        lines.append(f"        if result is None:")
+        self.variable_count = 0
+        self.function = f"star_{function[3:]}"
+        self.body_functions = []
+        value = trampoline(self.emit(definition, START_SET, lines, " " * 12))
+        lines.append(f"            result = {memo}[position] = frozenset({value})")
+        lines.append(f"        return result")
+        for body in self.body_functions:
+            lines.append("")
+            lines.extend(body)
+
+    def generate(self) -> str:
+        lines = [PREAMBLE.format(start=show(self.grammar.start)).rstrip("\n")]
+        for name, definition in self.definitions.items():
+            self.emit_function(name, definition, lines)
+        lines.append("")
+        start = self.function_names.get(self.grammar.start.value)
+        lines.append(f"    return {start}(0)" if start else "    return frozenset()")
+        lines.append(EPILOGUE.format())
+        return "\n".join(lines)
+
+
+def generate_parser(grammar: EBNF) -> str:
+    """
+    Source of a standalone module with `ends` and `recognize` functions
+    parsing sequences of terminal values
+    """
+    return ParserGenerator(grammar).generate()
+
+
+def load_parser(source: str, name: str = "generated_parser") -> ModuleType:
+    module = ModuleType(name)
+    exec(compile(source, name, "exec"), module.__dict__)
+    return module
+
+
+class EBNFInterpreter:
+    """
+    Parses with the same semantics as generated parsers by walking the
+    expressions of the grammar, dispatching on the type of every node
+    """
+
+    def __init__(self, grammar: EBNF):
+        self.grammar = grammar
+        self.definitions = rule_definitions(grammar)
+        check_left_recursion(self.definitions)
+        self.steps = {
+            Eps: lambda expr, starts, state: starts,
+            Terminal: self.step_terminal,
+            Name: lambda expr, starts, state: self.step_terminal(resolve_name(self.grammar, expr),
+                                                                 starts, state),
+            NonTerminal: self.step_non_terminal,
+            Optional: self.step_optional,
+            KleeneStar: self.step_kleene_star,
+            Seq: self.step_seq,
+            Alt: self.step_alt,
+        }
+
+    def step(self, expr: Expression, starts: Set[int],
+             state: Tuple[List[str], Dict[Tuple[str, int], FrozenSet[int]]]) -> Union[Set[int], Iterator]:
+        # Steps of compound expressions and non-terminals are generators
+        # yielding the steps of their parts, run by `trampoline`
+        return self.steps[type(expr)](expr, starts, state)
+
+    def step_terminal(self, expr: Terminal, starts, state) -> Set[int]:
+        tokens = state[0]
+        return {p + 1 for p in starts if tokens[p] == expr.value}
+
+    def step_non_terminal(self, expr: NonTerminal, starts, state) -> Iterator:
+        memo = state[1]
+        result = set()
+        for p in starts:
+            ends = memo.get((expr.value, p))
+            if ends is None:
+                definition = self.definitions.get(expr.value)
+                ends = frozenset() if definition is None else frozenset((yield self.step(definition, {p}, state)))
+                memo[expr.value, p] = ends
+            result |= ends
+        return result
+
+    def step_optional(self, expr: Optional, starts, state) -> Iterator:
+        return starts | (yield self.step(expr.value, starts, state))
+
+    def step_kleene_star(self, expr: KleeneStar, starts, state) -> Iterator:
+        result = set(starts)
+        frontier = starts
+        while frontier:
+            frontier = (yield self.step(expr.value, frontier, state)) - result
+            result |= frontier
+        return result
+
+    def step_seq(self, expr: Seq, starts, state) -> Iterator:
+        for element in expr.vals:
+            starts = yield self.step(element, starts, state)
+        return starts
+
+    def step_alt(self, expr: Alt, starts, state) -> Iterator:
+        result = set()
+        for alternative in expr.vals:
+            result |= yield self.step(alternative, starts, state)
+        return result
+
+    def ends(self, words: Iterable[str]) -> FrozenSet[int]:
+        tokens = list(words)
+        tokens.append(None)
+        return frozenset(trampoline(self.step(self.grammar.start, {0}, (tokens, {}))))
+
+    def recognize(self, words: Iterable[str]) -> bool:
+        tokens = list(words)
+        return len(tokens) in self.ends(tokens)
+
+
+PLY_PREAMBLE = """\
+import importlib.util
+import os
+import sys
+
+from ply import lex, yacc
+
+# LALR parser of {start} generated by codegen.py from a grammar in classic
+# form. Parse trees are pairs of a non-terminal and the tuple of its
+# children, tokens being their text. Tables are cached next to this file.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+"""
+
+PLY_EPILOGUE = """\
+
+
+def t_newline(t):
+    r'\\n+'
+    t.lexer.lineno += len(t.value)
+
+
+def t_error(t):
+    raise SyntaxError(f"Illegal character {{t.value[0]!r}} on line {{t.lineno}}")
+
+
+def p_error(p):
+    if p is None:
+        raise SyntaxError("Unexpected end of input")
+    raise SyntaxError(f"Unexpected {{p.value!r}} on line {{p.lineno}}")
+
+
+def load_tables(name: str):
+    # Tables are loaded from this directory wherever the module is imported from
+    path = os.path.join(HERE, name + ".py")
+    if not os.path.exists(path):
+        return name
+    spec = importlib.util.spec_from_file_location(name, path)
+    tables = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(tables)
+    return tables
+
+
+lexer = lex.lex(optimize=True, lextab=load_tables({lextab!r}), outputdir=HERE)
+parser = yacc.yacc(tabmodule=load_tables({parsetab!r}), outputdir=HERE, debug=False)
+
+
+def parse(text: str):
+    return parser.parse(text, lexer=lexer.clone())
+
+
+def recognize(text: str) -> bool:
+    try:
+        parse(text)
+    except SyntaxError:
+        return False
+    return True
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Expected at least one argument: file with a sequence of space separated terminals on every line")
+        return
+    output_file = sys.argv[2] if len(sys.argv) > 2 else sys.argv[1] + ".out"
+    with open(sys.argv[1]) as words, open(output_file, "w") as processed_words:
+        for line in words:
+            result = "accepted" if recognize(line) else "rejected"
+            print(f"{{result}}: {{line.strip()}}", file=processed_words)
+
+
+if __name__ == "__main__":
+    main()
+"""
+
+
+def classic_productions(grammar: EBNF) -> Iterator[Tuple[str, List[Expression]]]:
+    for rule in grammar.rules:
+        alternatives = rule.definition.vals if isinstance(rule.definition, Alt) else (rule.definition,)
+        for alternative in alternatives:
+            symbols = []
+            for node in walk(alternative, SEQ_CHILDREN):
+                if isinstance(node, (Terminal, NonTerminal)):
+                    symbols.append(node)
+                elif not isinstance(node, (Seq, Eps)):
+                    raise ValueError("Grammar is not in classic form, convert it first")
+            yield rule.defined.value, symbols
+
+
+def table_prefix(module_file: str) -> str:
+    """
+    Identifier the names of table modules of a generated module start with
+    """
+    name = re.sub(r"\W", "_", os.path.splitext(os.path.basename(module_file))[0])
+    return "_" + name if name[:1].isdigit() else name
+
+
+def generate_ply_module(grammar: EBNF, prefix: str) -> str:
+    """
+    Source of a PLY module parsing texts of terminals with a grammar in
+    classic form. Terminals become string rules, which PLY tries longest
+    first, and productions become `p_` functions; symbols are renamed to
+    identifiers, original names are kept in comments and parse trees.
+    Conflicts of ambiguous grammars are resolved as PLY does: shift over
+    reduce, and the earlier production among reductions.
+    """
+    productions = list(classic_productions(grammar))
+    token_names: Dict[str, str] = {}
+    rule_names: Dict[str, str] = {grammar.start.value: "n0"}
+    for lhs, symbols in productions:
+        rule_names.setdefault(lhs, f"n{len(rule_names)}")
+        for symbol in symbols:
+            if isinstance(symbol, Terminal):
+                token_names.setdefault(symbol.value, f"T{len(token_names)}")
+            else:
+                rule_names.setdefault(symbol.value, f"n{len(rule_names)}")
+
+    lines = [PLY_PREAMBLE.format(start=show(grammar.start))]
+    lines.append("tokens = (" + "".join(f"{token!r}, " for token in token_names.values()) + ")")
+    lines.append("")
+    lines.append("t_ignore = ' \\t\\r'")
+    for value, token in token_names.items():
+        lines.append(f"t_{token} = {re.escape(value)!r}  # {show(Terminal(value))}")
+    lines.append("")
+    lines.append("start = 'n0'")
+    for index, (lhs, symbols) in enumerate(productions):
+        rhs = " ".join(token_names[symbol.value] if isinstance(symbol, Terminal)
+                       else rule_names[symbol.value] for symbol in symbols)
+        lines.append("")
+        lines.append("")
+        lines.append(f"def p_{index}(p):")
+        lines.append(f"    # {show(NonTerminal(lhs))} := {show(fold_seq(symbols)) if symbols else 'EPS'}")
+        lines.append(f'    """{rule_names[lhs]} : {rhs}"""')
+        lines.append(f"    p[0] = ({lhs!r}, tuple(p[1:]))")
+    lines.append(PLY_EPILOGUE.format(lextab=prefix + "_lextab", parsetab=prefix + "_parsetab"))
+    return "\n".join(lines)
+
+
+def write_ply_module(grammar: EBNF, output: str):
+    """
+    Writes a PLY module for a grammar in classic form and generates its
+    tables once, by loading it
+    """
+    with open(output, "w") as ply_module:
+        ply_module.write(generate_ply_module(grammar, table_prefix(output)))
+    # PLY looks the module up in `sys.modules` to validate the rules
+    name = table_prefix(output)
+    loader = SourceFileLoader(name, output)
+    module = importlib.util.module_from_spec(importlib.util.spec_from_loader(name, loader))
+    sys.modules[name] = module
+    try:
+        loader.exec_module(module)
+    finally:
+        del sys.modules[name]
+
+
+def main():
+    p = argparse.ArgumentParser("Generates a standalone recursive descent parser from EBNF grammar")
+    p.add_argument('input', nargs=1, type=str)
+    p.add_argument('output', nargs='?')
+    p.add_argument("-w", "--words", help="recognize the words in a file with the interpreter instead, "
+                                         "writing results as generated parsers do")
+    args = p.parse_args()
+    if not args.output:
+        args.output = (args.words or args.input[0]) + (".out" if args.words else ".py")
+    ebnf, diagnostics = ebnf_parser.parse_ebnf(args.input[0])
+    diagnostics.write(sys.stderr)
+    if ebnf is None:
+        print("Grammar is incorrect, cannot parse", file=sys.stderr)
+        sys.exit(1)
+    try:
+        if args.words:
+            interpreter = EBNFInterpreter(ebnf)
+        else:
+            source = generate_parser(ebnf)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        sys.exit(1)
+    if args.words:
+        with open(args.words) as words, open(args.output, "w") as processed_words:
+            for line in words:
+                result = "accepted" if interpreter.recognize(line.split()) else "rejected"
+                print(f"{result}: {line.strip()}", file=processed_words)
+        return
+    with open(args.output, "w") as parser_module:
+        parser_module.write(source)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+import sys
+from array import array
+from typing import Dict, List, Iterator
+
+from EBNF import *
+from converter import Converter
+import ebnf_parser
+
+# Compact form of a grammar in classic form (as produced by `Converter.convert`):
+# symbols are interned to small integers and productions are stored in
+# flat integer arrays.
+
+
+class CompiledGrammar:
+    """
+    Symbols are numbered with terminals first: ids `0 .. terminal_count - 1`
+    are terminals and the following ids are non-terminals, `symbols` holds
+    their names.
+
+    Productions are numbered grouped by their left-hand side: productions
+    of non-terminal `n` are `production_offsets[n - terminal_count]` up to
+    `production_offsets[n - terminal_count + 1]`. Production `p` derives
+    `lhs[p]` into `rhs[rhs_offsets[p]:rhs_offsets[p + 1]]`; an empty
+    right-hand side is epsilon.
+    """
+
+    symbols: List[str]
+    terminal_count: int
+    start: int
+    lhs: array
+    rhs_offsets: array
+    rhs: array
+    production_offsets: array
+
+    def __init__(self, symbols: List[str], terminal_count: int, start: int,
+                 lhs: array, rhs_offsets: array, rhs: array, production_offsets: array):
+        self.symbols = symbols
+        self.terminal_count = terminal_count
+        self.start = start
+        self.lhs = lhs
+        self.rhs_offsets = rhs_offsets
+        self.rhs = rhs
+        self.production_offsets = production_offsets
+
+    @property
+    def symbol_count(self) -> int:
+        return len(self.symbols)
+
+    @property
+    def non_terminal_count(self) -> int:
+        return len(self.symbols) - self.terminal_count
+
+    @property
+    def production_count(self) -> int:
+        return len(self.lhs)
+
+    def is_terminal(self, symbol: int) -> bool:
+        return symbol < self.terminal_count
+
+    def productions(self, non_terminal: int) -> range:
+        index = non_terminal - self.terminal_count
+        return range(self.production_offsets[index], self.production_offsets[index + 1])
+
+    def production_rhs(self, production: int) -> array:
+        return self.rhs[self.rhs_offsets[production]:self.rhs_offsets[production + 1]]
+
+    def symbol_expr(self, symbol: int) -> Union[Terminal, NonTerminal]:
+        if self.is_terminal(symbol):
+            return Terminal(self.symbols[symbol])
+        return NonTerminal(self.symbols[symbol])
+
+    def to_grammar(self) -> EBNF:
+        rules = []
+        for non_terminal in range(self.terminal_count, self.symbol_count):
+            alternatives = []
+            for production in self.productions(non_terminal):
+                rhs = [self.symbol_expr(symbol) for symbol in self.production_rhs(production)]
+                alternatives.append(fold_seq(rhs) if rhs else EPS)
+            if alternatives:
+                rules.append(Rule(NonTerminal(self.symbols[non_terminal]), fold_alt(alternatives)))
+        return make_grammar(NonTerminal(self.symbols[self.start]), rules, [])
+
+
+def production_symbols(alternative: Expression) -> Iterator[Union[Terminal, NonTerminal]]:
+    for node in walk(alternative, SEQ_CHILDREN):
+        if isinstance(node, (Terminal, NonTerminal)):
+            yield node
+        elif not isinstance(node, (Seq, Eps)):
+            raise ValueError("Grammar is not in classic form, convert it first")
+
+
+def compile_grammar(grammar: EBNF) -> CompiledGrammar:
+    # Symbols are numbered in order of their first appearance
+    terminal_ids: Dict[str, int] = {}
+    non_terminal_ids: Dict[str, int] = {grammar.start.value: 0}
+    productions: List[List[List[Expression]]] = [[]]
+
+    for rule in grammar.rules:
+        lhs = non_terminal_ids.setdefault(rule.defined.value, len(non_terminal_ids))
+        if lhs == len(productions):
+            productions.append([])
+        for alternative in walk(rule.definition, ALT_CHILDREN):
+            if isinstance(alternative, Alt):
+                continue
+            rhs = list(production_symbols(alternative))
+            for symbol in rhs:
+                if isinstance(symbol, Terminal):
+                    terminal_ids.setdefault(symbol.value, len(terminal_ids))
+                elif non_terminal_ids.setdefault(symbol.value, len(non_terminal_ids)) == len(productions):
+                    productions.append([])
+            productions[lhs].append(rhs)
+
+    terminal_count = len(terminal_ids)
+    symbols = list(terminal_ids) + list(non_terminal_ids)
+    lhs_array = array("i")
+    rhs_offsets = array("i", [0])
+    rhs_array = array("i")
+    production_offsets = array("i", [0])
+    for index, non_terminal_productions in enumerate(productions):
+        for rhs in non_terminal_productions:
+            lhs_array.append(terminal_count + index)
+            rhs_array.extend(terminal_ids[symbol.value] if isinstance(symbol, Terminal)
+                             else terminal_count + non_terminal_ids[symbol.value]
+                             for symbol in rhs)
+            rhs_offsets.append(len(rhs_array))
+        production_offsets.append(len(lhs_array))
+
+    return CompiledGrammar(symbols, terminal_count, terminal_count, lhs_array,
+                           rhs_offsets, rhs_array, production_offsets)
+
+
+def show_compiled(compiled: CompiledGrammar) -> str:
+    nl = "\n"
+    symbols = "".join(f"  {symbol} {show(compiled.symbol_expr(symbol))}{nl}"
+                      for symbol in range(compiled.symbol_count))
+    productions = "".join(
+        f"  {compiled.lhs[production]} :=" +
+        "".join(f" {symbol}" for symbol in compiled.production_rhs(production)) + f";{nl}"
+        for production in range(compiled.production_count))
+    return f"symbols:{nl}{symbols}start:{nl}  {compiled.start};{nl}productions:{nl}{productions}"
+
+
+def main():
+    if len(sys.argv) > 1:
+        input_file = sys.argv[1]
+        if len(sys.argv) > 2:
+            output_file = sys.argv[2]
+        else:
+            output_file = input_file + ".out"
+
+        ebnf, diagnostics = ebnf_parser.parse_ebnf(input_file)
+        diagnostics.write(sys.stderr)
+        with open(output_file, "w") as processed_grammar:
+            if ebnf is None:
+                print("Grammar is incorrect, cannot parse", file=processed_grammar)
+            else:
+                compiled = compile_grammar(Converter(ebnf, False).convert())
+                print(show_compiled(compiled), file=processed_grammar)
+    else:
+        print("Expected at least one argument: input file containing grammar")
+
+
+if __name__ == "__main__":
+    main()
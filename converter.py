@@ -1,9 +1,49 @@
+import io
+import os
 import string
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 
 from EBNF import *
 import ebnf_parser
 import argparse
-from random import choice
+from cache import GrammarCache, dump_entry, load_entry
+from codegen import write_ply_module
+from diagnostics import Diagnostics
+
+
+# Parts of helper non-terminal names composed from the structure of expressions
+NAME_PARTS: Dict[type, Callable[[Expression, List[str]], str]] = {
+    Terminal: lambda expr, args: expr.value,
+    NonTerminal: lambda expr, args: expr.value,
+    Name: lambda expr, args: expr.value,
+    Eps: lambda expr, args: "eps",
+    Optional: lambda expr, args: "opt" + args[0],
+    KleeneStar: lambda expr, args: "mult" + args[0],
+    Alt: lambda expr, args: "(" + "or".join(args) + ")",
+    Seq: lambda expr, args: "(" + " ".join(args) + ")",
+}
+
+
+# Rules of the helper non-terminal `converted` of an expression
+HELPER_RULES: Dict[type, Callable[[Expression, NonTerminal], List[Rule]]] = {
+    Optional: lambda expr, converted: [Rule(converted, expr.value), Rule(converted, EPS)],
+    KleeneStar: lambda expr, converted: [Rule(converted, Seq([converted, expr.value])), Rule(converted, EPS)],
+    Alt: lambda expr, converted: [Rule(converted, e) for e in expr.vals],
+}
+
+# Shards of rules per worker process in parallel conversion
+SHARDS_PER_JOB = 4
+
+
+def helpers_used(expr: Expression) -> List[Expression]:
+    """
+    Subexpressions of `expr` converted to helper non-terminals, in the
+    order `Converter.convert_expr` meets them
+    """
+    return [node for node in walk(expr, SEQ_CHILDREN) if type(node) in HELPER_RULES]
 
 
 class Converter:
@@ -12,155 +52,496 @@ class Converter:
     rules: List[Rule]
     start: NonTerminal
     readable: bool
-    composed_names: Dict[str, str] = {}
+    helpers: Dict[Expression, NonTerminal]
 
-    def __init__(self, grammar: EBNF, readable: bool):
+    def __init__(self, grammar: EBNF, readable: bool, jobs: int = 1):
         self.names = grammar.name_bindings
-        self.non_terminals = grammar.non_terminals
-        self.rules = grammar.rules
+        # Copied, as helpers are added to both
+        self.non_terminals = set(grammar.non_terminals)
+        self.rules = list(grammar.rules)
         self.start = grammar.start
         self.readable = readable
+        # Worker processes converting rules, one for sequential conversion,
+        # `None` for one per CPU
+        self.jobs = jobs
+        self.name_algebra = {kind: (lambda expr, args, part=part: self.prime(part(expr, args)))
+                             for kind, part in NAME_PARTS.items()}
+        # Composed names of subexpressions, shared by all helper non-terminals
+        self.name_memo: Dict[Expression, str] = {}
+        # Every distinct subexpression gets one helper non-terminal, whose
+        # rules are created when it is first met
+        self.helpers = {}
+        self.helper_names: Set[str] = set()
+        # Number of readable names generated so far
+        self.readable_count = 0
+        self.conversion_algebra = {
+            Terminal: lambda expr, args: (expr, []),
+            NonTerminal: lambda expr, args: (expr, []),
+            Eps: lambda expr, args: (expr, []),
+            Name: lambda expr, args: (self.names[expr.value], []),
+            Optional: self.convert_helper,
+            KleeneStar: self.convert_helper,
+            Alt: self.convert_helper,
+            Seq: self.convert_seq,
+        }
+
+    def prime(self, name: str) -> str:
+        while name in self.non_terminals:
+            name += "'"
+        return name
 
     def compose_nt_name(self, expr: Expression) -> str:
+        return self.unique_name(None if self.readable else fold(expr, self.name_algebra, memo=self.name_memo))
+
+    def unique_name(self, composed: Union[str, None]) -> str:
         if not self.readable:
-            if isinstance(expr, Terminal) or isinstance(expr, NonTerminal) or isinstance(expr, Name):
-                res = expr.value
-            elif isinstance(expr, Eps):
-                res = "eps"
-            elif isinstance(expr, Optional):
-                res = "opt" + self.compose_nt_name(expr.value)
-            elif isinstance(expr, KleeneStar):
-                res = "mult" + self.compose_nt_name(expr.value)
-            elif isinstance(expr, Alt):
-                res = "(" + "or".join([self.compose_nt_name(e) for e in expr.vals]) + ")"
-            elif isinstance(expr, Seq):
-                res = "(" + " ".join(self.compose_nt_name(e) for e in expr.vals) + ")"
-            else:
-                raise RuntimeError("Can't match expression type during name composition")
-            while res in self.non_terminals:
+            res = composed
+            # Different expressions may compose the same name, e.g. `{"a"}` and `{<a>}`
+            while res in self.helper_names or res in self.non_terminals:
                 res += "'"
         else:
-            str_expr = show(expr)
-            res = self.composed_names.get(str_expr, '')
-            if not res:
-                res = choice(string.ascii_uppercase)
-                while res in self.non_terminals:
-                    res += choice(string.ascii_uppercase)
-                self.non_terminals.add(res)
-                self.composed_names[str_expr] = res
+            res = self.readable_name()
+            while res in self.non_terminals:
+                res = self.readable_name()
+            self.non_terminals.add(res)
+        self.helper_names.add(res)
+        return res
+
+    def readable_name(self) -> str:
+        # `A`, ..., `Z`, `AA`, `AB`, ... in order, so that output is reproducible
+        self.readable_count += 1
+        index = self.readable_count
+        res = ""
+        while index:
+            index, letter = divmod(index - 1, len(string.ascii_uppercase))
+            res = string.ascii_uppercase[letter] + res
         return res
 
+    def helper(self, expr: Expression) -> (NonTerminal, bool):
+        """
+        Returns the helper non-terminal of `expr` and whether it is new
+        """
+        converted = self.helpers.get(expr)
+        if converted is not None:
+            return converted, False
+        converted = NonTerminal(self.compose_nt_name(expr))
+        self.helpers[expr] = converted
+        return converted, True
+
+    def convert_helper(self, expr: Expression, args: List) -> (Expression, List[Rule]):
+        converted, new = self.helper(expr)
+        if not new:
+            return converted, []
+        return converted, HELPER_RULES[type(expr)](expr, converted)
+
+    def convert_seq(self, expr: Seq,
+                    args: List[Tuple[Expression, List[Rule]]]) -> (Expression, List[Rule]):
+        if len(args) == 1:
+            return args[0]
+        new_rules = []
+        for _, new_rules_e in args:
+            new_rules += new_rules_e
+        return fold_seq([converted_e for converted_e, _ in args]), new_rules
+
     def convert_expr(self, expr: Expression) -> (Expression, List[Rule]):
-        if isinstance(expr, Terminal) or isinstance(expr, NonTerminal) or isinstance(expr, Eps):
-            converted = expr
-            new_rules = []
-        elif isinstance(expr, Name):
-            converted = self.names[expr.value]
-            new_rules = []
-        elif isinstance(expr, Optional):
-            converted = NonTerminal(self.compose_nt_name(expr))
-            new_rules = [Rule(converted, expr.value), Rule(converted, EPS)]
-        elif isinstance(expr, KleeneStar):
-            converted = NonTerminal(self.compose_nt_name(expr))
-            new_rules = [Rule(converted, Seq([converted, expr.value])), Rule(converted, EPS)]
-        elif isinstance(expr, Alt):
-            converted = NonTerminal(self.compose_nt_name(expr))
-            new_rules = [Rule(converted, e) for e in expr.vals]
-        elif isinstance(expr, Seq):
-            if len(expr.vals) == 1:
-                return self.convert_expr(expr.vals[0])
-            converted_seq = [self.convert_expr(e) for e in expr.vals]
-            converted, new_rules = reduce(lambda a, b: (make_seq(a[0], b[0]), a[1] + b[1]),
-                                          converted_seq)
-        else:
-            raise RuntimeError("Can't match expression type during conversion")
-        return converted, new_rules
+        # Only sequences are converted in place, other compound expressions
+        # become helper non-terminals with their own rules
+        return fold(expr, self.conversion_algebra, SEQ_CHILDREN)
 
     def remove_nested_seqs(self, expr: Expression) -> List[Expression]:
-        if isinstance(expr, Seq):
-            exprs = []
-            for e in expr.vals:
-                exprs += self.remove_nested_seqs(e)
-            return exprs
-        else:
-            return [expr]
+        return [e for e in walk(expr, SEQ_CHILDREN) if not isinstance(e, Seq)]
 
-    def convert(self) -> EBNF:
-        converted_rules_dict: Dict[str, Set[str]] = {}
-        str_to_expr: Dict[str, Expression] = {}
+    def convert_rules(self) -> Iterator[Tuple[NonTerminal, Expression]]:
         i = 0
         while i < len(self.rules):
-            definition = self.rules[i].definition
-            defined = self.rules[i].defined
-            new_definition, new_rules = self.convert_expr(definition)
-            str_new_definition = show(new_definition)
-            str_defined = show(defined)
-            str_to_expr[str_new_definition] = new_definition
-            str_to_expr[str_defined] = defined
-            converted_rules_dict[str_defined] = converted_rules_dict.get(str_defined, set()) | {
-                str_new_definition}
+            new_definition, new_rules = self.convert_expr(self.rules[i].definition)
+            yield self.rules[i].defined, new_definition
             self.rules += new_rules
             i += 1
-        for nt in converted_rules_dict:
-            self.remove_chains(nt, {}, converted_rules_dict, str_to_expr)
 
-        used_non_terminals_names = reduce(lambda lhs, rhs: lhs | rhs,
-                                          [reduce(lambda lhs, rhs: lhs | rhs,
-                                                  map(lambda s: collect_non_terminals(
-                                                          str_to_expr[s]),
-                                                      exprs)) for exprs in
-                                           converted_rules_dict.values()])
+    def convert_rules_parallel(self) -> Iterator[Tuple[NonTerminal, Expression]]:
+        """
+        Converts rules like `convert_rules`, in shards on a process pool.
+        Every worker gets only the rules of its shard and names the helpers
+        it creates after the shard; shards are then merged in order by
+        replaying the worklist of `convert_rules`, which gives the helpers
+        their final names in the order the sequential conversion does.
+        """
+        jobs = self.jobs or os.cpu_count() or 1
+        size = max(1, -(-len(self.rules) // (jobs * SHARDS_PER_JOB)))
+        shards = [(index, dumps([rule.definition for rule in self.rules[begin:begin + size]]))
+                  for index, begin in enumerate(range(0, len(self.rules), size))]
+        with ProcessPoolExecutor(jobs, initializer=init_shard_worker,
+                                 initargs=(self.names, self.non_terminals, self.readable)) as pool:
+            results = [loads(result) for result in pool.map(convert_shard, shards)]
+
+        # Final names of the temporary ones, which are unique to their shard
+        renamed: Dict[NonTerminal, NonTerminal] = {}
+        rename_algebra = {
+            Terminal: lambda expr, args: expr,
+            Eps: lambda expr, args: expr,
+            NonTerminal: lambda expr, args: renamed.get(expr, expr),
+            Seq: lambda expr, args: Seq(args),
+        }
+        rename_memo: Dict[Expression, Expression] = {}
+
+        def rename(expr: Expression) -> Expression:
+            # Converted definitions are mostly flat sequences, renamed without `fold`
+            if isinstance(expr, Seq) and not any(isinstance(e, Seq) for e in expr.vals):
+                return Seq([renamed.get(e, e) for e in expr.vals])
+            return fold(expr, rename_algebra, SEQ_CHILDREN, rename_memo)
+
+        # Rules of the worklist with their shard and position in it
+        worklist = [(index, position) for index, begin in enumerate(range(0, len(self.rules), size))
+                    for position in range(min(size, len(self.rules) - begin))]
+        i = 0
+        while i < len(worklist):
+            index, position = worklist[i]
+            converted, met, helpers = results[index]
+            for temporary in met[position]:
+                if temporary in renamed:
+                    continue
+                expr, composed, begin, end = helpers[temporary]
+                final = self.helpers.get(expr)
+                if final is None:
+                    final = self.helpers[expr] = NonTerminal(self.unique_name(composed))
+                    self.rules += HELPER_RULES[type(expr)](expr, final)
+                    worklist += [(index, helper_position) for helper_position in range(begin, end)]
+                renamed[temporary] = final
+            yield self.rules[i].defined, rename(converted[position])
+            i += 1
+
+    def convert(self) -> EBNF:
+        # Expression nodes are hash-consed, so they are used as keys directly;
+        # dictionaries with `None` values serve as insertion-ordered sets.
+        converted_rules_dict: Dict[NonTerminal, Dict[Expression, None]] = {}
+        converted = self.convert_rules() if self.jobs == 1 else self.convert_rules_parallel()
+        for defined, new_definition in converted:
+            converted_rules_dict.setdefault(defined, {})[new_definition] = None
+        self.remove_chains(converted_rules_dict)
+        self.remove_useless(converted_rules_dict)
 
         converted_rules = []
-        for lhs, defs in converted_rules_dict.items():
-            defined_nt = str_to_expr[lhs]
-            if defined_nt.value in used_non_terminals_names or defined_nt.value == self.start.value:
-                def_exprs = []
-                for d in defs:
-                    if isinstance(str_to_expr[d], Seq):
-                        def_exprs.append(Seq(self.remove_nested_seqs(str_to_expr[d])))
-                    else:
-                        def_exprs.append(str_to_expr[d])
-                if len(def_exprs) > 1:
-                    d = Alt(def_exprs)
+        for defined_nt, defs in converted_rules_dict.items():
+            def_exprs = []
+            for d in defs:
+                if isinstance(d, Seq):
+                    def_exprs.append(Seq(self.remove_nested_seqs(d)))
                 else:
-                    d = def_exprs[0]
-                converted_rules.append(Rule(defined_nt, d))
+                    def_exprs.append(d)
+            converted_rules.append(Rule(defined_nt, fold_alt(def_exprs)))
 
         return make_grammar(self.start, converted_rules, [])
 
-    def remove_chains(self, v: str, used: Dict[str, bool], graph: Dict[str, Set[str]],
-                      to_expr: Dict[str, Expression]) -> Set[str]:
-        if used.get(v, False):
-            return graph.get(v, set())
-        used[v] = True
-        new_defs = set()
-        for definition in graph[v]:
-            expr = to_expr[definition]
-            if isinstance(expr, NonTerminal):
-                new_defs |= self.remove_chains(definition, used, graph, to_expr)
-            else:
-                new_defs.add(definition)
-        graph[v] = new_defs
-        return new_defs
+    def remove_chains(self, graph: Dict[NonTerminal, Dict[Expression, None]]):
+        """
+        Replaces chain rules `A := B` by the definitions of `B`, in place.
+        Non-terminals reaching each other by chain rules form strongly
+        connected components, whose members share their definitions; a
+        component is completed after every component it has chain rules to.
+        """
+        def chains(v: NonTerminal) -> Iterator[NonTerminal]:
+            return (d for d in graph.get(v, ()) if isinstance(d, NonTerminal))
+
+        for component in strongly_connected_components(list(graph), chains):
+            self.merge_component(component, graph)
+
+    def merge_component(self, component: List[NonTerminal],
+                        graph: Dict[NonTerminal, Dict[Expression, None]]):
+        # Definitions in order, those of chained non-terminals in place of
+        # the chain rule; other components are already completed
+        members = set(component)
+        new_defs: Dict[Expression, None] = {}
+        for u in component:
+            for definition in graph.get(u, ()):
+                if not isinstance(definition, NonTerminal):
+                    new_defs[definition] = None
+                elif definition not in members:
+                    new_defs.update(graph.get(definition, {}))
+        for u in component:
+            if u in graph:
+                graph[u] = new_defs
+
+    def remove_useless(self, graph: Dict[NonTerminal, Dict[Expression, None]]):
+        """
+        Removes definitions using unproductive non-terminals, then
+        non-terminals unreachable from the start symbol, in place. Every
+        definition counts its non-terminals not yet known to be productive.
+        """
+        used: Dict[Tuple[NonTerminal, Expression], Set[NonTerminal]] = {}
+        remaining: Dict[Tuple[NonTerminal, Expression], int] = {}
+        occurrences: Dict[NonTerminal, List[Tuple[NonTerminal, Expression]]] = {}
+        productive: Set[NonTerminal] = set()
+        worklist = []
+        for defined, defs in graph.items():
+            for definition in defs:
+                non_terminals = {node for node in walk(definition, SEQ_CHILDREN) if isinstance(node, NonTerminal)}
+                used[defined, definition] = non_terminals
+                remaining[defined, definition] = len(non_terminals)
+                for nt in non_terminals:
+                    occurrences.setdefault(nt, []).append((defined, definition))
+                if not non_terminals and defined not in productive:
+                    productive.add(defined)
+                    worklist.append(defined)
+        while worklist:
+            nt = worklist.pop()
+            for defined, definition in occurrences.get(nt, ()):
+                remaining[defined, definition] -= 1
+                if not remaining[defined, definition] and defined not in productive:
+                    productive.add(defined)
+                    worklist.append(defined)
+
+        for defined, defs in graph.items():
+            graph[defined] = {definition: None for definition in defs if not remaining[defined, definition]}
+
+        reachable = {self.start}
+        worklist = [self.start]
+        while worklist:
+            defined = worklist.pop()
+            for definition in graph.get(defined, ()):
+                for nt in used[defined, definition]:
+                    if nt not in reachable:
+                        reachable.add(nt)
+                        worklist.append(nt)
+        for defined in list(graph):
+            if defined not in reachable or not graph[defined]:
+                del graph[defined]
+
+
+class ShardConverter(Converter):
+    """
+    Converts the rules of one shard for `Converter.convert_rules_parallel`.
+    Helpers get temporary names starting with the index of the shard, and
+    their composed names are kept for the final naming.
+    """
+
+    def __init__(self, grammar: EBNF, readable: bool, shard: int):
+        super().__init__(grammar, readable)
+        self.shard = shard
+        self.composed: List[Union[str, None]] = []
+
+    def compose_nt_name(self, expr: Expression) -> str:
+        self.composed.append(None if self.readable else fold(expr, self.name_algebra, memo=self.name_memo))
+        return self.prime(f"{self.shard}#{len(self.composed)}")
+
+    def convert_shard(self, definitions: List[Expression]) -> Tuple[List[Expression], List[List[NonTerminal]],
+                                                                     Dict[NonTerminal, Tuple]]:
+        """
+        Converted definitions of the rules of the shard followed by those of
+        its helpers, as `convert_rules` orders them, with the helpers every
+        rule meets, and for every helper its expression, composed name and
+        range of rules
+        """
+        converted: List[Expression] = []
+        met: List[List[NonTerminal]] = []
+        bounds: Dict[NonTerminal, List[int]] = {}
+        i = 0
+        while i < len(definitions):
+            new_definition, new_rules = self.convert_expr(definitions[i])
+            converted.append(new_definition)
+            met.append([self.helpers[expr] for expr in helpers_used(definitions[i])])
+            for rule in new_rules:
+                bounds.setdefault(rule.defined, [len(definitions), len(definitions)])[1] += 1
+                definitions.append(rule.definition)
+            i += 1
+        helpers = {temporary: (expr, composed, *bounds[temporary])
+                   for (expr, temporary), composed in zip(self.helpers.items(), self.composed)}
+        return converted, met, helpers
+
+
+def dumps(value: Any) -> bytes:
+    # Expressions are stored in flat arrays, as in the cache, so their
+    # depth is not limited by the recursion of `pickle`
+    output = io.BytesIO()
+    dump_entry(value, output)
+    return output.getvalue()
+
+
+def loads(data: bytes) -> Any:
+    return load_entry(io.BytesIO(data))
+
+
+# Grammar without rules of the worker process, for shard converters
+shard_grammar: Union[EBNF, None] = None
+shard_readable = False
+
+
+def init_shard_worker(names: Dict[str, Terminal], non_terminals: Set[str], readable: bool):
+    global shard_grammar, shard_readable
+    shard_grammar = EBNF(None, set(), non_terminals, [], names)
+    shard_readable = readable
+
+
+def convert_shard(shard: Tuple[int, bytes]) -> bytes:
+    index, definitions = shard
+    return dumps(ShardConverter(shard_grammar, shard_readable, index).convert_shard(loads(definitions)))
+
+
+def convert_file(input_file: str, readable: bool, cache: GrammarCache = None,
+                 jobs: int = 1) -> Tuple[Union[EBNF, None], Diagnostics]:
+    """
+    Parses and converts a grammar; the result is `None` when the grammar
+    is incorrect. With `cache` both steps are looked up by the contents of
+    the file first; the number of `jobs` does not change the result.
+    """
+    if cache is None:
+        ebnf, diagnostics = ebnf_parser.parse_ebnf(input_file)
+        return (None if ebnf is None else Converter(ebnf, readable, jobs).convert()), diagnostics
+    with open(input_file, "rb") as grammar_definition:
+        content = grammar_definition.read()
+
+    def convert():
+        ebnf, diagnostics = cache.cached(cache.key(content, "parse"),
+                                         lambda: ebnf_parser.parse_ebnf(input_file))
+        return (None if ebnf is None else Converter(ebnf, readable, jobs).convert()), diagnostics
+
+    return cache.cached(cache.key(content, "convert", readable), convert)
+
+
+def convert_to_file(input_file: str, output_file: str, readable: bool, ply: bool,
+                    cache: GrammarCache = None, jobs: int = 1) -> Tuple[bool, Diagnostics]:
+    """
+    Converts a grammar and writes the result to `output_file`: the grammar
+    in classic form, or a PLY module with `ply`. Returns whether the grammar
+    is correct; an incorrect one yields no PLY module.
+    """
+    cfg, diagnostics = convert_file(input_file, readable, cache, jobs)
+    if ply:
+        if cfg is not None:
+            write_ply_module(cfg, output_file)
+        return cfg is not None, diagnostics
+    with open(output_file, "w") as processed_grammar:
+        if cfg is None:
+            print("Grammar is incorrect, cannot parse",
+                  file=processed_grammar)
+        else:
+            print_grammar(cfg, processed_grammar)
+    return cfg is not None, diagnostics
+
+
+# Batch conversion
+#
+# Grammars are converted by a pool of worker processes, each building the
+# parser and opening the cache once and then taking files in chunks. A
+# failing file, whether the grammar is incorrect or converting it raises,
+# is reported and the batch goes on.
+
+# Grammar files taken from directories given to a batch
+GRAMMAR_SUFFIXES = (".ebnf", ".in")
+
+# Files handed to a worker at once
+BATCH_CHUNK = 8
+
+
+@dataclass
+class BatchResult:
+    input_file: str
+    converted: bool
+    diagnostics: Diagnostics
+    error: Union[str, None] = None
+
+
+# Cache opened by the worker process
+batch_cache: Union[GrammarCache, None] = None
+
+
+def batch_files(paths: List[str]) -> List[str]:
+    """
+    Files given as is, and grammar files found under directories, in order
+    """
+    files = []
+    for path in paths:
+        if not os.path.isdir(path):
+            files.append(path)
+            continue
+        for directory, subdirectories, names in os.walk(path):
+            subdirectories.sort()
+            files.extend(os.path.join(directory, name) for name in sorted(names)
+                         if name.endswith(GRAMMAR_SUFFIXES))
+    return files
+
+
+def init_batch_worker(cache_directory: Union[str, None]):
+    global batch_cache
+    ebnf_parser.default_parser()
+    batch_cache = GrammarCache(cache_directory) if cache_directory else None
+
+
+def convert_batch_file(input_file: str, readable: bool, ply: bool) -> BatchResult:
+    output_file = input_file + (".py" if ply else ".out")
+    try:
+        converted, diagnostics = convert_to_file(input_file, output_file, readable, ply, batch_cache)
+    except Exception as error:
+        return BatchResult(input_file, False, Diagnostics(), f"{type(error).__name__}: {error}")
+    return BatchResult(input_file, converted, diagnostics)
+
+
+def convert_batch(files: List[str], readable: bool, ply: bool, cache_directory: str = None,
+                  jobs: int = None) -> Iterator[BatchResult]:
+    """
+    Converts every file to the file named as by `converter.py` for a single
+    input, yielding results in the order of `files`. With one job files are
+    converted in this process.
+    """
+    convert = partial(convert_batch_file, readable=readable, ply=ply)
+    if jobs == 1:
+        init_batch_worker(cache_directory)
+        yield from map(convert, files)
+        return
+    with ProcessPoolExecutor(jobs, initializer=init_batch_worker, initargs=(cache_directory,)) as pool:
+        yield from pool.map(convert, files, chunksize=BATCH_CHUNK)
+
+
+def run_batch(paths: List[str], readable: bool, ply: bool, cache_directory: str = None,
+              jobs: int = None) -> int:
+    """
+    Returns the number of files that failed
+    """
+    failed = 0
+    for result in convert_batch(batch_files(paths), readable, ply, cache_directory, jobs):
+        if result.diagnostics.total:
+            print(f"{result.input_file}:", file=sys.stderr)
+            result.diagnostics.write(sys.stderr)
+        if result.error is not None:
+            print(f"{result.input_file}: {result.error}", file=sys.stderr)
+        elif not result.converted:
+            print(f"{result.input_file}: Grammar is incorrect, cannot parse", file=sys.stderr)
+        failed += not result.converted
+    return failed
 
 
 def main():
     p = argparse.ArgumentParser("Converts CF formal grammar from EBNF to classic form")
     p.add_argument("-r", '--readable', dest='readable', action="store_true")
-    p.add_argument('input', nargs=1, type=str)
-    p.add_argument('output', nargs='?')
+    p.add_argument("-p", '--ply', dest='ply', action="store_true",
+                   help="write a PLY parser module and generate its tables")
+    p.add_argument("-c", '--cache', metavar="DIR",
+                   help="reuse parsed and converted grammars stored in a directory")
+    p.add_argument("-b", '--batch', action="store_true",
+                   help="convert every given file and every grammar file (" + ", ".join(GRAMMAR_SUFFIXES) +
+                        ") in the given directories, writing outputs next to them")
+    p.add_argument("-j", '--jobs', type=int,
+                   help="worker processes converting files with --batch, by default one per CPU")
+    p.add_argument('input', nargs='+', help="input file and optional output file, or inputs with --batch")
     args = p.parse_args()
-    if not args.output:
-        args.output = args.input[0] + ".out"
-    ebnf = ebnf_parser.parse_ebnf(args.input[0])
-    with open(args.output, "w") as processed_grammar:
-        if ebnf is None:
-            print("Grammar is incorrect, cannot parse",
-                  file=processed_grammar)
-        else:
-            cfg = Converter(ebnf, args.readable).convert()
-            print(show_grammar(cfg), file=processed_grammar)
+    if args.batch:
+        failed = run_batch(args.input, args.readable, args.ply, args.cache, args.jobs)
+        if failed:
+            print(f"{failed} of the grammars failed", file=sys.stderr)
+            sys.exit(1)
+        return
+    if len(args.input) > 2:
+        p.error("expected an input file and an optional output file")
+    if args.jobs is not None:
+        p.error("--jobs is only used with --batch")
+    input_file = args.input[0]
+    output_file = args.input[1] if len(args.input) > 1 else input_file + (".py" if args.ply else ".out")
+    cache = GrammarCache(args.cache) if args.cache else None
+    converted, diagnostics = convert_to_file(input_file, output_file, args.readable, args.ply, cache)
+    diagnostics.write(sys.stderr)
+    if args.ply and not converted:
+        print("Grammar is incorrect, cannot parse", file=sys.stderr)
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,87 @@
+from dataclasses import dataclass
+from typing import Iterator, List, TextIO
+
+# Errors found while lexing and parsing grammar definitions
+
+ILLEGAL_CHARACTER = "illegal character"
+UNKNOWN_KEYWORD = "unknown keyword"
+SYNTAX_ERROR = "syntax error"
+UNEXPECTED_END = "unexpected end"
+
+DEFAULT_LIMIT = 100
+
+
+@dataclass
+class Diagnostic:
+    kind: str
+    text: str
+    offset: int
+    line: int
+    column: int
+
+    def __str__(self) -> str:
+        if self.kind == SYNTAX_ERROR:
+            return f"Syntax error: Unexpected {self.text} on line {self.line}"
+        elif self.kind == UNEXPECTED_END:
+            return f"Syntax error: Unexpected {self.text}"
+        elif self.kind == ILLEGAL_CHARACTER:
+            return f"Illegal character {self.text} at line {self.line}, column {self.column}"
+        else:
+            return f"Unknown keyword {self.text} at line {self.line}, column {self.column}"
+
+
+class Diagnostics:
+    """
+    Collector of diagnostics shared by the lexer and the parser.
+
+    At most `limit` diagnostics are kept, later ones are only counted in
+    `dropped`. The lexer moves `line` and `line_start` (the offset where the
+    current line begins) as it scans, so columns are computed without
+    looking back at the input.
+    """
+
+    limit: int
+    items: List[Diagnostic]
+    dropped: int
+    line: int
+    line_start: int
+
+    def __init__(self, limit: int = DEFAULT_LIMIT):
+        self.limit = limit
+        self.items = []
+        self.dropped = 0
+        self.line = 1
+        self.line_start = 0
+
+    @property
+    def full(self) -> bool:
+        return len(self.items) >= self.limit
+
+    @property
+    def total(self) -> int:
+        return len(self.items) + self.dropped
+
+    def new_line(self, line: int, line_start: int):
+        self.line = line
+        self.line_start = line_start
+
+    def report(self, kind: str, text: str, offset: int, line: int):
+        if len(self.items) < self.limit:
+            self.items.append(Diagnostic(kind, text, offset, line, offset - self.line_start + 1))
+        else:
+            self.dropped += 1
+
+    def report_end(self, text: str):
+        if len(self.items) < self.limit:
+            self.items.append(Diagnostic(UNEXPECTED_END, text, -1, self.line, 0))
+        else:
+            self.dropped += 1
+
+    def __iter__(self) -> Iterator[Diagnostic]:
+        return iter(self.items)
+
+    def write(self, output: TextIO):
+        for diagnostic in self.items:
+            print(diagnostic, file=output)
+        if self.dropped:
+            print(f"... and {self.dropped} more errors", file=output)
@@ -0,0 +1,301 @@
+import argparse
+import sys
+from array import array
+from typing import Dict, List, Iterable, Optional, Sequence, Tuple
+
+import ebnf_parser
+from analysis import compute_nullable
+from compiled_grammar import CompiledGrammar, compile_grammar
+from converter import Converter
+from EBNF import EBNF
+
+# Earley parser for grammars in classic form, ambiguous and left-recursive
+# ones included.
+#
+# Items are pairs (dotted rule, origin); dotted rules are numbered so that
+# advancing the dot adds one: `dotted(p, k) = rhs_offsets[p] + p + k`.
+# Nullable symbols are skipped when an item is added (Aycock and Horspool),
+# so empty completions never have to be revisited.
+
+NO_SYMBOL = -1
+
+# Kinds of parse forest nodes
+SYMBOL = 0
+PREFIX = 1
+
+Item = Tuple[int, int]
+ForestNode = Tuple[int, int, int, int]
+
+
+class EarleySet:
+    """
+    Items ending at one input position, indexed by the symbol they expect
+    next (`waiting`) and, for complete ones, by left-hand side (`completed`,
+    the values being sets of origins)
+    """
+
+    def __init__(self):
+        self.items: Dict[Item, None] = {}
+        self.queue: List[Item] = []
+        self.waiting: Dict[int, List[Item]] = {}
+        self.completed: Dict[int, Dict[int, None]] = {}
+        self.predicted: Dict[int, None] = {}
+
+
+class EarleyParser:
+    def __init__(self, grammar: CompiledGrammar):
+        self.grammar = grammar
+        self.nullable = compute_nullable(grammar)
+        self.terminal_ids = {grammar.symbols[terminal]: terminal for terminal in range(grammar.terminal_count)}
+        self.production_start = array("i", (grammar.rhs_offsets[production] + production
+                                            for production in range(grammar.production_count)))
+        self.next_symbol = array("i")
+        self.dotted_lhs = array("i")
+        self.dot = array("i")
+        for production in range(grammar.production_count):
+            length = grammar.rhs_offsets[production + 1] - grammar.rhs_offsets[production]
+            self.next_symbol.extend(grammar.production_rhs(production))
+            self.next_symbol.append(NO_SYMBOL)
+            self.dotted_lhs.extend([grammar.lhs[production]] * (length + 1))
+            self.dot.extend(range(length + 1))
+        # Non-terminals predicted along with a non-terminal, computed on first use
+        self.predictions: Dict[int, List[int]] = {}
+
+    @classmethod
+    def from_grammar(cls, grammar: EBNF) -> "EarleyParser":
+        """
+        Accepts grammars in classic form as they are and converts others
+        """
+        try:
+            return cls(compile_grammar(grammar))
+        except ValueError:
+            return cls(compile_grammar(Converter(grammar, False).convert()))
+
+    def prediction(self, non_terminal: int) -> List[int]:
+        predicted = self.predictions.get(non_terminal)
+        if predicted is None:
+            grammar = self.grammar
+            predicted = [non_terminal]
+            seen = {non_terminal}
+            for current in predicted:
+                for production in grammar.productions(current):
+                    for symbol in grammar.production_rhs(production):
+                        if not grammar.is_terminal(symbol) and symbol not in seen:
+                            seen.add(symbol)
+                            predicted.append(symbol)
+                        if not self.nullable[symbol]:
+                            break
+            self.predictions[non_terminal] = predicted
+        return predicted
+
+    def add(self, earley_set: EarleySet, dotted: int, origin: int):
+        while (dotted, origin) not in earley_set.items:
+            earley_set.items[dotted, origin] = None
+            earley_set.queue.append((dotted, origin))
+            symbol = self.next_symbol[dotted]
+            if symbol == NO_SYMBOL or not self.nullable[symbol]:
+                return
+            dotted += 1
+
+    def predict(self, earley_set: EarleySet, non_terminal: int, position: int):
+        for predicted in self.prediction(non_terminal):
+            if predicted not in earley_set.predicted:
+                earley_set.predicted[predicted] = None
+                for production in self.grammar.productions(predicted):
+                    self.add(earley_set, self.production_start[production], position)
+
+    def close(self, sets: List[EarleySet], position: int):
+        earley_set = sets[position]
+        queue = earley_set.queue
+        index = 0
+        while index < len(queue):
+            dotted, origin = queue[index]
+            index += 1
+            symbol = self.next_symbol[dotted]
+            if symbol != NO_SYMBOL:
+                earley_set.waiting.setdefault(symbol, []).append((dotted, origin))
+                if not self.grammar.is_terminal(symbol) and symbol not in earley_set.predicted:
+                    self.predict(earley_set, symbol, position)
+                continue
+            lhs = self.dotted_lhs[dotted]
+            earley_set.completed.setdefault(lhs, {})[origin] = None
+            # Items expecting a nullable symbol at `position` were advanced when added
+            if origin != position:
+                for waiting_dotted, waiting_origin in sets[origin].waiting.get(lhs, ()):
+                    self.add(earley_set, waiting_dotted + 1, waiting_origin)
+
+    def tokens(self, words: Iterable[str]) -> List[int]:
+        return [self.terminal_ids.get(word, NO_SYMBOL) for word in words]
+
+    def parse(self, tokens: Sequence[int]) -> "Chart":
+        sets = [EarleySet()]
+        self.predict(sets[0], self.grammar.start, 0)
+        self.close(sets, 0)
+        for position, token in enumerate(tokens):
+            next_set = EarleySet()
+            for dotted, origin in sets[position].waiting.get(token, ()):
+                self.add(next_set, dotted + 1, origin)
+            sets.append(next_set)
+            if not next_set.items:
+                break
+            self.close(sets, position + 1)
+        return Chart(self, tokens, sets)
+
+
+class Chart:
+    """
+    Earley sets of one input; when it is rejected the last set is the
+    first one left empty, or the set at the end of input.
+    """
+
+    def __init__(self, parser: EarleyParser, tokens: Sequence[int], sets: List[EarleySet]):
+        self.parser = parser
+        self.tokens = tokens
+        self.sets = sets
+
+    @property
+    def accepted(self) -> bool:
+        return (len(self.sets) == len(self.tokens) + 1 and
+                0 in self.sets[-1].completed.get(self.parser.grammar.start, {}))
+
+    @property
+    def error_position(self) -> Optional[int]:
+        """
+        Index of the first token that cannot be parsed, `len(tokens)` if the
+        input ends too early, None if the input is accepted
+        """
+        if self.accepted:
+            return None
+        if self.sets[-1].items:
+            return len(self.tokens)
+        return len(self.sets) - 2
+
+    def forest(self) -> Optional["ParseForest"]:
+        if not self.accepted:
+            return None
+        return ParseForest(self)
+
+
+class ParseForest:
+    """
+    Shared packed parse forest. Nodes are `(SYMBOL, symbol, begin, end)`
+    for symbols deriving a span of the input, and `(PREFIX, dotted, begin,
+    end)` for the symbols before the dot of a rule deriving a span, which
+    keeps every family binary. `families` maps every node to the list of
+    its alternative derivations, each one a tuple of child nodes.
+    """
+
+    def __init__(self, chart: Chart):
+        self.chart = chart
+        self.root: ForestNode = (SYMBOL, chart.parser.grammar.start, 0, len(chart.tokens))
+        self.families: Dict[ForestNode, List[Tuple[ForestNode, ...]]] = {}
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node in self.families:
+                continue
+            families = self.node_families(node)
+            self.families[node] = families
+            stack.extend(child for family in families for child in family if child not in self.families)
+
+    def node_families(self, node: ForestNode) -> List[Tuple[ForestNode, ...]]:
+        kind, value, begin, end = node
+        parser = self.chart.parser
+        grammar = parser.grammar
+        sets = self.chart.sets
+        if kind == SYMBOL:
+            if grammar.is_terminal(value):
+                return [()]
+            families = []
+            for production in grammar.productions(value):
+                complete = grammar.rhs_offsets[production + 1] + production
+                if (complete, begin) in sets[end].items:
+                    families.append(() if complete == parser.production_start[production]
+                                    else ((PREFIX, complete, begin, end),))
+            return families
+
+        symbol = parser.next_symbol[value - 1]
+        if grammar.is_terminal(symbol):
+            splits = [end - 1] if end > begin and self.chart.tokens[end - 1] == symbol else []
+        else:
+            splits = [split for split in sets[end].completed.get(symbol, ()) if split >= begin]
+        families = []
+        for split in splits:
+            if parser.dot[value] == 1:
+                if split == begin:
+                    families.append(((SYMBOL, symbol, split, end),))
+            elif (value - 1, begin) in sets[split].items:
+                families.append(((PREFIX, value - 1, begin, split), (SYMBOL, symbol, split, end)))
+        return families
+
+    def count_trees(self) -> Optional[int]:
+        """
+        Number of parse trees, None if there are infinitely many
+        """
+        counts: Dict[ForestNode, Optional[int]] = {}
+        on_stack = set()
+        stack = [self.root]
+        while stack:
+            node = stack[-1]
+            if node in counts:
+                stack.pop()
+                continue
+            if node not in on_stack:
+                on_stack.add(node)
+                stack.extend(child for family in self.families[node] for child in family
+                             if child not in counts and child not in on_stack)
+                continue
+            stack.pop()
+            on_stack.discard(node)
+            total = 0
+            for family in self.families[node]:
+                product = 1
+                for child in family:
+                    count = counts.get(child)
+                    if count is None:
+                        product = None
+                        break
+                    product *= count
+                if product is None:
+                    total = None
+                    break
+                total += product
+            counts[node] = total
+        return counts[self.root]
+
+
+def show_result(chart: Chart, line: str) -> str:
+    if not chart.accepted:
+        if chart.error_position == len(chart.tokens):
+            return f"rejected at end of input: {line}"
+        return f"rejected at token {chart.error_position + 1}: {line}"
+    trees = chart.forest().count_trees()
+    if trees is None:
+        return f"accepted, infinitely many trees: {line}"
+    return f"accepted, {trees} tree{'s' if trees != 1 else ''}: {line}"
+
+
+def main():
+    p = argparse.ArgumentParser("Parses sequences of terminals with Earley parser")
+    p.add_argument('input', nargs=1, type=str)
+    p.add_argument('words', nargs=1, type=str,
+                   help="file with a sequence of space separated terminals on every line")
+    p.add_argument('output', nargs='?')
+    args = p.parse_args()
+    if not args.output:
+        args.output = args.words[0] + ".out"
+    ebnf, diagnostics = ebnf_parser.parse_ebnf(args.input[0])
+    diagnostics.write(sys.stderr)
+    with open(args.output, "w") as processed_words:
+        if ebnf is None:
+            print("Grammar is incorrect, cannot parse", file=processed_words)
+            return
+        parser = EarleyParser.from_grammar(ebnf)
+        with open(args.words[0]) as words:
+            for line in words:
+                chart = parser.parse(parser.tokens(line.split()))
+                print(show_result(chart, line.strip()), file=processed_words)
+
+
+if __name__ == "__main__":
+    main()
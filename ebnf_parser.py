@@ -30,25 +30,24 @@
 #       | EPSILON
 
 
-from queue import Empty
+import os
 import sys
+from copy import copy
+from functools import lru_cache
+from typing import Iterable, Tuple
 from EBNF import *
+import lexer
 from lexer import tokens
+from diagnostics import Diagnostics, DEFAULT_LIMIT, SYNTAX_ERROR
 from ply import yacc as yacc
-from sys import argv
-
-global Start, Bindings, Rules
-
-Start: NonTerminal
-Bindings: List[NameBinding] = []
-Rules: List[Rule] = []
 
 
 def p_glob(p):
     """
     glob  : START start NAMES rest
     """
-    p[0] = p[4]
+    bindings, rules = p[4]
+    p[0] = (p[2], bindings, rules)
 
 
 def p_rest(p):
@@ -56,24 +55,17 @@ def p_rest(p):
     rest  : defs RULES rls
           | RULES rls
     """
-    global Bindings, Rules
-
     if len(p) == 3:
-        Rules = p[2]
-        p[0] = p[2]
+        p[0] = ([], p[2])
     else:
-        Bindings = p[1]
-        Rules = p[3]
-        p[0] = p[1]
+        p[0] = (p[1], p[3])
 
 
 def p_start(p):
     """
     start : NON_TERMINAL BIND_END
     """
-    global Start
-
-    Start = NonTerminal(p[1])
+    p[0] = NonTerminal(p[1])
 
 
 def p_defs(p):
@@ -116,13 +108,23 @@ def p_rule(p):
 
 def p_expr(p):
     """
-    expr  : seq
-          | expr ALT_SEP seq
+    expr  : alts
     """
+    p[0] = fold_alt(p[1])
+
+
+def p_alts(p):
+    """
+    alts  : seq
+          | alts ALT_SEP seq
+    """
+    # Alternatives are collected into a list and turned into one flat `Alt`
+    # by `p_expr`, so the number of alternatives does not nest expressions
     if len(p) == 2:
-        p[0] = p[1]
+        p[0] = [Seq(p[1])]
     else:
-        p[0] = make_alt(p[3], p[1])
+        p[1].append(Seq(p[3]))
+        p[0] = p[1]
 
 
 def p_seq(p):
@@ -130,10 +132,12 @@ def p_seq(p):
     seq   : term
           | seq term
     """
+    # Terms are collected into a list and turned into `Seq` once by `p_alts`
     if len(p) == 2:
-        p[0] = Seq([p[1]])
+        p[0] = [p[1]]
     else:
-        p[0] = make_seq(p[1], p[2])
+        p[1].append(p[2])
+        p[0] = p[1]
 
 
 def p_term_nt(p):
@@ -185,39 +189,85 @@ def p_term_o(p):
     p[0] = Optional(p[2])
 
 
-global parser
-global output_file_opened
+def describe_token(p) -> str:
+    if p is None:
+        return "end of file"
+    return f"{p.type}({p.value}) on line {p.lineno}"
 
 
 def p_error(p):
-    if p == None:
-        token = "end of file"
-        parser.errok()
-    else:
-        token = f"{p.type}({p.value}) on line {p.lineno}"
+    print(f"Syntax error: Unexpected {describe_token(p)}", file=sys.stderr)
+
+
+class GrammarParser:
+    """
+    Parser of EBNF grammar definitions.
+
+    LALR tables are built (or loaded from the cached `parsetab` module in
+    `tables_dir`) once, when the object is created. Each `parse` call works
+    on its own copies of the lexer and the parser state, so a single
+    instance can be reused for any number of grammars and shared between
+    threads. With `fast_scanner` input is tokenized by `scanner` instead
+    of the PLY lexer.
+    """
+
+    def __init__(self, tables_dir: str = os.path.dirname(os.path.abspath(__file__)),
+                 fast_scanner: bool = False):
+        self.fast_scanner = fast_scanner
+        self.tables = yacc.yacc(module=sys.modules[__name__], tabmodule="parsetab",
+                                outputdir=tables_dir, debug=False)
+
+    def parse(self, text: str, diagnostics: Diagnostics = None) -> Union[EBNF, None]:
+        if diagnostics is None:
+            diagnostics = Diagnostics()
+        return self.parse_tokens(lexer.tokenize([text], self.fast_scanner, diagnostics),
+                                 diagnostics)
+
+    def parse_tokens(self, tokens: Iterable, diagnostics: Diagnostics = None) -> Union[EBNF, None]:
+        if diagnostics is None:
+            diagnostics = Diagnostics()
+        parser = copy(self.tables)
+        token_stream = iter(tokens)
+
+        def report_error(p):
+            if p is None:
+                parser.errok()
+                diagnostics.report_end("end of file")
+            else:
+                diagnostics.report(SYNTAX_ERROR, f"{p.type}({p.value})", p.lexpos, p.lineno)
+
+        parser.errorfunc = report_error
+        result = parser.parse(lexer=lexer.lexer.clone(),
+                              tokenfunc=lambda: next(token_stream, None))
+        if result is None:
+            return None
 
-    print(f"Syntax error: Unexpected {token}", file=output_file_opened)
+        start, bindings, rules = result
+        try:
+            return make_grammar(start, rules, bindings)
+        except (TypeError, ValueError):
+            return None
 
+    def parse_file(self, input_file: str, diagnostics: Diagnostics = None) -> Union[EBNF, None]:
+        if diagnostics is None:
+            diagnostics = Diagnostics()
+        return self.parse_tokens(
+            lexer.tokenize_file(input_file, fast=self.fast_scanner, diagnostics=diagnostics),
+            diagnostics)
 
-def parse_ebnf(input_file: str, debug_output: str = "parser_debug.out") -> Union[EBNF, None]:
-    global parser, output_file_opened
-    parser = yacc.yacc(debugfile=debug_output)
-    output_file_opened = open(debug_output, "w")
 
+@lru_cache(maxsize=None)
+def default_parser() -> GrammarParser:
+    return GrammarParser()
 
-    with open(input_file, "r") as grammar_definition:
-        file = grammar_definition.readlines()
-        parser.parse("".join(file))
-        try:
-            ebnf = make_grammar(Start, Rules, Bindings)
-            return ebnf
-        except TypeError or ValueError:
-            return None
 
+def parse_ebnf(input_file: str,
+               max_diagnostics: int = DEFAULT_LIMIT) -> Tuple[Union[EBNF, None], Diagnostics]:
+    diagnostics = Diagnostics(max_diagnostics)
+    return default_parser().parse_file(input_file, diagnostics), diagnostics
 
-def main():
-    global parser, output_file_opened
 
+def main():
     if len(sys.argv) > 1:
         input_file = sys.argv[1]
         if len(sys.argv) > 2:
@@ -225,15 +275,14 @@ def main():
         else:
             output_file = input_file + ".out"
 
-        ebnf = parse_ebnf(input_file, output_file)
-
-        if ebnf is None:
-            print("Grammar is incorrect, cannot parse",
-                  file=output_file_opened)
-        else:
-            print(show_grammar(ebnf), file=output_file_opened)
-
-        output_file_opened.close()
+        ebnf, diagnostics = parse_ebnf(input_file)
+        with open(output_file, "w") as output_file_opened:
+            diagnostics.write(output_file_opened)
+            if ebnf is None:
+                print("Grammar is incorrect, cannot parse",
+                      file=output_file_opened)
+            else:
+                print_grammar(ebnf, output_file_opened)
     else:
         print("Expected at least one argument: input file containing grammar")
 
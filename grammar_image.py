@@ -0,0 +1,244 @@
+import argparse
+import mmap
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Union
+
+import ebnf_parser
+from compiled_grammar import CompiledGrammar, compile_grammar, show_compiled
+from converter import Converter
+from EBNF import *
+from node_table import NodeTable, NodeTableWriter
+
+# Binary images of grammars, for passing them between tools without
+# printing and parsing them again.
+#
+# An image holds the string table and the node arrays of `node_table` for
+# the expressions of the grammar. Rules, name bindings
+# and the sets of terminals and non-terminals refer to nodes and strings
+# by index. Images of grammars in classic form also hold the arrays of the
+# compiled grammar.
+#
+# All sections are arrays of little-endian 32-bit integers, except the
+# string bytes and the node kinds, which are padded to 4 bytes. A loaded
+# image reads the arrays in place from the mapped file: strings and nodes
+# are only created when they are accessed.
+
+MAGIC = b"EBNI"
+VERSION = 1
+HEADER = struct.Struct("<4sIIIIIIIIIII")
+COMPILED_HEADER = struct.Struct("<IIIII")
+
+# Flags
+COMPILED = 1
+
+
+class ImageWriter(NodeTableWriter):
+    def write(self, grammar: EBNF, output: BinaryIO):
+        start = self.node(grammar.start)
+        defined = array("i", (self.node(rule.defined) for rule in grammar.rules))
+        definitions = array("i", (self.node(rule.definition) for rule in grammar.rules))
+        binding_names = array("i", (self.string(name) for name in grammar.name_bindings))
+        binding_values = array("i", (self.node(value) for value in grammar.name_bindings.values()))
+        terminals = array("i", (self.string(terminal) for terminal in sorted(grammar.terminals)))
+        non_terminals = array("i", (self.string(non_terminal) for non_terminal in sorted(grammar.non_terminals)))
+        try:
+            compiled = compile_grammar(grammar)
+        except ValueError:
+            compiled = None
+        if compiled is not None:
+            symbols = array("i", (self.string(symbol) for symbol in compiled.symbols))
+
+        string_offsets, string_bytes = self.string_table()
+        output.write(HEADER.pack(MAGIC, VERSION, COMPILED if compiled is not None else 0, start,
+                                 len(self.strings), string_offsets[-1], len(self.kinds), len(self.payload),
+                                 len(grammar.rules), len(grammar.name_bindings),
+                                 len(terminals), len(non_terminals)))
+        write_array(output, string_offsets)
+        write_padded(output, string_bytes)
+        write_padded(output, bytes(self.kinds))
+        for values in (self.node_offsets, self.payload, defined, definitions,
+                       binding_names, binding_values, terminals, non_terminals):
+            write_array(output, values)
+        if compiled is not None:
+            output.write(COMPILED_HEADER.pack(compiled.symbol_count, compiled.terminal_count, compiled.start,
+                                              compiled.production_count, len(compiled.rhs)))
+            for values in (symbols, compiled.lhs, compiled.rhs_offsets, compiled.rhs,
+                           compiled.production_offsets):
+                write_array(output, values)
+
+
+def write_grammar(grammar: EBNF, output: BinaryIO):
+    ImageWriter().write(grammar, output)
+
+
+def write_array(output: BinaryIO, values: array):
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    output.write(values.tobytes())
+
+
+def write_padded(output: BinaryIO, data: bytes):
+    output.write(data)
+    output.write(bytes(-len(data) % 4))
+
+
+class GrammarImage:
+    """
+    Grammar read from an image in a `bytes`-like buffer (`bytes`, `mmap`).
+    Arrays are views of the buffer, so the buffer must stay open while the
+    image is used; on big-endian machines they are copied and byteswapped.
+    """
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap]):
+        self.source = buffer
+        self.buffer = memoryview(buffer)
+        if len(self.buffer) < HEADER.size:
+            raise ValueError("Not a grammar image or unsupported version")
+        (magic, version, self.flags, self.start_node, string_count, strings_size, node_count, payload_size,
+         rule_count, binding_count, terminal_count, non_terminal_count) = HEADER.unpack_from(self.buffer)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a grammar image or unsupported version")
+        self.offset = HEADER.size
+        self.table = NodeTable(self.read_array(string_count + 1), self.read_bytes(strings_size),
+                               self.read_bytes(node_count), self.read_array(node_count + 1),
+                               self.read_array(payload_size))
+        self.defined = self.read_array(rule_count)
+        self.definitions = self.read_array(rule_count)
+        self.binding_names = self.read_array(binding_count)
+        self.binding_values = self.read_array(binding_count)
+        self.terminal_names = self.read_array(terminal_count)
+        self.non_terminal_names = self.read_array(non_terminal_count)
+        self.compiled_arrays = []
+        if self.flags & COMPILED:
+            symbol_count, self.compiled_terminal_count, self.compiled_start, production_count, rhs_size = \
+                COMPILED_HEADER.unpack_from(self.buffer, self.offset)
+            self.offset += COMPILED_HEADER.size
+            self.compiled_arrays = [self.read_array(count) for count in (
+                symbol_count, production_count, production_count + 1, rhs_size,
+                symbol_count - self.compiled_terminal_count + 1)]
+
+    @classmethod
+    def from_file(cls, input_file: str) -> "GrammarImage":
+        with open(input_file, "rb") as image:
+            try:
+                buffer = mmap.mmap(image.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                buffer = b""
+        return cls(buffer)
+
+    def close(self):
+        for view in [self.table.string_offsets, self.table.node_offsets, self.table.payload,
+                     self.defined, self.definitions,
+                     self.binding_names, self.binding_values, self.terminal_names, self.non_terminal_names,
+                     *self.compiled_arrays]:
+            if isinstance(view, memoryview):
+                view.release()
+        self.table.string_bytes.release()
+        self.table.kinds.release()
+        self.buffer.release()
+        if isinstance(self.source, mmap.mmap):
+            self.source.close()
+
+    def __enter__(self) -> "GrammarImage":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def read_bytes(self, size: int) -> memoryview:
+        if self.offset + size > len(self.buffer):
+            raise ValueError("Grammar image is truncated")
+        view = self.buffer[self.offset:self.offset + size]
+        self.offset += size + -size % 4
+        return view
+
+    def read_array(self, count: int) -> Union[memoryview, array]:
+        view = self.read_bytes(4 * count).cast("i")
+        if sys.byteorder == "big":
+            values = array("i", view)
+            values.byteswap()
+            return values
+        return view
+
+    def string(self, index: int) -> str:
+        return self.table.string(index)
+
+    def node(self, index: int) -> Expression:
+        return self.table.node(index)
+
+    @property
+    def rule_count(self) -> int:
+        return len(self.defined)
+
+    def rule(self, index: int) -> Rule:
+        return Rule(self.node(self.defined[index]), self.node(self.definitions[index]))
+
+    def to_grammar(self) -> EBNF:
+        return EBNF(self.node(self.start_node),
+                    {self.string(terminal) for terminal in self.terminal_names},
+                    {self.string(non_terminal) for non_terminal in self.non_terminal_names},
+                    [self.rule(index) for index in range(self.rule_count)],
+                    {self.string(name): self.node(value)
+                     for name, value in zip(self.binding_names, self.binding_values)})
+
+    def compiled(self) -> CompiledGrammar:
+        """
+        The compiled grammar stored with a grammar in classic form
+        """
+        if not self.compiled_arrays:
+            raise ValueError("Grammar is not in classic form, convert it first")
+        symbols, *arrays = self.compiled_arrays
+        return CompiledGrammar([self.string(symbol) for symbol in symbols], self.compiled_terminal_count,
+                               self.compiled_start, *(copy_array(values) for values in arrays))
+
+
+def copy_array(values: Union[memoryview, array]) -> array:
+    if isinstance(values, array):
+        return values
+    copied = array("i")
+    copied.frombytes(values.cast("B"))
+    return copied
+
+
+def load_grammar(input_file: str) -> EBNF:
+    with GrammarImage.from_file(input_file) as image:
+        return image.to_grammar()
+
+
+def main():
+    p = argparse.ArgumentParser("Writes binary images of CF formal grammars converted to classic form, "
+                                "or shows saved images")
+    p.add_argument('input', nargs=1, type=str)
+    p.add_argument('output', nargs='?')
+    p.add_argument("-p", "--parsed", action="store_true", help="write the grammar as parsed, not converted")
+    mode = p.add_mutually_exclusive_group()
+    mode.add_argument("-s", "--show", action="store_true", help="print the grammar saved in an image")
+    mode.add_argument("-c", "--compiled", action="store_true",
+                      help="print the compiled grammar saved in an image")
+    args = p.parse_args()
+    if args.show or args.compiled:
+        if not args.output:
+            args.output = args.input[0] + ".out"
+        with GrammarImage.from_file(args.input[0]) as image, open(args.output, "w") as processed_grammar:
+            if args.compiled:
+                print(show_compiled(image.compiled()), file=processed_grammar)
+            else:
+                print_grammar(image.to_grammar(), processed_grammar)
+        return
+    if not args.output:
+        args.output = args.input[0] + ".bin"
+    ebnf, diagnostics = ebnf_parser.parse_ebnf(args.input[0])
+    diagnostics.write(sys.stderr)
+    if ebnf is None:
+        print("Grammar is incorrect, cannot parse", file=sys.stderr)
+        sys.exit(1)
+    with open(args.output, "wb") as image:
+        write_grammar(ebnf if args.parsed else Converter(ebnf, False).convert(), image)
+
+
+if __name__ == "__main__":
+    main()
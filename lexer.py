@@ -1,15 +1,15 @@
+import mmap
+import os
 import sys
+from typing import Iterable, Iterator
 from ply.lex import TOKEN
 import ply.lex as lex
 from tokens import *
-import logging
+import scanner
+from EBNF import write_fragments
+from diagnostics import Diagnostics, ILLEGAL_CHARACTER, UNKNOWN_KEYWORD
 
-logging.basicConfig(
-    filename="lex.log", level=logging.WARNING, filemode="w"
-)
-
-reserved = {"start:": "START", "rules:": "RULES",
-            "names:": "NAMES", "EPS": "EPSILON"}
+reserved = RESERVED
 
 tokens = (
     [
@@ -44,12 +44,21 @@ t_ignore = r" "
 def t_newline(token):
     r"\n+"
     token.lexer.lineno += len(token.value)
+    if token.lexer.diagnostics is not None:
+        token.lexer.diagnostics.new_line(
+            token.lexer.lineno, token.lexer.offset + token.lexpos + len(token.value)
+        )
+
+
+def report_error(token, kind: str, text: str):
+    if token.lexer.diagnostics is not None:
+        token.lexer.diagnostics.report(
+            kind, text, token.lexer.offset + token.lexpos, token.lineno
+        )
 
 
 def t_error(token):
-    logging.warning(
-        f"Illegal character {token.value[0]} at position {token.lexer.lexpos} at line {token.lexer.lineno}"
-    )
+    report_error(token, ILLEGAL_CHARACTER, token.value[0])
     token.lexer.skip(1)
 
 
@@ -75,34 +84,90 @@ def t_NAME(token):
 def t_KEYWORD(token):
     token.type = reserved.get(token.value)
     if token.type is None:
-        token = t_error(token)
+        report_error(token, UNKNOWN_KEYWORD, token.value)
+        # The character after an unknown word is skipped as well
+        token.lexer.skip(1)
+        return None
     return token
 
 
 lexer = lex.lex()
-
-
-def do_lex(input_file: str, output_file: str):
-    with open(input_file, "r") as grammar_definition, open(
-        output_file, "w"
-    ) as processed_grammar:
-        lexer.input("".join(grammar_definition.readlines()))
-
-        while True:
-            tok = lexer.token()
-            if not tok:
-                break
-            print(tok, file=processed_grammar)
+# Collector of errors and the offset of the current input in the whole
+# text, set up by `tokenize` for each clone
+lexer.diagnostics = None
+lexer.offset = 0
+
+CHUNK_SIZE = 1 << 20
+
+
+def read_chunks(input_file: str, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    # No token spans a line break, so the memory-mapped file is cut into
+    # pieces of about `chunk_size` bytes ending right after a newline and
+    # only one piece is decoded at a time.
+    with open(input_file, "rb") as grammar_definition:
+        if os.fstat(grammar_definition.fileno()).st_size == 0:
+            return
+        with mmap.mmap(grammar_definition.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            begin = 0
+            size = len(buffer)
+            while begin < size:
+                end = size
+                if begin + chunk_size < size:
+                    end = buffer.rfind(b"\n", begin, begin + chunk_size) + 1
+                    if end <= begin:
+                        end = buffer.find(b"\n", begin + chunk_size) + 1 or size
+                chunk = buffer[begin:end].decode()
+                if "\r" in chunk:
+                    chunk = chunk.replace("\r\n", "\n").replace("\r", "\n")
+                yield chunk
+                begin = end
+
+
+def tokenize(chunks: Iterable[str], fast: bool = False,
+             diagnostics: Diagnostics = None) -> Iterator[lex.LexToken]:
+    if diagnostics is None:
+        diagnostics = Diagnostics()
+    if fast:
+        yield from scanner.tokenize(chunks, diagnostics)
+        return
+
+    chunk_lexer = lexer.clone()
+    chunk_lexer.lineno = 1
+    chunk_lexer.diagnostics = diagnostics
+    for chunk in chunks:
+        chunk_lexer.input(chunk)
+        for tok in iter(chunk_lexer.token, None):
+            tok.lexpos += chunk_lexer.offset
+            yield tok
+        chunk_lexer.offset += len(chunk)
+
+
+def tokenize_file(input_file: str, chunk_size: int = CHUNK_SIZE, fast: bool = False,
+                  diagnostics: Diagnostics = None) -> Iterator[lex.LexToken]:
+    return tokenize(read_chunks(input_file, chunk_size), fast, diagnostics)
+
+
+def do_lex(input_file: str, output_file: str, fast: bool = False,
+           diagnostics: Diagnostics = None) -> Diagnostics:
+    if diagnostics is None:
+        diagnostics = Diagnostics()
+    with open(output_file, "w") as processed_grammar:
+        write_fragments((f"{tok}\n" for tok in tokenize_file(input_file, fast=fast, diagnostics=diagnostics)),
+                        processed_grammar)
+    return diagnostics
 
 
 def main():
-    if len(sys.argv) > 1:
-        input_file = sys.argv[1]
-        if len(sys.argv) > 2:
-            output_file = sys.argv[2]
+    # `--fast` selects the hand-written scanner instead of the PLY lexer
+    args = [arg for arg in sys.argv[1:] if arg != "--fast"]
+    fast = len(args) < len(sys.argv) - 1
+    if len(args) > 0:
+        input_file = args[0]
+        if len(args) > 1:
+            output_file = args[1]
         else:
             output_file = input_file + ".out"
-        do_lex(input_file, output_file)
+        do_lex(input_file, output_file, fast).write(sys.stderr)
 
     else:
         print("Expected at least one argument: input file containing grammar")
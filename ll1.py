@@ -0,0 +1,265 @@
+import argparse
+import struct
+import sys
+from array import array
+from dataclasses import dataclass
+from itertools import chain
+from typing import List, Iterable, BinaryIO
+
+import ebnf_parser
+from analysis import END, GrammarAnalysis
+from compiled_grammar import CompiledGrammar, compile_grammar
+from converter import Converter
+from EBNF import show
+
+# LL(1) parse tables of grammars in classic form.
+#
+# The table maps (non-terminal, lookahead) to a production. It is stored
+# compressed by row displacement: the occupied cells of every row are
+# placed at `base[row] + column` in one shared array `next`, and `check`
+# records which row owns each slot, so rows may interleave where their
+# occupied columns do not collide.
+
+MAGIC = b"LL1T"
+VERSION = 1
+HEADER = struct.Struct("<4sIIIIIII")
+NO_PRODUCTION = -1
+
+
+@dataclass
+class Conflict:
+    non_terminal: int
+    lookahead: int
+    productions: List[int]
+
+
+class LL1Table:
+    grammar: CompiledGrammar
+    base: array
+    next: array
+    check: array
+    conflict_count: int
+
+    def __init__(self, grammar: CompiledGrammar, base: array, next: array, check: array,
+                 conflict_count: int = 0):
+        self.grammar = grammar
+        self.base = base
+        self.next = next
+        self.check = check
+        self.conflict_count = conflict_count
+
+    @property
+    def end(self) -> int:
+        """
+        Column of the end of input
+        """
+        return self.grammar.terminal_count
+
+    def production(self, non_terminal: int, lookahead: int) -> int:
+        row = non_terminal - self.grammar.terminal_count
+        index = self.base[row] + lookahead
+        if 0 <= index < len(self.check) and self.check[index] == row:
+            return self.next[index]
+        return NO_PRODUCTION
+
+    def recognize(self, words: Iterable[str]) -> bool:
+        """
+        Checks whether a sequence of terminal values belongs to the language
+        """
+        if self.conflict_count:
+            # The productions kept in conflicting cells may be left-recursive
+            raise ValueError(f"Table has {self.conflict_count} conflicts, cannot recognize")
+        grammar = self.grammar
+        terminal_ids = {grammar.symbols[terminal]: terminal for terminal in range(grammar.terminal_count)}
+        stack = [grammar.start]
+        for lookahead in chain((terminal_ids.get(word, NO_PRODUCTION) for word in words), [self.end]):
+            if lookahead == NO_PRODUCTION:
+                return False
+            while stack:
+                symbol = stack.pop()
+                if grammar.is_terminal(symbol):
+                    if symbol != lookahead:
+                        return False
+                    break
+                production = self.production(symbol, lookahead)
+                if production == NO_PRODUCTION:
+                    return False
+                stack.extend(reversed(grammar.production_rhs(production)))
+            else:
+                return lookahead == self.end
+        return not stack
+
+    def save(self, output: BinaryIO):
+        grammar = self.grammar
+        names = "\0".join(grammar.symbols).encode("utf-8")
+        output.write(HEADER.pack(MAGIC, VERSION, grammar.terminal_count, grammar.start,
+                                 len(grammar.symbols), len(names), len(self.next), self.conflict_count))
+        output.write(names)
+        output.write(struct.pack("<II", grammar.production_count, len(grammar.rhs)))
+        for values in (grammar.lhs, grammar.rhs_offsets, grammar.rhs, grammar.production_offsets,
+                       self.base, self.next, self.check):
+            write_array(output, values)
+
+    @classmethod
+    def load(cls, input: BinaryIO) -> "LL1Table":
+        magic, version, terminal_count, start, symbol_count, names_size, slots, conflict_count = \
+            HEADER.unpack(input.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not an LL(1) table file or unsupported version")
+        symbols = input.read(names_size).decode("utf-8").split("\0") if symbol_count else []
+        production_count, rhs_size = struct.unpack("<II", input.read(8))
+        non_terminal_count = symbol_count - terminal_count
+        lhs = read_array(input, production_count)
+        rhs_offsets = read_array(input, production_count + 1)
+        rhs = read_array(input, rhs_size)
+        production_offsets = read_array(input, non_terminal_count + 1)
+        grammar = CompiledGrammar(symbols, terminal_count, start, lhs, rhs_offsets, rhs, production_offsets)
+        base = read_array(input, non_terminal_count)
+        return cls(grammar, base, read_array(input, slots), read_array(input, slots), conflict_count)
+
+
+def write_array(output: BinaryIO, values: array):
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    values.tofile(output)
+
+
+def read_array(input: BinaryIO, count: int) -> array:
+    values = array("i")
+    values.fromfile(input, count)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def compress(rows: List[List[tuple]]) -> (array, array, array):
+    """
+    Places rows given as lists of (column, value) with distinct columns
+    into one array, first fit, densest rows first
+    """
+    base = array("i", [0] * len(rows))
+    next = array("i")
+    check = array("i")
+    first_free = 0
+    for row in sorted(range(len(rows)), key=lambda row: -len(rows[row])):
+        cells = rows[row]
+        if not cells:
+            continue
+        offset = first_free - cells[0][0]
+        while True:
+            if all(offset + column >= len(check) or check[offset + column] == NO_PRODUCTION
+                   for column, _ in cells):
+                break
+            offset += 1
+        base[row] = offset
+        last = offset + cells[-1][0]
+        if last >= len(check):
+            next.extend([NO_PRODUCTION] * (last + 1 - len(check)))
+            check.extend([NO_PRODUCTION] * (last + 1 - len(check)))
+        for column, value in cells:
+            next[offset + column] = value
+            check[offset + column] = row
+        while first_free < len(check) and check[first_free] != NO_PRODUCTION:
+            first_free += 1
+    return base, next, check
+
+
+def build_table(analysis: GrammarAnalysis) -> (LL1Table, List[Conflict]):
+    """
+    Builds the table of a grammar and reports every cell claimed by several
+    productions; such cells keep the first production.
+    """
+    grammar = analysis.grammar
+    rows: List[List[tuple]] = []
+    conflicts: List[Conflict] = []
+    for non_terminal in range(grammar.terminal_count, grammar.symbol_count):
+        cells = {}
+        claimed = 0
+        row_conflicts = {}
+        for production in grammar.productions(non_terminal):
+            lookaheads, nullable = analysis.first_of_sequence(grammar.production_rhs(production))
+            if nullable:
+                lookaheads |= analysis.follow[non_terminal]
+            for lookahead in analysis.terminals(lookaheads & ~claimed):
+                cells[lookahead] = production
+            for lookahead in analysis.terminals(lookaheads & claimed):
+                if lookahead in row_conflicts:
+                    row_conflicts[lookahead].productions.append(production)
+                else:
+                    row_conflicts[lookahead] = Conflict(non_terminal, lookahead,
+                                                        [cells[lookahead], production])
+            claimed |= lookaheads
+        rows.append(sorted(cells.items()))
+        conflicts.extend(row_conflicts[lookahead] for lookahead in sorted(row_conflicts))
+    return LL1Table(grammar, *compress(rows), len(conflicts)), conflicts
+
+
+def show_lookahead(grammar: CompiledGrammar, lookahead: int) -> str:
+    if lookahead == grammar.terminal_count:
+        return END
+    return show(grammar.symbol_expr(lookahead))
+
+
+def show_production(grammar: CompiledGrammar, production: int) -> str:
+    rhs = " ".join(show(grammar.symbol_expr(symbol)) for symbol in grammar.production_rhs(production))
+    return f"{show(grammar.symbol_expr(grammar.lhs[production]))} := {rhs or 'EPS'};"
+
+
+def show_table(table: LL1Table, conflicts: List[Conflict]) -> str:
+    nl = "\n"
+    grammar = table.grammar
+    shown_conflicts = "".join(
+        f"  {show(grammar.symbol_expr(conflict.non_terminal))} on {show_lookahead(grammar, conflict.lookahead)}:" +
+        "".join(f" {show_production(grammar, production)}" for production in conflict.productions) + nl
+        for conflict in conflicts)
+    entries = "".join(
+        f"  {show(grammar.symbol_expr(non_terminal))} on {show_lookahead(grammar, lookahead)}: "
+        f"{show_production(grammar, table.production(non_terminal, lookahead))}{nl}"
+        for non_terminal in range(grammar.terminal_count, grammar.symbol_count)
+        for lookahead in range(grammar.terminal_count + 1)
+        if table.production(non_terminal, lookahead) != NO_PRODUCTION)
+    entry_count = sum(1 for row in table.check if row != NO_PRODUCTION)
+    return (f"conflicts:{nl}{shown_conflicts}table:{nl}{entries}"
+            f"compressed:{nl}  {entry_count} entries in {len(table.check)} slots;{nl}")
+
+
+def main():
+    p = argparse.ArgumentParser("Builds LL(1) parse table of a grammar converted to classic form")
+    p.add_argument('input', nargs=1, type=str, help="grammar, or table saved by --save if --load is given")
+    p.add_argument('output', nargs='?')
+    p.add_argument("-l", "--load", action="store_true", help="read a saved table instead of a grammar")
+    p.add_argument("-s", "--save", metavar="TABLE", help="save the table to a file")
+    p.add_argument("-w", "--words", metavar="FILE",
+                   help="recognize every line of a file as a sequence of space separated terminals")
+    args = p.parse_args()
+    if not args.output:
+        args.output = args.input[0] + ".out"
+    with open(args.output, "w") as processed_grammar:
+        if args.load:
+            with open(args.input[0], "rb") as saved_table:
+                table = LL1Table.load(saved_table)
+        else:
+            ebnf, diagnostics = ebnf_parser.parse_ebnf(args.input[0])
+            diagnostics.write(sys.stderr)
+            if ebnf is None:
+                print("Grammar is incorrect, cannot parse", file=processed_grammar)
+                return
+            compiled = compile_grammar(Converter(ebnf, False).convert())
+            table, conflicts = build_table(GrammarAnalysis(compiled))
+            print(show_table(table, conflicts), file=processed_grammar)
+        if args.save:
+            with open(args.save, "wb") as saved_table:
+                table.save(saved_table)
+        if args.words:
+            with open(args.words) as words:
+                try:
+                    for line in words:
+                        result = "accepted" if table.recognize(line.split()) else "rejected"
+                        print(f"{result}: {line.strip()}", file=processed_grammar)
+                except ValueError as error:
+                    print(error, file=processed_grammar)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+import argparse
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import ebnf_parser
+from codegen import classic_productions
+from converter import Converter
+from EBNF import *
+
+# Minimization of grammars in classic form.
+#
+# Useless symbols are removed first: unproductive ones by counting the
+# symbols of every production not yet known to be productive, unreachable
+# ones by a search from the start symbol. Then non-terminals deriving the
+# same productions up to renaming of equivalent non-terminals are merged.
+# They are found by partition refinement: non-terminals start grouped by
+# the shape of their productions, and a block is split when the
+# productions of its members differ in the blocks of the symbols used.
+# When a non-terminal moves to another block only the productions using
+# it are updated, and only their left-hand sides are examined again; when
+# all members of a block are examined, its largest part keeps its place.
+#
+# Non-terminals are numbered from 0, the start symbol first; terminal `t`
+# is encoded as `-t - 1` in productions.
+
+Production = Tuple[int, ...]
+
+HASH_MASK = (1 << 64) - 1
+
+
+@dataclass
+class MinimizationReport:
+    productions_before: int
+    productions_after: int
+    useless: int
+    merged: int
+
+    @property
+    def eliminated(self) -> int:
+        return self.productions_before - self.productions_after
+
+    def __str__(self) -> str:
+        return (f"eliminated {self.eliminated} of {self.productions_before} productions: "
+                f"removed {self.useless} useless non-terminals, merged {self.merged} equivalent ones")
+
+
+class Minimizer:
+    def __init__(self, grammar: EBNF):
+        self.grammar = grammar
+        self.terminal_ids: Dict[str, int] = {}
+        self.non_terminal_ids: Dict[str, int] = {grammar.start.value: 0}
+        self.productions: List[Dict[Production, None]] = [{}]
+        for lhs, symbols in classic_productions(grammar):
+            rhs = tuple(self.symbol_id(symbol) for symbol in symbols)
+            self.productions[self.non_terminal_id(lhs)][rhs] = None
+        self.production_count = sum(map(len, self.productions))
+
+    def non_terminal_id(self, name: str) -> int:
+        non_terminal = self.non_terminal_ids.setdefault(name, len(self.non_terminal_ids))
+        if non_terminal == len(self.productions):
+            self.productions.append({})
+        return non_terminal
+
+    def symbol_id(self, symbol: Union[Terminal, NonTerminal]) -> int:
+        if isinstance(symbol, Terminal):
+            return -self.terminal_ids.setdefault(symbol.value, len(self.terminal_ids)) - 1
+        return self.non_terminal_id(symbol.value)
+
+    def productive(self) -> bytearray:
+        count = len(self.productions)
+        productive = bytearray(count)
+        occurrences: List[List[Tuple[int, int]]] = [[] for _ in range(count)]
+        remaining: Dict[Tuple[int, int], int] = {}
+        worklist = []
+        for lhs, productions in enumerate(self.productions):
+            for index, rhs in enumerate(productions):
+                non_terminals = [symbol for symbol in rhs if symbol >= 0]
+                remaining[lhs, index] = len(non_terminals)
+                for symbol in non_terminals:
+                    occurrences[symbol].append((lhs, index))
+                if not non_terminals and not productive[lhs]:
+                    productive[lhs] = 1
+                    worklist.append(lhs)
+        while worklist:
+            symbol = worklist.pop()
+            for production in occurrences[symbol]:
+                remaining[production] -= 1
+                lhs = production[0]
+                if remaining[production] == 0 and not productive[lhs]:
+                    productive[lhs] = 1
+                    worklist.append(lhs)
+        return productive
+
+    def remove_useless(self) -> int:
+        """
+        Drops productions using unproductive symbols, then productions of
+        unreachable symbols; returns the number of symbols removed
+        """
+        productive = self.productive()
+        for lhs, productions in enumerate(self.productions):
+            self.productions[lhs] = {rhs: None for rhs in productions
+                                     if productive[lhs] and all(symbol < 0 or productive[symbol] for symbol in rhs)}
+        reachable = bytearray(len(self.productions))
+        reachable[0] = 1
+        worklist = [0]
+        while worklist:
+            for rhs in self.productions[worklist.pop()]:
+                for symbol in rhs:
+                    if symbol >= 0 and not reachable[symbol]:
+                        reachable[symbol] = 1
+                        worklist.append(symbol)
+        useless = 0
+        for lhs in range(len(self.productions)):
+            if not reachable[lhs] or not self.productions[lhs]:
+                self.productions[lhs] = {}
+                useless += 1
+        return useless
+
+    def equivalence_blocks(self, live: List[int]) -> List[int]:
+        """
+        Returns the block of the equivalence class of every live non-terminal
+        """
+        block = [0] * len(self.productions)
+        members: List[Dict[int, None]] = [dict.fromkeys(live)]
+        # Productions with non-terminals replaced by their blocks (keys);
+        # the signature of a non-terminal is the set of keys of its
+        # productions, summarized by the sum of their hashes
+        rhs_lists = {non_terminal: list(self.productions[non_terminal]) for non_terminal in live}
+        keys = {non_terminal: [tuple(symbol if symbol < 0 else 0 for symbol in rhs) for rhs in rhs_lists[non_terminal]]
+                for non_terminal in live}
+        key_counts: Dict[int, Dict[Production, int]] = {}
+        signatures: Dict[int, int] = {}
+        occurrences: Dict[int, Dict[Tuple[int, int], None]] = {non_terminal: {} for non_terminal in live}
+        for non_terminal in live:
+            counts = key_counts[non_terminal] = {}
+            for key in keys[non_terminal]:
+                counts[key] = counts.get(key, 0) + 1
+            signatures[non_terminal] = sum(map(hash, counts)) & HASH_MASK
+            for index, rhs in enumerate(rhs_lists[non_terminal]):
+                for symbol in rhs:
+                    if symbol >= 0:
+                        occurrences[symbol][non_terminal, index] = None
+
+        def update_key(user: int, index: int):
+            counts = key_counts[user]
+            old = keys[user][index]
+            counts[old] -= 1
+            if not counts[old]:
+                del counts[old]
+                signatures[user] = (signatures[user] - hash(old)) & HASH_MASK
+            new = tuple(symbol if symbol < 0 else block[symbol] for symbol in rhs_lists[user][index])
+            keys[user][index] = new
+            if new not in counts:
+                counts[new] = 0
+                signatures[user] = (signatures[user] + hash(new)) & HASH_MASK
+            counts[new] += 1
+
+        # Members of a block share its signature unless they are pending
+        block_signatures: List[Union[int, None]] = [None]
+        pending = dict.fromkeys(live)
+        while pending:
+            # Pending non-terminals grouped by block and signature
+            splits: Dict[int, Dict[int, List[int]]] = {}
+            for non_terminal in pending:
+                splits.setdefault(block[non_terminal], {}).setdefault(signatures[non_terminal], []).append(non_terminal)
+            moved = []
+            for current, groups in splits.items():
+                if len(members[current]) == sum(map(len, groups.values())):
+                    staying = max(groups, key=lambda signature: len(groups[signature]))
+                    block_signatures[current] = staying
+                else:
+                    staying = block_signatures[current]
+                for signature, group in groups.items():
+                    if signature == staying:
+                        continue
+                    new_block = len(members)
+                    members.append({})
+                    block_signatures.append(signature)
+                    for non_terminal in group:
+                        del members[current][non_terminal]
+                        members[new_block][non_terminal] = None
+                        block[non_terminal] = new_block
+                        moved.append(non_terminal)
+            pending = {}
+            for non_terminal in moved:
+                for user, index in occurrences[non_terminal]:
+                    update_key(user, index)
+                    pending[user] = None
+            if not pending:
+                # Signatures are compared by hash: split blocks whose members
+                # differ in fact, which only a collision can cause
+                for current in range(len(members)):
+                    exact: Dict[frozenset, List[int]] = {}
+                    for non_terminal in members[current]:
+                        exact.setdefault(frozenset(key_counts[non_terminal]), []).append(non_terminal)
+                    for group in list(exact.values())[1:]:
+                        members.append({})
+                        block_signatures.append(signatures[group[0]])
+                        for non_terminal in group:
+                            del members[current][non_terminal]
+                            members[-1][non_terminal] = None
+                            block[non_terminal] = len(members) - 1
+                            for user, index in occurrences[non_terminal]:
+                                update_key(user, index)
+                                pending[user] = None
+        return block
+
+    def minimize(self) -> Tuple[EBNF, MinimizationReport]:
+        useless = self.remove_useless()
+        live = [non_terminal for non_terminal, productions in enumerate(self.productions) if productions]
+        blocks = self.equivalence_blocks(live)
+        # The first member of every block represents it, the start symbol
+        # being the first non-terminal
+        representatives: Dict[int, int] = {}
+        for non_terminal in live:
+            representatives.setdefault(blocks[non_terminal], non_terminal)
+
+        names = list(self.non_terminal_ids)
+        terminals = list(self.terminal_ids)
+
+        def expr(symbol: int) -> Union[Terminal, NonTerminal]:
+            if symbol < 0:
+                return Terminal(terminals[-symbol - 1])
+            return NonTerminal(names[representatives[blocks[symbol]]])
+
+        rules = []
+        production_count = 0
+        for non_terminal in live:
+            if representatives[blocks[non_terminal]] != non_terminal:
+                continue
+            alternatives: Dict[Expression, None] = {}
+            for rhs in self.productions[non_terminal]:
+                symbols = [expr(symbol) for symbol in rhs]
+                if symbols == [NonTerminal(names[non_terminal])]:
+                    continue
+                alternatives[fold_seq(symbols) if symbols else EPS] = None
+            production_count += len(alternatives)
+            rules.append(Rule(NonTerminal(names[non_terminal]), fold_alt(list(alternatives))))
+
+        report = MinimizationReport(self.production_count, production_count, useless,
+                                    len(live) - len(representatives))
+        return make_grammar(self.grammar.start, rules, []), report
+
+
+def minimize(grammar: EBNF) -> Tuple[EBNF, MinimizationReport]:
+    """
+    Minimizes a grammar in classic form, as produced by `Converter.convert`
+    """
+    return Minimizer(grammar).minimize()
+
+
+def main():
+    p = argparse.ArgumentParser("Converts CF formal grammar from EBNF to classic form and minimizes it")
+    p.add_argument('input', nargs=1, type=str)
+    p.add_argument('output', nargs='?')
+    args = p.parse_args()
+    if not args.output:
+        args.output = args.input[0] + ".out"
+    ebnf, diagnostics = ebnf_parser.parse_ebnf(args.input[0])
+    diagnostics.write(sys.stderr)
+    with open(args.output, "w") as processed_grammar:
+        if ebnf is None:
+            print("Grammar is incorrect, cannot parse", file=processed_grammar)
+            return
+        minimized, report = minimize(Converter(ebnf, False).convert())
+        print_grammar(minimized, processed_grammar)
+        print(report, file=processed_grammar)
+
+
+if __name__ == "__main__":
+    main()
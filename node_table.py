@@ -0,0 +1,102 @@
+from array import array
+from typing import Dict, List, Sequence, Union
+
+from EBNF import *
+
+# Expression nodes as flat arrays, shared by grammar images and the cache.
+#
+# Every distinct node is stored once, children before their parents, with
+# its kind and a slice of the payload array holding the indices of its
+# children, or of the string of a terminal, non-terminal or name. Nodes are
+# added and created with explicit stacks, so nesting depth is not limited by
+# the interpreter recursion limit.
+
+KINDS = [Eps, Terminal, NonTerminal, Name, Optional, KleeneStar, Seq, Alt]
+KIND_IDS = {kind: kind_id for kind_id, kind in enumerate(KINDS)}
+LEAVES = {KIND_IDS[Terminal], KIND_IDS[NonTerminal], KIND_IDS[Name]}
+
+
+class NodeTableWriter:
+    def __init__(self):
+        self.strings: Dict[str, int] = {}
+        self.kinds = bytearray()
+        self.node_offsets = array("i", [0])
+        self.payload = array("i")
+        self.memo: Dict[Expression, int] = {}
+        self.algebra = dict.fromkeys(KINDS, self.add_node)
+
+    def string(self, value: str) -> int:
+        return self.strings.setdefault(value, len(self.strings))
+
+    def add_node(self, expr: Expression, args: List[int]) -> int:
+        kind = KIND_IDS[type(expr)]
+        self.kinds.append(kind)
+        if kind in LEAVES:
+            self.payload.append(self.string(expr.value))
+        else:
+            self.payload.extend(args)
+        self.node_offsets.append(len(self.payload))
+        return len(self.kinds) - 1
+
+    def node(self, expr: Expression) -> int:
+        return fold(expr, self.algebra, memo=self.memo)
+
+    def string_table(self) -> (array, bytes):
+        """
+        Offsets of the strings in their UTF-8 encoded concatenation, and the
+        concatenation
+        """
+        encoded = [value.encode("utf-8") for value in self.strings]
+        string_offsets = array("i", [0])
+        for value in encoded:
+            string_offsets.append(string_offsets[-1] + len(value))
+        return string_offsets, b"".join(encoded)
+
+
+class NodeTable:
+    """
+    Nodes read from arrays written by `NodeTableWriter`, which may be views
+    of a buffer; strings and nodes are only created when they are accessed
+    """
+
+    def __init__(self, string_offsets: Sequence[int], string_bytes: Union[bytes, memoryview],
+                 kinds: Sequence[int], node_offsets: Sequence[int], payload: Sequence[int]):
+        self.string_offsets = string_offsets
+        self.string_bytes = string_bytes
+        self.kinds = kinds
+        self.node_offsets = node_offsets
+        self.payload = payload
+        self.strings: List[Union[str, None]] = [None] * (len(string_offsets) - 1)
+        self.nodes: List[Union[Expression, None]] = [None] * len(kinds)
+
+    def string(self, index: int) -> str:
+        value = self.strings[index]
+        if value is None:
+            value = str(self.string_bytes[self.string_offsets[index]:self.string_offsets[index + 1]], "utf-8")
+            self.strings[index] = value
+        return value
+
+    def node(self, index: int) -> Expression:
+        # Children precede their parents, so nodes are created from the
+        # first missing descendant up
+        stack = [index]
+        while stack:
+            current = stack[-1]
+            if self.nodes[current] is not None:
+                stack.pop()
+                continue
+            kind = self.kinds[current]
+            payload = self.payload[self.node_offsets[current]:self.node_offsets[current + 1]]
+            if kind in LEAVES:
+                self.nodes[current] = KINDS[kind](self.string(payload[0]))
+                continue
+            missing = [child for child in payload if self.nodes[child] is None]
+            if missing:
+                stack.extend(missing)
+                continue
+            children = [self.nodes[child] for child in payload]
+            if KINDS[kind] in (Seq, Alt):
+                self.nodes[current] = KINDS[kind](children)
+            else:
+                self.nodes[current] = KINDS[kind](*children)
+        return self.nodes[index]
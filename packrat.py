@@ -0,0 +1,211 @@
+import argparse
+import sys
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Set
+
+import ebnf_parser
+from codegen import check_left_recursion, resolve_name, rule_definitions
+from EBNF import *
+
+# Packrat parser interpreting grammars in EBNF as parsing expressions:
+# alternatives are an ordered choice, repetitions and optional parts are
+# greedy, and nothing is backtracked into once it has matched.
+#
+# Results of non-terminals are memoized by (non-terminal, position). The
+# memo table can be bounded: only non-terminals listed as hot are stored,
+# and with a window only positions close to the furthest one examined are
+# kept, older ones being evicted.
+
+FAIL = -1
+
+
+@dataclass
+class MemoStats:
+    lookups: int = 0
+    hits: int = 0
+    stores: int = 0
+    evictions: int = 0
+    peak_size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def __str__(self) -> str:
+        return (f"memo: {self.lookups} lookups, {self.hits} hits ({self.hit_rate:.1%}), "
+                f"{self.stores} stores, {self.evictions} evictions, peak size {self.peak_size}")
+
+
+class MemoTable:
+    """
+    Results of non-terminals, bucketed by position so that whole positions
+    can be evicted at once
+    """
+
+    def __init__(self, window: int = None, stats: MemoStats = None):
+        self.window = window
+        self.stats = stats if stats is not None else MemoStats()
+        self.buckets: Dict[int, Dict[int, int]] = {}
+        self.size = 0
+        # Positions below `low` have been evicted
+        self.low = 0
+
+    def get(self, rule: int, position: int) -> Union[int, None]:
+        self.stats.lookups += 1
+        result = self.buckets.get(position, {}).get(rule)
+        if result is not None:
+            self.stats.hits += 1
+        return result
+
+    def store(self, rule: int, position: int, result: int):
+        if position < self.low:
+            return
+        self.buckets.setdefault(position, {})[rule] = result
+        self.size += 1
+        self.stats.stores += 1
+        self.stats.peak_size = max(self.stats.peak_size, self.size)
+
+    def advance(self, furthest: int):
+        if self.window is None:
+            return
+        low = furthest - self.window
+        while self.low < low:
+            bucket = self.buckets.pop(self.low, None)
+            if bucket:
+                self.size -= len(bucket)
+                self.stats.evictions += len(bucket)
+            self.low += 1
+
+
+class PackratParser:
+    """
+    Alternatives are tried in the order they are written in the grammar.
+
+    With `hot` only the listed non-terminals are memoized; with `window`
+    results at positions more than `window` tokens behind the furthest one
+    examined are evicted.
+    """
+
+    def __init__(self, grammar: EBNF, hot: Iterable[str] = None, window: int = None):
+        self.grammar = grammar
+        self.definitions = rule_definitions(grammar)
+        check_left_recursion(self.definitions)
+        self.rule_ids = {name: index for index, name in enumerate(self.definitions)}
+        self.hot: Union[Set[str], None] = None if hot is None else set(hot)
+        self.window = window
+        self.steps = {
+            Eps: lambda expr, position, state: position,
+            Terminal: self.step_terminal,
+            Name: lambda expr, position, state: self.step_terminal(resolve_name(self.grammar, expr),
+                                                                   position, state),
+            NonTerminal: self.step_non_terminal,
+            Optional: self.step_optional,
+            KleeneStar: self.step_kleene_star,
+            Seq: self.step_seq,
+            Alt: self.step_alt,
+        }
+
+    def step(self, expr: Expression, position: int, state: "ParseState") -> Union[int, Iterator]:
+        # Steps of compound expressions and non-terminals are generators
+        # yielding the steps of their parts, run by `trampoline`
+        return self.steps[type(expr)](expr, position, state)
+
+    def step_terminal(self, expr: Terminal, position: int, state: "ParseState") -> int:
+        if state.tokens[position] == expr.value:
+            state.furthest = max(state.furthest, position + 1)
+            return position + 1
+        return FAIL
+
+    def step_non_terminal(self, expr: NonTerminal, position: int, state: "ParseState") -> Iterator:
+        rule = self.rule_ids.get(expr.value)
+        if rule is None:
+            return FAIL
+        memoized = self.hot is None or expr.value in self.hot
+        if memoized:
+            result = state.memo.get(rule, position)
+            if result is not None:
+                return result
+        result = yield self.step(self.definitions[expr.value], position, state)
+        if memoized:
+            state.memo.advance(state.furthest)
+            state.memo.store(rule, position, result)
+        return result
+
+    def step_optional(self, expr: Optional, position: int, state: "ParseState") -> Iterator:
+        result = yield self.step(expr.value, position, state)
+        return position if result == FAIL else result
+
+    def step_kleene_star(self, expr: KleeneStar, position: int, state: "ParseState") -> Iterator:
+        while True:
+            result = yield self.step(expr.value, position, state)
+            # Stop on failure and on empty matches, which would repeat forever
+            if result == FAIL or result == position:
+                return position
+            position = result
+
+    def step_seq(self, expr: Seq, position: int, state: "ParseState") -> Iterator:
+        for element in expr.vals:
+            position = yield self.step(element, position, state)
+            if position == FAIL:
+                return FAIL
+        return position
+
+    def step_alt(self, expr: Alt, position: int, state: "ParseState") -> Iterator:
+        for alternative in expr.vals:
+            result = yield self.step(alternative, position, state)
+            if result != FAIL:
+                return result
+        return FAIL
+
+    def parse(self, words: Iterable[str], stats: MemoStats = None) -> int:
+        """
+        Returns the position where the start symbol ends matching `words`,
+        FAIL if it does not match. Memo table statistics are added to
+        `stats` when given.
+        """
+        tokens = list(words)
+        tokens.append(None)
+        state = ParseState(tokens, MemoTable(self.window, stats))
+        return trampoline(self.step(self.grammar.start, 0, state))
+
+    def recognize(self, words: Iterable[str], stats: MemoStats = None) -> bool:
+        tokens = list(words)
+        return self.parse(tokens, stats) == len(tokens)
+
+
+class ParseState:
+    def __init__(self, tokens: List[str], memo: MemoTable):
+        self.tokens = tokens
+        self.memo = memo
+        self.furthest = 0
+
+
+def main():
+    p = argparse.ArgumentParser("Parses sequences of terminals with packrat parser")
+    p.add_argument('input', nargs=1, type=str)
+    p.add_argument('words', nargs=1, type=str,
+                   help="file with a sequence of space separated terminals on every line")
+    p.add_argument('output', nargs='?')
+    p.add_argument("--hot", nargs='+', metavar="NON_TERMINAL",
+                   help="memoize only these non-terminals")
+    p.add_argument("--window", type=int, help="keep memoized results of the last WINDOW positions")
+    args = p.parse_args()
+    if not args.output:
+        args.output = args.words[0] + ".out"
+    ebnf, diagnostics = ebnf_parser.parse_ebnf(args.input[0])
+    diagnostics.write(sys.stderr)
+    with open(args.output, "w") as processed_words:
+        if ebnf is None:
+            print("Grammar is incorrect, cannot parse", file=processed_words)
+            return
+        parser = PackratParser(ebnf, args.hot, args.window)
+        stats = MemoStats()
+        with open(args.words[0]) as words:
+            for line in words:
+                result = "accepted" if parser.recognize(line.split(), stats) else "rejected"
+                print(f"{result}: {line.strip()}", file=processed_words)
+        print(stats, file=processed_words)
+
+
+if __name__ == "__main__":
+    main()
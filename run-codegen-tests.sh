@@ -0,0 +1,26 @@
+#!/bin/bash
+set -euo pipefail
+
+# Recognizes sample words with parsers generated from the test grammars
+# and with the interpreter; deep-nesting and nested-stars are not in
+# tests.txt, as only the parsers are run on them
+FAIL=0
+for tn in $(cat "tests/tests.txt") deep-nesting nested-stars; do
+    twords="tests/$tn.words"
+    [ -f "$twords" ] || continue
+    tin="tests/$tn.in"
+    tparser="tests/$tn-parser.out"
+    tout="tests/$tn-codegen.out"
+    tiout="tests/$tn-codegen-interpreter.out"
+    tsol="tests/$tn-codegen.sol"
+    echo ===== $tn =====
+    { python3 codegen.py $tin $tparser && python3 $tparser $twords $tout && diff $tout $tsol && echo PASS; } || { echo -e "\e[31;1mFAIL\e[0m" && FAIL=1; }
+    { python3 codegen.py -w $twords $tin $tiout && diff $tiout $tsol && echo PASS; } || { echo -e "\e[31;1mFAIL\e[0m" && FAIL=1; }
+done
+
+if [[ "$FAIL" == "0" ]]; then
+    echo -e "===== \e[32;1mALL PASS\e[0m ====="
+else
+    echo -e "===== \e[31;1mSOME FAIL\e[0m ====="
+fi
+exit $FAIL
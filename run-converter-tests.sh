@@ -2,14 +2,44 @@
 set -euo pipefail
 
 FAIL=0
+CACHE=$(mktemp -d)
+trap 'rm -rf "$CACHE"' EXIT
 for tn in $(cat "tests/tests.txt"); do
     tin="tests/$tn.in"
     tout="tests/$tn-converter.out"
+    tsol="tests/$tn-converter.sol"
     trout="tests/$tn-converter-readable.out"
-    { python3 converter.py $tin $tout; } || { echo -e "\e[31;1mFAIL\e[0m" && FAIL=1; }
-    { python3 converter.py -r $tin $trout; } || { echo -e "\e[31;1mFAIL\e[0m" && FAIL=1; }
+    trsol="tests/$tn-converter-readable.sol"
+    echo ===== $tn =====
+    { python3 converter.py $tin $tout && diff $tout $tsol && echo PASS; } || { echo -e "\e[31;1mFAIL\e[0m" && FAIL=1; }
+    { python3 converter.py -r $tin $trout && diff $trout $trsol && echo PASS; } || { echo -e "\e[31;1mFAIL\e[0m" && FAIL=1; }
+    # The second run through the cache reads the stored result
+    for run in stored loaded; do
+        { python3 converter.py -c "$CACHE" $tin $tout 2>/dev/null && diff $tout $tsol && echo PASS; } || { echo -e "\e[31;1mFAIL\e[0m" && FAIL=1; }
+    done
 done
 
+# Deeply nested expressions are stored in and loaded from the cache too
+tn=deep-nesting
+echo ===== $tn =====
+python3 converter.py tests/$tn.in tests/$tn-converter.out
+for run in stored loaded; do
+    { python3 converter.py -c "$CACHE" tests/$tn.in tests/$tn-converter-cached.out 2>/dev/null &&
+      diff tests/$tn-converter-cached.out tests/$tn-converter.out && echo PASS; } || { echo -e "\e[31;1mFAIL\e[0m" && FAIL=1; }
+done
+
+# Rules converted in parallel give the same grammar
+echo ===== parallel =====
+{ python3 benchmark.py parallel -s 100 1000 > /dev/null && echo PASS; } || { echo -e "\e[31;1mFAIL\e[0m" && FAIL=1; }
+
+# Batch mode writes the outputs next to the inputs
+python3 converter.py --batch -c "$CACHE" $(sed 's|.*|tests/&.in|' tests/tests.txt) 2>/dev/null || true
+for tn in $(cat "tests/tests.txt"); do
+    echo ===== $tn batch =====
+    { diff tests/$tn.in.out tests/$tn-converter.sol && echo PASS; } || { echo -e "\e[31;1mFAIL\e[0m" && FAIL=1; }
+done
+rm -f tests/*.in.out
+
 if [[ "$FAIL" == "0" ]]; then
     echo -e "===== \e[32;1mALL PASS\e[0m ====="
 else
@@ -0,0 +1,20 @@
+#!/bin/bash
+set -euo pipefail
+
+FAIL=0
+for tn in $(cat "tests/tests.txt"); do
+    twords="tests/$tn.words"
+    [ -f "$twords" ] || continue
+    tin="tests/$tn.in"
+    tout="tests/$tn-cyk.out"
+    tsol="tests/$tn-cyk.sol"
+    echo ===== $tn =====
+    { python3 cnf.py $tin $tout --words $twords && diff $tout $tsol && echo PASS; } || { echo -e "\e[31;1mFAIL\e[0m" && FAIL=1; }
+done
+
+if [[ "$FAIL" == "0" ]]; then
+    echo -e "===== \e[32;1mALL PASS\e[0m ====="
+else
+    echo -e "===== \e[31;1mSOME FAIL\e[0m ====="
+fi
+exit $FAIL
@@ -0,0 +1,32 @@
+#!/bin/bash
+set -euo pipefail
+
+# Images are written from the grammar converted to classic form, so shown
+# back they match the outputs of converter.py and compiled_grammar.py
+FAIL=0
+for tn in $(cat "tests/tests.txt"); do
+    tin="tests/$tn.in"
+    timage="tests/$tn-image.out.bin"
+    tout="tests/$tn-image.out"
+    tsol="tests/$tn-converter.sol"
+    tcout="tests/$tn-image-compiled.out"
+    tcsol="tests/$tn-compiled_grammar.sol"
+    echo ===== $tn =====
+    if ! python3 grammar_image.py $tin $timage 2>/dev/null; then
+        echo "Grammar is incorrect, cannot parse" > $tout
+        cp $tout $tcout
+    else
+        python3 grammar_image.py -s $timage $tout
+        python3 grammar_image.py -c $timage $tcout
+    fi
+    { diff $tout $tsol && echo PASS; } || { echo -e "\e[31;1mFAIL\e[0m" && FAIL=1; }
+    { diff $tcout $tcsol && echo PASS; } || { echo -e "\e[31;1mFAIL\e[0m" && FAIL=1; }
+done
+rm -f tests/*-image.out.bin
+
+if [[ "$FAIL" == "0" ]]; then
+    echo -e "===== \e[32;1mALL PASS\e[0m ====="
+else
+    echo -e "===== \e[31;1mSOME FAIL\e[0m ====="
+fi
+exit $FAIL
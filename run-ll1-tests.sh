@@ -0,0 +1,22 @@
+#!/bin/bash
+set -euo pipefail
+
+# Recognizes sample words with a table saved to disk and loaded back
+FAIL=0
+for tn in $(cat "tests/tests.txt"); do
+    twords="tests/$tn.words"
+    [ -f "$twords" ] || continue
+    tin="tests/$tn.in"
+    ttable="tests/$tn-ll1-table.out"
+    tout="tests/$tn-ll1-words.out"
+    tsol="tests/$tn-ll1-words.sol"
+    echo ===== $tn =====
+    { python3 ll1.py $tin "tests/$tn-ll1.out" --save $ttable && python3 ll1.py --load $ttable $tout --words $twords && diff $tout $tsol && echo PASS; } || { echo -e "\e[31;1mFAIL\e[0m" && FAIL=1; }
+done
+
+if [[ "$FAIL" == "0" ]]; then
+    echo -e "===== \e[32;1mALL PASS\e[0m ====="
+else
+    echo -e "===== \e[31;1mSOME FAIL\e[0m ====="
+fi
+exit $FAIL
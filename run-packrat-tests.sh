@@ -0,0 +1,21 @@
+#!/bin/bash
+set -euo pipefail
+
+# deep-nesting checks that nesting and rule calls do not use the C stack
+FAIL=0
+for tn in $(cat "tests/tests.txt") deep-nesting; do
+    twords="tests/$tn.words"
+    [ -f "$twords" ] || continue
+    tin="tests/$tn.in"
+    tout="tests/$tn-packrat.out"
+    tsol="tests/$tn-packrat.sol"
+    echo ===== $tn =====
+    { python3 packrat.py $tin $twords $tout && diff $tout $tsol && echo PASS; } || { echo -e "\e[31;1mFAIL\e[0m" && FAIL=1; }
+done
+
+if [[ "$FAIL" == "0" ]]; then
+    echo -e "===== \e[32;1mALL PASS\e[0m ====="
+else
+    echo -e "===== \e[31;1mSOME FAIL\e[0m ====="
+fi
+exit $FAIL
@@ -0,0 +1,22 @@
+#!/bin/bash
+set -euo pipefail
+
+# Recognizes sample words with PLY parsers written by the converter
+FAIL=0
+for tn in $(cat "tests/tests.txt"); do
+    twords="tests/$tn.words"
+    [ -f "$twords" ] || continue
+    tin="tests/$tn.in"
+    tparser="tests/$tn-ply.out"
+    tout="tests/$tn-ply-words.out"
+    tsol="tests/$tn-ply-words.sol"
+    echo ===== $tn =====
+    { python3 converter.py --ply $tin $tparser && python3 $tparser $twords $tout && diff $tout $tsol && echo PASS; } || { echo -e "\e[31;1mFAIL\e[0m" && FAIL=1; }
+done
+
+if [[ "$FAIL" == "0" ]]; then
+    echo -e "===== \e[32;1mALL PASS\e[0m ====="
+else
+    echo -e "===== \e[31;1mSOME FAIL\e[0m ====="
+fi
+exit $FAIL
@@ -0,0 +1,21 @@
+#!/bin/bash
+set -euo pipefail
+
+# The hand-written scanner and the columnar token stream must produce
+# the same tokens as the PLY lexer, and the same diagnostics when the
+# input is read in small chunks
+FAIL=0
+for tn in $(cat "tests/tests.txt"); do
+    tin="tests/$tn.in"
+    tout="tests/$tn-scanner.out"
+    tsout="tests/$tn-token_stream.out"
+    tsol="tests/$tn-lexer.sol"
+    echo ===== $tn =====
+    { python3 lexer.py --fast $tin $tout && diff $tout $tsol && python3 token_stream.py $tin $tsout && diff $tsout $tsol && python3 scanner.py $tin 1 > /dev/null && python3 scanner.py $tin 1 8 > /dev/null && echo PASS; } || { echo -e "\e[31;1mFAIL\e[0m" && FAIL=1; }
+done
+if [[ "$FAIL" == "0" ]]; then
+    echo -e "===== \e[32;1mALL PASS\e[0m ====="
+else
+    echo -e "===== \e[31;1mSOME FAIL\e[0m ====="
+fi
+exit $FAIL
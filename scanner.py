@@ -0,0 +1,210 @@
+import re
+import sys
+import time
+from typing import Any, Callable, Iterable, Iterator, Tuple
+from ply.lex import LexToken
+from tokens import RESERVED
+from diagnostics import Diagnostics, ILLEGAL_CHARACTER, UNKNOWN_KEYWORD
+
+# Hand-written scanner producing exactly the same tokens as `lexer.lexer`
+# in one left-to-right pass: the token kind is chosen by the first
+# character, so no alternative is retried, and quoted tokens are closed
+# with `str.find` instead of a backtracking lazy pattern.
+
+SINGLE_CHAR_TOKENS = {
+    "{": "LKLEENE",
+    "}": "RKLEENE",
+    "[": "LOPT",
+    "]": "ROPT",
+    "(": "LGROUP",
+    ")": "RGROUP",
+    "|": "ALT_SEP",
+    ";": "BIND_END",
+}
+
+QUOTED_TOKENS = {"\"": ("\"", "TERMINAL"), "<": (">", "NON_TERMINAL")}
+
+# A token span: (type, lexpos, value start, value end, line number)
+Span = Tuple[str, int, int, int, int]
+
+
+class Alphabet:
+    """
+    Characters and patterns used by the scanner, either as `str` for text
+    or as byte values for `bytes`-like buffers (`mmap`, `bytes`).
+    """
+
+    def __init__(self, encode: Callable[[str], Any]):
+        key = (lambda char: encode(char)[0]) if encode is not str else str
+        self.space = key(" ")
+        self.newline = key("\n")
+        self.newline_needle = encode("\n")
+        self.backslash = key("\\")
+        self.dollar = key("$")
+        self.colon = key(":")
+        self.equals = key("=")
+        self.single = {key(char): kind for char, kind in SINGLE_CHAR_TOKENS.items()}
+        self.quoted = {key(char): (encode(quote), kind)
+                       for char, (quote, kind) in QUOTED_TOKENS.items()}
+        self.newlines = re.compile(encode(r"\n+"))
+        self.name_body = re.compile(encode(r"[A-Za-z_`]+"))
+        self.keyword = re.compile(encode(r"[a-zA-Z]+:?"))
+        self.reserved = {encode(word): kind for word, kind in RESERVED.items()}
+
+
+TEXT = Alphabet(str)
+BINARY = Alphabet(str.encode)
+
+
+def make_token(kind: str, value: str, lineno: int, lexpos: int) -> LexToken:
+    tok = LexToken()
+    tok.type = kind
+    tok.value = value
+    tok.lineno = lineno
+    tok.lexpos = lexpos
+    return tok
+
+
+def find_closing(text, begin: int, line_end: int, quote, backslash) -> int:
+    # Same as `fill_regex_pattern`: the closing symbol must not be escaped
+    # by a single backslash, and the quoted value is not empty.
+    end = text.find(quote, begin + 2, line_end)
+    while end != -1:
+        if text[end - 1] != backslash or text[end - 2] == backslash:
+            return end + 1
+        end = text.find(quote, end + 1, line_end)
+    return 0
+
+
+class Scanner:
+    lineno: int
+    diagnostics: Diagnostics
+
+    def __init__(self, diagnostics: Diagnostics = None):
+        self.lineno = 1
+        self.diagnostics = diagnostics if diagnostics is not None else Diagnostics()
+
+    def spans(self, text, offset: int = 0) -> Iterator[Span]:
+        """
+        Yields token spans of `text`, which is either a `str` or a
+        `bytes`-like buffer supporting `find`; positions are indexes into
+        `text` shifted by `offset`.
+        """
+        alphabet = TEXT if isinstance(text, str) else BINARY
+        diagnostics = self.diagnostics
+        single = alphabet.single
+        quoted = alphabet.quoted
+        pos = 0
+        size = len(text)
+        line_end = -1
+        while pos < size:
+            char = text[pos]
+            if char == alphabet.space:
+                pos += 1
+                continue
+
+            if char == alphabet.newline:
+                end = alphabet.newlines.match(text, pos).end()
+                self.lineno += end - pos
+                pos = end
+                diagnostics.new_line(self.lineno, offset + pos)
+                continue
+
+            kind = single.get(char)
+            if kind is not None:
+                yield kind, offset + pos, offset + pos, offset + pos + 1, self.lineno
+                pos += 1
+                continue
+
+            if char in quoted:
+                if line_end < pos:
+                    line_end = text.find(alphabet.newline_needle, pos)
+                    if line_end == -1:
+                        line_end = size
+                quote, kind = quoted[char]
+                end = find_closing(text, pos, line_end, quote, alphabet.backslash)
+                if end:
+                    yield kind, offset + pos, offset + pos + 1, offset + end - 1, self.lineno
+                    pos = end
+                    continue
+            elif char == alphabet.dollar:
+                match = alphabet.name_body.match(text, pos + 1)
+                if match:
+                    yield "NAME", offset + pos, offset + pos + 1, offset + match.end(), self.lineno
+                    pos = match.end()
+                    continue
+            elif char == alphabet.colon:
+                if pos + 1 < size and text[pos + 1] == alphabet.equals:
+                    yield "BIND", offset + pos, offset + pos, offset + pos + 2, self.lineno
+                    pos += 2
+                    continue
+            else:
+                match = alphabet.keyword.match(text, pos)
+                if match:
+                    kind = alphabet.reserved.get(match.group())
+                    if kind is not None:
+                        yield kind, offset + pos, offset + pos, offset + match.end(), self.lineno
+                        pos = match.end()
+                    else:
+                        word = match.group()
+                        diagnostics.report(UNKNOWN_KEYWORD,
+                                           word.decode() if alphabet is BINARY else word,
+                                           offset + pos, self.lineno)
+                        # The character after an unknown word is skipped as well
+                        pos = match.end() + 1
+                    continue
+
+            diagnostics.report(ILLEGAL_CHARACTER, chr(char) if alphabet is BINARY else char,
+                               offset + pos, self.lineno)
+            pos += 1
+
+    def scan(self, text: str, offset: int = 0) -> Iterator[LexToken]:
+        # Diagnostics are reported at positions in the whole input, so
+        # `spans` shifts them by `offset` and values are cut from `text`
+        for kind, lexpos, begin, end, lineno in self.spans(text, offset):
+            yield make_token(kind, text[begin - offset:end - offset], lineno, lexpos)
+
+
+def tokenize(chunks: Iterable[str], diagnostics: Diagnostics = None) -> Iterator[LexToken]:
+    scanner = Scanner(diagnostics)
+    offset = 0
+    for chunk in chunks:
+        yield from scanner.scan(chunk, offset)
+        offset += len(chunk)
+
+
+def main():
+    # Compares the token streams, diagnostics and throughput of the PLY
+    # lexer and the scanner on a grammar file read in chunks of the given size
+    import lexer
+
+    if len(sys.argv) > 1:
+        input_file = sys.argv[1]
+        repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+        chunk_size = int(sys.argv[3]) if len(sys.argv) > 3 else lexer.CHUNK_SIZE
+
+        results = {}
+        for fast in (False, True):
+            begin = time.perf_counter()
+            for _ in range(repeat):
+                diagnostics = Diagnostics()
+                stream = [str(tok) for tok in lexer.tokenize_file(input_file, chunk_size, fast, diagnostics)]
+            elapsed = (time.perf_counter() - begin) / repeat
+            results[fast] = stream, list(diagnostics), diagnostics.dropped
+            name = "scanner" if fast else "ply"
+            print(f"{name}: {len(stream)} tokens, {elapsed * 1000:.3f} ms, "
+                  f"{len(stream) / max(elapsed, 1e-9):.0f} tokens/s")
+
+        if results[False][0] != results[True][0]:
+            print("Token streams differ")
+            sys.exit(1)
+        if results[False][1:] != results[True][1:]:
+            print("Diagnostics differ")
+            sys.exit(1)
+        print("Token streams and diagnostics are identical")
+    else:
+        print("Expected at least one argument: input file containing grammar")
+
+
+if __name__ == "__main__":
+    main()
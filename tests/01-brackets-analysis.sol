@@ -0,0 +1,7 @@
+nullable:
+  <S>;
+first:
+  <S> : "(";
+follow:
+  <S> : ")" $end;
+
@@ -0,0 +1,11 @@
+start:
+  <S'>;
+names:
+rules:
+  <S'> := (EPS | (<(> <(S ) S)>));
+  <S> := (<(> <(S ) S)>);
+  <(> := "(";
+  <)> := ")";
+  <() S)> := ((<)> <S>) | ")");
+  <(S ) S)> := ((<S> <() S)>) | (<)> <S>) | ")");
+
@@ -0,0 +1,10 @@
+symbols:
+  0 "("
+  1 ")"
+  2 <S>
+start:
+  2;
+productions:
+  2 := 0 2 1 2;
+  2 :=;
+
@@ -0,0 +1,6 @@
+start:
+  <S>;
+names:
+rules:
+  <S> := (("(" <S> ")" <S>) | EPS);
+
@@ -0,0 +1,6 @@
+accepted: ( )
+accepted: ( ( ) ) ( )
+accepted: 
+rejected: ( ( )
+rejected: ) (
+rejected: ( x )
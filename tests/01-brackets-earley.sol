@@ -0,0 +1,6 @@
+accepted, 1 tree: ( )
+accepted, 1 tree: ( ( ) ) ( )
+accepted, 1 tree: 
+rejected at end of input: ( ( )
+rejected at token 1: ) (
+rejected at token 2: ( x )
@@ -4,5 +4,5 @@ names:
  $l := "(";
  $r := ")";
 rules:
-  <S> := ((EPS) | ($l <S> $r <S>));
+  <S> := (($l <S> $r <S>) | (EPS));
 
@@ -0,0 +1,8 @@
+conflicts:
+table:
+  <S> on "(": <S> := "(" <S> ")" <S>;
+  <S> on ")": <S> := EPS;
+  <S> on $end: <S> := EPS;
+compressed:
+  3 entries in 3 slots;
+
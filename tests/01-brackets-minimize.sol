@@ -0,0 +1,7 @@
+start:
+  <S>;
+names:
+rules:
+  <S> := (("(" <S> ")" <S>) | EPS);
+
+eliminated 0 of 2 productions: removed 0 useless non-terminals, merged 0 equivalent ones
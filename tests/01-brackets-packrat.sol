@@ -0,0 +1,7 @@
+accepted: ( )
+accepted: ( ( ) ) ( )
+accepted: 
+rejected: ( ( )
+rejected: ) (
+rejected: ( x )
+memo: 18 lookups, 0 hits (0.0%), 18 stores, 0 evictions, peak size 7
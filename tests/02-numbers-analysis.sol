@@ -0,0 +1,27 @@
+nullable:
+  <mult(Digit')>;
+  <opt((+)or(-))>;
+  <opt(. opt(Nat'))>;
+  <opt(((e)or(E)) opt((+)or(-)) Nat')>;
+  <opt(Nat')>;
+first:
+  <Num> : "0" "1" "2" "3" "4" "5" "6" "7" "8" "9" "+" "-";
+  <Digit> : "0" "1" "2" "3" "4" "5" "6" "7" "8" "9";
+  <Nat> : "0" "1" "2" "3" "4" "5" "6" "7" "8" "9";
+  <mult(Digit')> : "0" "1" "2" "3" "4" "5" "6" "7" "8" "9";
+  <opt((+)or(-))> : "+" "-";
+  <opt(. opt(Nat'))> : ".";
+  <opt(((e)or(E)) opt((+)or(-)) Nat')> : "e" "E";
+  <opt(Nat')> : "0" "1" "2" "3" "4" "5" "6" "7" "8" "9";
+  <((e)or(E))> : "e" "E";
+follow:
+  <Num> : $end;
+  <Digit> : "0" "1" "2" "3" "4" "5" "6" "7" "8" "9" "." "e" "E" $end;
+  <Nat> : "." "e" "E" $end;
+  <mult(Digit')> : "0" "1" "2" "3" "4" "5" "6" "7" "8" "9" "." "e" "E" $end;
+  <opt((+)or(-))> : "0" "1" "2" "3" "4" "5" "6" "7" "8" "9";
+  <opt(. opt(Nat'))> : "e" "E" $end;
+  <opt(((e)or(E)) opt((+)or(-)) Nat')> : $end;
+  <opt(Nat')> : "e" "E" $end;
+  <((e)or(E))> : "0" "1" "2" "3" "4" "5" "6" "7" "8" "9" "+" "-";
+
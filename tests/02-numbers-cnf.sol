@@ -0,0 +1,18 @@
+start:
+  <Num>;
+names:
+rules:
+  <Num> := ((<opt((+)or(-))> <(Nat opt(. opt(Nat')) opt(((e)or(E)) opt((+)or(-)) Nat'))>) | (<Nat> <(opt(. opt(Nat')) opt(((e)or(E)) opt((+)or(-)) Nat'))>) | (<Digit> <mult(Digit')>) | "0" | "1" | "2" | "3" | "4" | "5" | "6" | "7" | "8" | "9");
+  <Digit> := ("0" | "1" | "2" | "3" | "4" | "5" | "6" | "7" | "8" | "9");
+  <Nat> := ((<Digit> <mult(Digit')>) | "0" | "1" | "2" | "3" | "4" | "5" | "6" | "7" | "8" | "9");
+  <mult(Digit')> := ((<mult(Digit')> <Digit>) | "0" | "1" | "2" | "3" | "4" | "5" | "6" | "7" | "8" | "9");
+  <opt((+)or(-))> := ("+" | "-");
+  <opt(. opt(Nat'))> := ((<.> <opt(Nat')>) | ".");
+  <opt(((e)or(E)) opt((+)or(-)) Nat')> := (<((e)or(E))> <(opt((+)or(-)) Nat)>);
+  <opt(Nat')> := ((<Digit> <mult(Digit')>) | "0" | "1" | "2" | "3" | "4" | "5" | "6" | "7" | "8" | "9");
+  <((e)or(E))> := ("e" | "E");
+  <.> := ".";
+  <(opt(. opt(Nat')) opt(((e)or(E)) opt((+)or(-)) Nat'))> := ((<opt(. opt(Nat'))> <opt(((e)or(E)) opt((+)or(-)) Nat')>) | (<((e)or(E))> <(opt((+)or(-)) Nat)>) | (<.> <opt(Nat')>) | ".");
+  <(Nat opt(. opt(Nat')) opt(((e)or(E)) opt((+)or(-)) Nat'))> := ((<Nat> <(opt(. opt(Nat')) opt(((e)or(E)) opt((+)or(-)) Nat'))>) | (<Digit> <mult(Digit')>) | "0" | "1" | "2" | "3" | "4" | "5" | "6" | "7" | "8" | "9");
+  <(opt((+)or(-)) Nat)> := ((<opt((+)or(-))> <Nat>) | (<Digit> <mult(Digit')>) | "0" | "1" | "2" | "3" | "4" | "5" | "6" | "7" | "8" | "9");
+
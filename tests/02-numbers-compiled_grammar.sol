@@ -0,0 +1,54 @@
+symbols:
+  0 "0"
+  1 "1"
+  2 "2"
+  3 "3"
+  4 "4"
+  5 "5"
+  6 "6"
+  7 "7"
+  8 "8"
+  9 "9"
+  10 "+"
+  11 "-"
+  12 "."
+  13 "e"
+  14 "E"
+  15 <Num>
+  16 <Digit>
+  17 <Nat>
+  18 <mult(Digit')>
+  19 <opt((+)or(-))>
+  20 <opt(. opt(Nat'))>
+  21 <opt(((e)or(E)) opt((+)or(-)) Nat')>
+  22 <opt(Nat')>
+  23 <((e)or(E))>
+start:
+  15;
+productions:
+  15 := 19 17 20 21;
+  16 := 0;
+  16 := 1;
+  16 := 2;
+  16 := 3;
+  16 := 4;
+  16 := 5;
+  16 := 6;
+  16 := 7;
+  16 := 8;
+  16 := 9;
+  17 := 16 18;
+  18 := 18 16;
+  18 :=;
+  19 := 10;
+  19 := 11;
+  19 :=;
+  20 := 12 22;
+  20 :=;
+  21 := 23 19 17;
+  21 :=;
+  22 := 16 18;
+  22 :=;
+  23 := 13;
+  23 := 14;
+
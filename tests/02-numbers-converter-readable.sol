@@ -0,0 +1,14 @@
+start:
+  <Num>;
+names:
+rules:
+  <Digit> := ("0" | "1" | "2" | "3" | "4" | "5" | "6" | "7" | "8" | "9");
+  <Nat> := (<Digit> <B>);
+  <Num> := (<C> <Nat> <D> <E>);
+  <B> := ((<B> <Digit>) | EPS);
+  <C> := ("+" | "-" | EPS);
+  <D> := (("." <G>) | EPS);
+  <E> := ((<H> <C> <Nat>) | EPS);
+  <G> := ((<Digit> <B>) | EPS);
+  <H> := ("e" | "E");
+
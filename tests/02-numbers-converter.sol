@@ -0,0 +1,14 @@
+start:
+  <Num>;
+names:
+rules:
+  <Digit> := ("0" | "1" | "2" | "3" | "4" | "5" | "6" | "7" | "8" | "9");
+  <Nat> := (<Digit> <mult(Digit')>);
+  <Num> := (<opt((+)or(-))> <Nat> <opt(. opt(Nat'))> <opt(((e)or(E)) opt((+)or(-)) Nat')>);
+  <mult(Digit')> := ((<mult(Digit')> <Digit>) | EPS);
+  <opt((+)or(-))> := ("+" | "-" | EPS);
+  <opt(. opt(Nat'))> := (("." <opt(Nat')>) | EPS);
+  <opt(((e)or(E)) opt((+)or(-)) Nat')> := ((<((e)or(E))> <opt((+)or(-))> <Nat>) | EPS);
+  <opt(Nat')> := ((<Digit> <mult(Digit')>) | EPS);
+  <((e)or(E))> := ("e" | "E");
+
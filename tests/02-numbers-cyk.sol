@@ -0,0 +1,5 @@
+accepted: 1 2
+accepted: - 0 . 5 e + 1 0
+rejected: + .
+accepted: 1 . E 2
+rejected: 1 2 3 e
@@ -0,0 +1,5 @@
+accepted, 1 tree: 1 2
+accepted, 1 tree: - 0 . 5 e + 1 0
+rejected at token 2: + .
+accepted, 1 tree: 1 . E 2
+rejected at end of input: 1 2 3 e
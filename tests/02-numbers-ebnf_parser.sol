@@ -2,7 +2,7 @@ start:
   <Num>;
 names:
 rules:
-  <Digit> := (("9") | (("8") | (("7") | (("6") | (("5") | (("4") | (("3") | (("2") | (("1") | ("0"))))))))));
+  <Digit> := (("0") | ("1") | ("2") | ("3") | ("4") | ("5") | ("6") | ("7") | ("8") | ("9"));
   <Nat> := (<Digit> {(<Digit>)});
-  <Num> := ([(("-") | ("+"))] <Nat> [("." [(<Nat>)])] [((("E") | ("e")) [(("-") | ("+"))] <Nat>)]);
+  <Num> := ([(("+") | ("-"))] <Nat> [("." [(<Nat>)])] [((("e") | ("E")) [(("+") | ("-"))] <Nat>)]);
 
@@ -0,0 +1 @@
+Table has 10 conflicts, cannot recognize
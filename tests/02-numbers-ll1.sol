@@ -0,0 +1,95 @@
+conflicts:
+  <mult(Digit')> on "0": <mult(Digit')> := <mult(Digit')> <Digit>; <mult(Digit')> := EPS;
+  <mult(Digit')> on "1": <mult(Digit')> := <mult(Digit')> <Digit>; <mult(Digit')> := EPS;
+  <mult(Digit')> on "2": <mult(Digit')> := <mult(Digit')> <Digit>; <mult(Digit')> := EPS;
+  <mult(Digit')> on "3": <mult(Digit')> := <mult(Digit')> <Digit>; <mult(Digit')> := EPS;
+  <mult(Digit')> on "4": <mult(Digit')> := <mult(Digit')> <Digit>; <mult(Digit')> := EPS;
+  <mult(Digit')> on "5": <mult(Digit')> := <mult(Digit')> <Digit>; <mult(Digit')> := EPS;
+  <mult(Digit')> on "6": <mult(Digit')> := <mult(Digit')> <Digit>; <mult(Digit')> := EPS;
+  <mult(Digit')> on "7": <mult(Digit')> := <mult(Digit')> <Digit>; <mult(Digit')> := EPS;
+  <mult(Digit')> on "8": <mult(Digit')> := <mult(Digit')> <Digit>; <mult(Digit')> := EPS;
+  <mult(Digit')> on "9": <mult(Digit')> := <mult(Digit')> <Digit>; <mult(Digit')> := EPS;
+table:
+  <Num> on "0": <Num> := <opt((+)or(-))> <Nat> <opt(. opt(Nat'))> <opt(((e)or(E)) opt((+)or(-)) Nat')>;
+  <Num> on "1": <Num> := <opt((+)or(-))> <Nat> <opt(. opt(Nat'))> <opt(((e)or(E)) opt((+)or(-)) Nat')>;
+  <Num> on "2": <Num> := <opt((+)or(-))> <Nat> <opt(. opt(Nat'))> <opt(((e)or(E)) opt((+)or(-)) Nat')>;
+  <Num> on "3": <Num> := <opt((+)or(-))> <Nat> <opt(. opt(Nat'))> <opt(((e)or(E)) opt((+)or(-)) Nat')>;
+  <Num> on "4": <Num> := <opt((+)or(-))> <Nat> <opt(. opt(Nat'))> <opt(((e)or(E)) opt((+)or(-)) Nat')>;
+  <Num> on "5": <Num> := <opt((+)or(-))> <Nat> <opt(. opt(Nat'))> <opt(((e)or(E)) opt((+)or(-)) Nat')>;
+  <Num> on "6": <Num> := <opt((+)or(-))> <Nat> <opt(. opt(Nat'))> <opt(((e)or(E)) opt((+)or(-)) Nat')>;
+  <Num> on "7": <Num> := <opt((+)or(-))> <Nat> <opt(. opt(Nat'))> <opt(((e)or(E)) opt((+)or(-)) Nat')>;
+  <Num> on "8": <Num> := <opt((+)or(-))> <Nat> <opt(. opt(Nat'))> <opt(((e)or(E)) opt((+)or(-)) Nat')>;
+  <Num> on "9": <Num> := <opt((+)or(-))> <Nat> <opt(. opt(Nat'))> <opt(((e)or(E)) opt((+)or(-)) Nat')>;
+  <Num> on "+": <Num> := <opt((+)or(-))> <Nat> <opt(. opt(Nat'))> <opt(((e)or(E)) opt((+)or(-)) Nat')>;
+  <Num> on "-": <Num> := <opt((+)or(-))> <Nat> <opt(. opt(Nat'))> <opt(((e)or(E)) opt((+)or(-)) Nat')>;
+  <Digit> on "0": <Digit> := "0";
+  <Digit> on "1": <Digit> := "1";
+  <Digit> on "2": <Digit> := "2";
+  <Digit> on "3": <Digit> := "3";
+  <Digit> on "4": <Digit> := "4";
+  <Digit> on "5": <Digit> := "5";
+  <Digit> on "6": <Digit> := "6";
+  <Digit> on "7": <Digit> := "7";
+  <Digit> on "8": <Digit> := "8";
+  <Digit> on "9": <Digit> := "9";
+  <Nat> on "0": <Nat> := <Digit> <mult(Digit')>;
+  <Nat> on "1": <Nat> := <Digit> <mult(Digit')>;
+  <Nat> on "2": <Nat> := <Digit> <mult(Digit')>;
+  <Nat> on "3": <Nat> := <Digit> <mult(Digit')>;
+  <Nat> on "4": <Nat> := <Digit> <mult(Digit')>;
+  <Nat> on "5": <Nat> := <Digit> <mult(Digit')>;
+  <Nat> on "6": <Nat> := <Digit> <mult(Digit')>;
+  <Nat> on "7": <Nat> := <Digit> <mult(Digit')>;
+  <Nat> on "8": <Nat> := <Digit> <mult(Digit')>;
+  <Nat> on "9": <Nat> := <Digit> <mult(Digit')>;
+  <mult(Digit')> on "0": <mult(Digit')> := <mult(Digit')> <Digit>;
+  <mult(Digit')> on "1": <mult(Digit')> := <mult(Digit')> <Digit>;
+  <mult(Digit')> on "2": <mult(Digit')> := <mult(Digit')> <Digit>;
+  <mult(Digit')> on "3": <mult(Digit')> := <mult(Digit')> <Digit>;
+  <mult(Digit')> on "4": <mult(Digit')> := <mult(Digit')> <Digit>;
+  <mult(Digit')> on "5": <mult(Digit')> := <mult(Digit')> <Digit>;
+  <mult(Digit')> on "6": <mult(Digit')> := <mult(Digit')> <Digit>;
+  <mult(Digit')> on "7": <mult(Digit')> := <mult(Digit')> <Digit>;
+  <mult(Digit')> on "8": <mult(Digit')> := <mult(Digit')> <Digit>;
+  <mult(Digit')> on "9": <mult(Digit')> := <mult(Digit')> <Digit>;
+  <mult(Digit')> on ".": <mult(Digit')> := EPS;
+  <mult(Digit')> on "e": <mult(Digit')> := EPS;
+  <mult(Digit')> on "E": <mult(Digit')> := EPS;
+  <mult(Digit')> on $end: <mult(Digit')> := EPS;
+  <opt((+)or(-))> on "0": <opt((+)or(-))> := EPS;
+  <opt((+)or(-))> on "1": <opt((+)or(-))> := EPS;
+  <opt((+)or(-))> on "2": <opt((+)or(-))> := EPS;
+  <opt((+)or(-))> on "3": <opt((+)or(-))> := EPS;
+  <opt((+)or(-))> on "4": <opt((+)or(-))> := EPS;
+  <opt((+)or(-))> on "5": <opt((+)or(-))> := EPS;
+  <opt((+)or(-))> on "6": <opt((+)or(-))> := EPS;
+  <opt((+)or(-))> on "7": <opt((+)or(-))> := EPS;
+  <opt((+)or(-))> on "8": <opt((+)or(-))> := EPS;
+  <opt((+)or(-))> on "9": <opt((+)or(-))> := EPS;
+  <opt((+)or(-))> on "+": <opt((+)or(-))> := "+";
+  <opt((+)or(-))> on "-": <opt((+)or(-))> := "-";
+  <opt(. opt(Nat'))> on ".": <opt(. opt(Nat'))> := "." <opt(Nat')>;
+  <opt(. opt(Nat'))> on "e": <opt(. opt(Nat'))> := EPS;
+  <opt(. opt(Nat'))> on "E": <opt(. opt(Nat'))> := EPS;
+  <opt(. opt(Nat'))> on $end: <opt(. opt(Nat'))> := EPS;
+  <opt(((e)or(E)) opt((+)or(-)) Nat')> on "e": <opt(((e)or(E)) opt((+)or(-)) Nat')> := <((e)or(E))> <opt((+)or(-))> <Nat>;
+  <opt(((e)or(E)) opt((+)or(-)) Nat')> on "E": <opt(((e)or(E)) opt((+)or(-)) Nat')> := <((e)or(E))> <opt((+)or(-))> <Nat>;
+  <opt(((e)or(E)) opt((+)or(-)) Nat')> on $end: <opt(((e)or(E)) opt((+)or(-)) Nat')> := EPS;
+  <opt(Nat')> on "0": <opt(Nat')> := <Digit> <mult(Digit')>;
+  <opt(Nat')> on "1": <opt(Nat')> := <Digit> <mult(Digit')>;
+  <opt(Nat')> on "2": <opt(Nat')> := <Digit> <mult(Digit')>;
+  <opt(Nat')> on "3": <opt(Nat')> := <Digit> <mult(Digit')>;
+  <opt(Nat')> on "4": <opt(Nat')> := <Digit> <mult(Digit')>;
+  <opt(Nat')> on "5": <opt(Nat')> := <Digit> <mult(Digit')>;
+  <opt(Nat')> on "6": <opt(Nat')> := <Digit> <mult(Digit')>;
+  <opt(Nat')> on "7": <opt(Nat')> := <Digit> <mult(Digit')>;
+  <opt(Nat')> on "8": <opt(Nat')> := <Digit> <mult(Digit')>;
+  <opt(Nat')> on "9": <opt(Nat')> := <Digit> <mult(Digit')>;
+  <opt(Nat')> on "e": <opt(Nat')> := EPS;
+  <opt(Nat')> on "E": <opt(Nat')> := EPS;
+  <opt(Nat')> on $end: <opt(Nat')> := EPS;
+  <((e)or(E))> on "e": <((e)or(E))> := "e";
+  <((e)or(E))> on "E": <((e)or(E))> := "E";
+compressed:
+  80 entries in 80 slots;
+
@@ -0,0 +1,15 @@
+start:
+  <Num>;
+names:
+rules:
+  <Num> := (<opt((+)or(-))> <Nat> <opt(. opt(Nat'))> <opt(((e)or(E)) opt((+)or(-)) Nat')>);
+  <Digit> := ("0" | "1" | "2" | "3" | "4" | "5" | "6" | "7" | "8" | "9");
+  <mult(Digit')> := ((<mult(Digit')> <Digit>) | EPS);
+  <Nat> := (<Digit> <mult(Digit')>);
+  <opt((+)or(-))> := ("+" | "-" | EPS);
+  <opt(. opt(Nat'))> := (("." <opt(Nat')>) | EPS);
+  <opt(((e)or(E)) opt((+)or(-)) Nat')> := ((<((e)or(E))> <opt((+)or(-))> <Nat>) | EPS);
+  <opt(Nat')> := ((<Digit> <mult(Digit')>) | EPS);
+  <((e)or(E))> := ("e" | "E");
+
+eliminated 0 of 25 productions: removed 0 useless non-terminals, merged 0 equivalent ones
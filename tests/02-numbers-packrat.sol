@@ -0,0 +1,6 @@
+accepted: 1 2
+accepted: - 0 . 5 e + 1 0
+rejected: + .
+accepted: 1 . E 2
+rejected: 1 2 3 e
+memo: 36 lookups, 0 hits (0.0%), 36 stores, 0 evictions, peak size 11
@@ -0,0 +1,19 @@
+start:
+  <Num>;
+names:
+rules:
+  <Num> := ((<opt((+)or(-))> <(Nat opt(. opt(Nat')) opt(((e)or(E)) opt((+)or(-)) Nat'))>) | (<Nat> <(opt(. opt(Nat')) opt(((e)or(E)) opt((+)or(-)) Nat'))>) | (<Digit> <mult(Digit')>) | "0" | "1" | "2" | "3" | "4" | "5" | "6" | "7" | "8" | "9");
+  <Digit> := ("0" | "1" | "2" | "3" | "4" | "5" | "6" | "7" | "8" | "9");
+  <Nat> := ((<Digit> <mult(Digit')>) | "0" | "1" | "2" | "3" | "4" | "5" | "6" | "7" | "8" | "9");
+  <mult(Digit')> := (("0" <mult(Digit')-mult(Digit')>) | ("1" <mult(Digit')-mult(Digit')>) | ("2" <mult(Digit')-mult(Digit')>) | ("3" <mult(Digit')-mult(Digit')>) | ("4" <mult(Digit')-mult(Digit')>) | ("5" <mult(Digit')-mult(Digit')>) | ("6" <mult(Digit')-mult(Digit')>) | ("7" <mult(Digit')-mult(Digit')>) | ("8" <mult(Digit')-mult(Digit')>) | ("9" <mult(Digit')-mult(Digit')>));
+  <opt((+)or(-))> := ("+" | "-");
+  <opt(. opt(Nat'))> := ("." <opt(. opt(Nat'))'>);
+  <opt(((e)or(E)) opt((+)or(-)) Nat')> := (<((e)or(E))> <opt(((e)or(E)) opt((+)or(-)) Nat')'>);
+  <opt(Nat')> := ((<Digit> <mult(Digit')>) | "0" | "1" | "2" | "3" | "4" | "5" | "6" | "7" | "8" | "9");
+  <((e)or(E))> := ("e" | "E");
+  <(opt(. opt(Nat')) opt(((e)or(E)) opt((+)or(-)) Nat'))> := ((<opt(. opt(Nat'))> <opt(((e)or(E)) opt((+)or(-)) Nat')>) | (<((e)or(E))> <opt(((e)or(E)) opt((+)or(-)) Nat')'>) | ("." <opt(. opt(Nat'))'>));
+  <(Nat opt(. opt(Nat')) opt(((e)or(E)) opt((+)or(-)) Nat'))> := ((<Nat> <(opt(. opt(Nat')) opt(((e)or(E)) opt((+)or(-)) Nat'))>) | (<Digit> <mult(Digit')>) | "0" | "1" | "2" | "3" | "4" | "5" | "6" | "7" | "8" | "9");
+  <mult(Digit')-mult(Digit')> := ((<Digit> <mult(Digit')-mult(Digit')>) | EPS);
+  <opt(. opt(Nat'))'> := (<opt(Nat')> | EPS);
+  <opt(((e)or(E)) opt((+)or(-)) Nat')'> := ((<opt((+)or(-))> <Nat>) | <Nat>);
+
@@ -0,0 +1,23 @@
+nullable:
+  <opt(((mult(a))or(mult(b))))>;
+  <((B')or(mult((a A'))))>;
+  <mult(a)>;
+  <mult(b)>;
+  <mult((a A'))>;
+first:
+  <S> : "a";
+  <opt(((mult(a))or(mult(b))))> : "a" "b";
+  <((B')or(mult((a A'))))> : "a" "bb";
+  <A> : "aaa";
+  <mult(a)> : "a";
+  <mult(b)> : "b";
+  <mult((a A'))> : "a";
+follow:
+  <S> : $end;
+  <opt(((mult(a))or(mult(b))))> : "a" "bb" $end;
+  <((B')or(mult((a A'))))> : $end;
+  <A> : "a" $end;
+  <mult(a)> : "a";
+  <mult(b)> : "b";
+  <mult((a A'))> : "a";
+
@@ -0,0 +1,16 @@
+start:
+  <S>;
+names:
+rules:
+  <S> := ((<a> <(opt(((mult(a))or(mult(b)))) ((B')or(mult((a A')))))>) | "a");
+  <opt(((mult(a))or(mult(b))))> := ((<mult(a)> <a>) | (<mult(b)> <b>) | "a" | "b");
+  <((B')or(mult((a A'))))> := ("bb" | (<mult((a A'))> <(a A)>) | (<a> <A>));
+  <A> := "aaa";
+  <mult(a)> := ((<mult(a)> <a>) | "a");
+  <mult(b)> := ((<mult(b)> <b>) | "b");
+  <mult((a A'))> := ((<mult((a A'))> <(a A)>) | (<a> <A>));
+  <a> := "a";
+  <b> := "b";
+  <(opt(((mult(a))or(mult(b)))) ((B')or(mult((a A')))))> := ((<opt(((mult(a))or(mult(b))))> <((B')or(mult((a A'))))>) | "bb" | (<mult((a A'))> <(a A)>) | (<mult(a)> <a>) | (<mult(b)> <b>) | (<a> <A>) | "a" | "b");
+  <(a A)> := (<a> <A>);
+
@@ -0,0 +1,30 @@
+symbols:
+  0 "a"
+  1 "aaa"
+  2 "b"
+  3 "bb"
+  4 <S>
+  5 <opt(((mult(a))or(mult(b))))>
+  6 <((B')or(mult((a A'))))>
+  7 <A>
+  8 <mult(a)>
+  9 <mult(b)>
+  10 <mult((a A'))>
+start:
+  4;
+productions:
+  4 := 0 5 6;
+  5 := 8 0;
+  5 :=;
+  5 := 9 2;
+  6 := 3;
+  6 := 10 0 7;
+  6 :=;
+  7 := 1;
+  8 := 8 0;
+  8 :=;
+  9 := 9 2;
+  9 :=;
+  10 := 10 0 7;
+  10 :=;
+
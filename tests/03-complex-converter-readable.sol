@@ -0,0 +1,12 @@
+start:
+  <S>;
+names:
+rules:
+  <S> := ("a" <C> <D>);
+  <A> := "aaa";
+  <C> := ((<G> "a") | EPS | (<H> "b"));
+  <D> := ("bb" | (<F> "a" <A>) | EPS);
+  <F> := ((<F> "a" <A>) | EPS);
+  <G> := ((<G> "a") | EPS);
+  <H> := ((<H> "b") | EPS);
+
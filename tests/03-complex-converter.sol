@@ -0,0 +1,12 @@
+start:
+  <S>;
+names:
+rules:
+  <S> := ("a" <opt(((mult(a))or(mult(b))))> <((B')or(mult((a A'))))>);
+  <A> := "aaa";
+  <opt(((mult(a))or(mult(b))))> := ((<mult(a)> "a") | EPS | (<mult(b)> "b"));
+  <((B')or(mult((a A'))))> := ("bb" | (<mult((a A'))> "a" <A>) | EPS);
+  <mult((a A'))> := ((<mult((a A'))> "a" <A>) | EPS);
+  <mult(a)> := ((<mult(a)> "a") | EPS);
+  <mult(b)> := ((<mult(b)> "b") | EPS);
+
@@ -0,0 +1,8 @@
+accepted: a
+accepted: a a a
+accepted: a b b b
+accepted: a bb
+accepted: a a aaa a aaa
+rejected: a a aaa a
+rejected: a b a
+rejected: 
@@ -0,0 +1,8 @@
+accepted, 1 tree: a
+accepted, 1 tree: a a a
+accepted, 1 tree: a b b b
+accepted, 1 tree: a bb
+accepted, 1 tree: a a aaa a aaa
+rejected at end of input: a a aaa a
+rejected at end of input: a b a
+rejected at end of input: 
@@ -2,7 +2,7 @@ start:
   <S>;
 names:
 rules:
-  <S> := ("a" [((({("b")}) | ({("a")})))] (({(("a" <A>))}) | (<B>)));
+  <S> := ("a" [((({("a")}) | ({("b")})))] ((<B>) | ({(("a" <A>))})));
   <B> := ("bb");
   <A> := ("aaa");
 
@@ -0,0 +1 @@
+Table has 4 conflicts, cannot recognize
@@ -0,0 +1,21 @@
+conflicts:
+  <opt(((mult(a))or(mult(b))))> on "a": <opt(((mult(a))or(mult(b))))> := <mult(a)> "a"; <opt(((mult(a))or(mult(b))))> := EPS;
+  <mult(a)> on "a": <mult(a)> := <mult(a)> "a"; <mult(a)> := EPS;
+  <mult(b)> on "b": <mult(b)> := <mult(b)> "b"; <mult(b)> := EPS;
+  <mult((a A'))> on "a": <mult((a A'))> := <mult((a A'))> "a" <A>; <mult((a A'))> := EPS;
+table:
+  <S> on "a": <S> := "a" <opt(((mult(a))or(mult(b))))> <((B')or(mult((a A'))))>;
+  <opt(((mult(a))or(mult(b))))> on "a": <opt(((mult(a))or(mult(b))))> := <mult(a)> "a";
+  <opt(((mult(a))or(mult(b))))> on "b": <opt(((mult(a))or(mult(b))))> := <mult(b)> "b";
+  <opt(((mult(a))or(mult(b))))> on "bb": <opt(((mult(a))or(mult(b))))> := EPS;
+  <opt(((mult(a))or(mult(b))))> on $end: <opt(((mult(a))or(mult(b))))> := EPS;
+  <((B')or(mult((a A'))))> on "a": <((B')or(mult((a A'))))> := <mult((a A'))> "a" <A>;
+  <((B')or(mult((a A'))))> on "bb": <((B')or(mult((a A'))))> := "bb";
+  <((B')or(mult((a A'))))> on $end: <((B')or(mult((a A'))))> := EPS;
+  <A> on "aaa": <A> := "aaa";
+  <mult(a)> on "a": <mult(a)> := <mult(a)> "a";
+  <mult(b)> on "b": <mult(b)> := <mult(b)> "b";
+  <mult((a A'))> on "a": <mult((a A'))> := <mult((a A'))> "a" <A>;
+compressed:
+  12 entries in 12 slots;
+
@@ -0,0 +1,13 @@
+start:
+  <S>;
+names:
+rules:
+  <S> := ("a" <opt(((mult(a))or(mult(b))))> <((B')or(mult((a A'))))>);
+  <opt(((mult(a))or(mult(b))))> := ((<mult(a)> "a") | EPS | (<mult(b)> "b"));
+  <((B')or(mult((a A'))))> := ("bb" | (<mult((a A'))> "a" <A>) | EPS);
+  <A> := "aaa";
+  <mult(a)> := ((<mult(a)> "a") | EPS);
+  <mult(b)> := ((<mult(b)> "b") | EPS);
+  <mult((a A'))> := ((<mult((a A'))> "a" <A>) | EPS);
+
+eliminated 0 of 14 productions: removed 0 useless non-terminals, merged 0 equivalent ones
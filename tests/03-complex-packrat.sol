@@ -0,0 +1,9 @@
+accepted: a
+accepted: a a a
+rejected: a b b b
+accepted: a bb
+rejected: a a aaa a aaa
+rejected: a a aaa a
+rejected: a b a
+rejected: 
+memo: 15 lookups, 0 hits (0.0%), 15 stores, 0 evictions, peak size 2
@@ -0,0 +1,8 @@
+accepted: a
+rejected: a a a
+accepted: a b b b
+accepted: a bb
+accepted: a a aaa a aaa
+rejected: a a aaa a
+rejected: a b a
+rejected: 
@@ -0,0 +1,17 @@
+start:
+  <S>;
+names:
+rules:
+  <S> := ("a" <S''>);
+  <opt(((mult(a))or(mult(b))))> := ((<mult(a)> "a") | "a" | (<mult(b)> "b") | "b");
+  <((B')or(mult((a A'))))> := ("bb" | (<mult((a A'))> "a" <A>) | ("a" <A>));
+  <A> := "aaa";
+  <mult(a)> := ("a" <mult(a)-mult(a)>);
+  <mult(b)> := ("b" <mult(b)-mult(b)>);
+  <mult((a A'))> := ("a" <A> <mult((a A'))-mult((a A'))>);
+  <mult(a)-mult(a)> := (("a" <mult(a)-mult(a)>) | EPS);
+  <mult(b)-mult(b)> := (("b" <mult(b)-mult(b)>) | EPS);
+  <mult((a A'))-mult((a A'))> := (("a" <A> <mult((a A'))-mult((a A'))>) | EPS);
+  <S'> := (<((B')or(mult((a A'))))> | EPS);
+  <S''> := ((<opt(((mult(a))or(mult(b))))> <S'>) | <((B')or(mult((a A'))))> | EPS);
+
@@ -0,0 +1 @@
+Grammar is incorrect, cannot parse
@@ -0,0 +1,17 @@
+nullable:
+  <mult(back Str')>;
+  <mult(Char\>')>;
+  <Char\>>;
+first:
+  <Expr> : "a\"b" "\"";
+  <Str> : "\"";
+  <mult(back Str')> : "\\";
+  <mult(Char\>')> : "x" "\\\";
+  <Char\>> : "x" "\\\";
+follow:
+  <Expr> : $end;
+  <Str> : "\\" $end;
+  <mult(back Str')> : "\\" $end;
+  <mult(Char\>')> : "\"" "x" "\\\";
+  <Char\>> : "\"" "x" "\\\";
+
@@ -0,0 +1,16 @@
+start:
+  <Expr>;
+names:
+rules:
+  <Expr> := ((<Str> <mult(back Str')>) | "a\"b" | (<\"> <(mult(Char\>') \")>));
+  <Str> := (<\"> <(mult(Char\>') \")>);
+  <mult(back Str')> := ((<mult(back Str')> <(\\ Str)>) | (<\\> <Str>));
+  <mult(Char\>')> := ((<mult(Char\>')> <Char\>>) | "x" | (<\\\> < | >));
+  <Char\>> := ("x" | (<\\\> < | >));
+  <\"> := "\"";
+  <\\> := "\\";
+  <\\\> := "\\\";
+  < | > := " | ";
+  <(mult(Char\>') \")> := ((<mult(Char\>')> <\">) | "\"");
+  <(\\ Str)> := (<\\> <Str>);
+
@@ -0,0 +1,26 @@
+symbols:
+  0 "a\"b"
+  1 "\""
+  2 "x"
+  3 "\\\"
+  4 " | "
+  5 "\\"
+  6 <Expr>
+  7 <Str>
+  8 <mult(back Str')>
+  9 <mult(Char\>')>
+  10 <Char\>>
+start:
+  6;
+productions:
+  6 := 7 8;
+  6 := 0;
+  7 := 1 9 1;
+  8 := 8 5 7;
+  8 :=;
+  9 := 9 10;
+  9 :=;
+  10 := 2;
+  10 := 3 4;
+  10 :=;
+
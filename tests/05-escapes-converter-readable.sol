@@ -0,0 +1,10 @@
+start:
+  <Expr>;
+names:
+rules:
+  <Expr> := ((<Str> <D>) | "a\"b");
+  <Str> := ("\"" <B> "\"");
+  <Char\>> := ("x" | ("\\\" " | ") | EPS);
+  <B> := ((<B> <Char\>>) | EPS);
+  <D> := ((<D> "\\" <Str>) | EPS);
+
@@ -0,0 +1,10 @@
+start:
+  <Expr>;
+names:
+rules:
+  <Expr> := ((<Str> <mult(back Str')>) | "a\"b");
+  <Str> := ("\"" <mult(Char\>')> "\"");
+  <Char\>> := ("x" | ("\\\" " | ") | EPS);
+  <mult(Char\>')> := ((<mult(Char\>')> <Char\>>) | EPS);
+  <mult(back Str')> := ((<mult(back Str')> "\\" <Str>) | EPS);
+
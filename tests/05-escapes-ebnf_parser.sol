@@ -0,0 +1,13 @@
+Illegal character < at line 9, column 31
+Illegal character > at line 9, column 32
+Illegal character " at line 9, column 33
+start:
+  <Expr>;
+names:
+ $quote := "\"";
+ $back := "\\";
+rules:
+  <Expr> := ((<Str> {($back <Str>)}) | ("a\"b"));
+  <Str> := ($quote {(<Char\>>)} $quote);
+  <Char\>> := (("x") | ("\\\" " | ") | (EPS));
+
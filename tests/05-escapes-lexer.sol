@@ -0,0 +1,40 @@
+LexToken(START,'start:',1,0)
+LexToken(NON_TERMINAL,'Expr',2,9)
+LexToken(BIND_END,';',2,15)
+LexToken(NAMES,'names:',3,17)
+LexToken(NAME,'quote',4,26)
+LexToken(BIND,':=',4,33)
+LexToken(TERMINAL,'\\"',4,36)
+LexToken(BIND_END,';',4,40)
+LexToken(NAME,'back',5,44)
+LexToken(BIND,':=',5,50)
+LexToken(TERMINAL,'\\\\',5,53)
+LexToken(BIND_END,';',5,57)
+LexToken(RULES,'rules:',6,59)
+LexToken(NON_TERMINAL,'Expr',7,68)
+LexToken(BIND,':=',7,75)
+LexToken(NON_TERMINAL,'Str',7,78)
+LexToken(LKLEENE,'{',7,84)
+LexToken(NAME,'back',7,85)
+LexToken(NON_TERMINAL,'Str',7,91)
+LexToken(RKLEENE,'}',7,96)
+LexToken(ALT_SEP,'|',7,98)
+LexToken(TERMINAL,'a\\"b',7,100)
+LexToken(BIND_END,';',7,106)
+LexToken(NON_TERMINAL,'Str',8,110)
+LexToken(BIND,':=',8,116)
+LexToken(NAME,'quote',8,119)
+LexToken(LKLEENE,'{',8,126)
+LexToken(NON_TERMINAL,'Char\\>',8,127)
+LexToken(RKLEENE,'}',8,135)
+LexToken(NAME,'quote',8,137)
+LexToken(BIND_END,';',8,143)
+LexToken(NON_TERMINAL,'Char\\>',9,147)
+LexToken(BIND,':=',9,156)
+LexToken(TERMINAL,'x',9,159)
+LexToken(ALT_SEP,'|',9,163)
+LexToken(TERMINAL,'\\\\\\',9,165)
+LexToken(TERMINAL,' | ',9,170)
+LexToken(ALT_SEP,'|',9,179)
+LexToken(EPSILON,'EPS',9,181)
+LexToken(BIND_END,';',9,184)
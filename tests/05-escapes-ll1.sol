@@ -0,0 +1,22 @@
+conflicts:
+  <mult(back Str')> on "\\": <mult(back Str')> := <mult(back Str')> "\\" <Str>; <mult(back Str')> := EPS;
+  <mult(Char\>')> on "\"": <mult(Char\>')> := <mult(Char\>')> <Char\>>; <mult(Char\>')> := EPS;
+  <mult(Char\>')> on "x": <mult(Char\>')> := <mult(Char\>')> <Char\>>; <mult(Char\>')> := EPS;
+  <mult(Char\>')> on "\\\": <mult(Char\>')> := <mult(Char\>')> <Char\>>; <mult(Char\>')> := EPS;
+  <Char\>> on "x": <Char\>> := "x"; <Char\>> := EPS;
+  <Char\>> on "\\\": <Char\>> := "\\\" " | "; <Char\>> := EPS;
+table:
+  <Expr> on "a\"b": <Expr> := "a\"b";
+  <Expr> on "\"": <Expr> := <Str> <mult(back Str')>;
+  <Str> on "\"": <Str> := "\"" <mult(Char\>')> "\"";
+  <mult(back Str')> on "\\": <mult(back Str')> := <mult(back Str')> "\\" <Str>;
+  <mult(back Str')> on $end: <mult(back Str')> := EPS;
+  <mult(Char\>')> on "\"": <mult(Char\>')> := <mult(Char\>')> <Char\>>;
+  <mult(Char\>')> on "x": <mult(Char\>')> := <mult(Char\>')> <Char\>>;
+  <mult(Char\>')> on "\\\": <mult(Char\>')> := <mult(Char\>')> <Char\>>;
+  <Char\>> on "\"": <Char\>> := EPS;
+  <Char\>> on "x": <Char\>> := "x";
+  <Char\>> on "\\\": <Char\>> := "\\\" " | ";
+compressed:
+  11 entries in 11 slots;
+
@@ -0,0 +1,11 @@
+start:
+  <Expr>;
+names:
+rules:
+  <Expr> := ((<Str> <mult(back Str')>) | "a\"b");
+  <Str> := ("\"" <mult(Char\>')> "\"");
+  <mult(back Str')> := ((<mult(back Str')> "\\" <Str>) | EPS);
+  <mult(Char\>')> := ((<mult(Char\>')> <Char\>>) | EPS);
+  <Char\>> := ("x" | ("\\\" " | ") | EPS);
+
+eliminated 0 of 10 productions: removed 0 useless non-terminals, merged 0 equivalent ones
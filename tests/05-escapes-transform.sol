@@ -0,0 +1,13 @@
+start:
+  <Expr>;
+names:
+rules:
+  <Expr> := ((<Str> <mult(back Str')>) | "a\"b" | ("\"" <Expr'>));
+  <Str> := ("\"" <Expr'>);
+  <mult(back Str')> := ("\\" <Str> <mult(back Str')-mult(back Str')>);
+  <mult(Char\>')> := (("x" <mult(Char\>')-mult(Char\>')>) | ("\\\" " | " <mult(Char\>')-mult(Char\>')>));
+  <Char\>> := ("x" | ("\\\" " | "));
+  <mult(back Str')-mult(back Str')> := (("\\" <Str> <mult(back Str')-mult(back Str')>) | EPS);
+  <mult(Char\>')-mult(Char\>')> := ((<Char\>> <mult(Char\>')-mult(Char\>')>) | EPS);
+  <Expr'> := ((<mult(Char\>')> "\"") | "\"");
+
@@ -0,0 +1,20 @@
+nullable:
+  <S>;
+  <mult(a')>;
+  <B>;
+  <mult(a')'>;
+first:
+  <S> : "x" "y" "z" "a";
+  <A> : "y" "z";
+  <mult(a')> : "z";
+  <B> : "z";
+  <mult(a')'> : "a";
+  <a> : "z";
+follow:
+  <S> : $end;
+  <A> : "z" $end;
+  <mult(a')> : "x" "y" "z" $end;
+  <B> : "a" $end;
+  <mult(a')'> : "a" $end;
+  <a> : "x" "y" "z" "a" $end;
+
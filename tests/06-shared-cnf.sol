@@ -0,0 +1,14 @@
+start:
+  <S>;
+names:
+rules:
+  <S> := ((<A> <mult(a')>) | (<B> <mult(a')'>) | (<mult(a')> <x>) | EPS | (<mult(a')> <y>) | (<mult(a')'> <a'>) | (<mult(a')> <a>) | "x" | "y" | "a" | "z");
+  <A> := ((<mult(a')> <y>) | "y");
+  <mult(a')> := ((<mult(a')> <a>) | "z");
+  <B> := ((<mult(a')> <a>) | "z");
+  <mult(a')'> := ((<mult(a')'> <a'>) | "a");
+  <a> := "z";
+  <x> := "x";
+  <y> := "y";
+  <a'> := "a";
+
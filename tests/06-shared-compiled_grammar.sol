@@ -0,0 +1,26 @@
+symbols:
+  0 "x"
+  1 "y"
+  2 "z"
+  3 "a"
+  4 <S>
+  5 <A>
+  6 <mult(a')>
+  7 <B>
+  8 <mult(a')'>
+  9 <a>
+start:
+  4;
+productions:
+  4 := 5 6;
+  4 := 7 8;
+  4 := 6 0;
+  5 := 6 1;
+  6 := 6 9;
+  6 :=;
+  7 := 6 9;
+  7 :=;
+  8 := 8 3;
+  8 :=;
+  9 := 2;
+
@@ -0,0 +1,11 @@
+start:
+  <S>;
+names:
+rules:
+  <S> := ((<A> <D>) | (<B> <E>) | (<D> "x"));
+  <A> := (<D> "y");
+  <B> := ((<D> <a>) | EPS);
+  <a> := "z";
+  <D> := ((<D> <a>) | EPS);
+  <E> := ((<E> "a") | EPS);
+
@@ -0,0 +1,11 @@
+start:
+  <S>;
+names:
+rules:
+  <S> := ((<A> <mult(a')>) | (<B> <mult(a')'>) | (<mult(a')> "x"));
+  <A> := (<mult(a')> "y");
+  <B> := ((<mult(a')> <a>) | EPS);
+  <a> := "z";
+  <mult(a')> := ((<mult(a')> <a>) | EPS);
+  <mult(a')'> := ((<mult(a')'> "a") | EPS);
+
@@ -0,0 +1,8 @@
+accepted: y
+accepted: z z y z
+accepted: z x
+accepted: a
+accepted: z a
+accepted: a a
+accepted: z z x
+rejected: a z x
@@ -0,0 +1,8 @@
+accepted, 1 tree: y
+accepted, 1 tree: z z y z
+accepted, 1 tree: z x
+accepted, 1 tree: a
+accepted, 1 tree: z a
+accepted, 1 tree: a a
+accepted, 1 tree: z z x
+rejected at token 2: a z x
@@ -0,0 +1,9 @@
+start:
+  <S>;
+names:
+rules:
+  <S> := ((<A> {(<a>)}) | (<B> {("a")}) | ({(<a>)} "x"));
+  <A> := ({(<a>)} "y");
+  <B> := ({(<a>)});
+  <a> := ("z");
+
@@ -0,0 +1,39 @@
+LexToken(START,'start:',1,0)
+LexToken(NON_TERMINAL,'S',2,9)
+LexToken(BIND_END,';',2,12)
+LexToken(NAMES,'names:',3,14)
+LexToken(RULES,'rules:',4,21)
+LexToken(NON_TERMINAL,'S',5,30)
+LexToken(BIND,':=',5,34)
+LexToken(NON_TERMINAL,'A',5,37)
+LexToken(LKLEENE,'{',5,41)
+LexToken(NON_TERMINAL,'a',5,42)
+LexToken(RKLEENE,'}',5,45)
+LexToken(ALT_SEP,'|',5,47)
+LexToken(NON_TERMINAL,'B',5,49)
+LexToken(LKLEENE,'{',5,53)
+LexToken(TERMINAL,'a',5,54)
+LexToken(RKLEENE,'}',5,57)
+LexToken(ALT_SEP,'|',5,59)
+LexToken(LKLEENE,'{',5,61)
+LexToken(NON_TERMINAL,'a',5,62)
+LexToken(RKLEENE,'}',5,65)
+LexToken(TERMINAL,'x',5,67)
+LexToken(BIND_END,';',5,70)
+LexToken(NON_TERMINAL,'A',6,74)
+LexToken(BIND,':=',6,78)
+LexToken(LKLEENE,'{',6,81)
+LexToken(NON_TERMINAL,'a',6,82)
+LexToken(RKLEENE,'}',6,85)
+LexToken(TERMINAL,'y',6,87)
+LexToken(BIND_END,';',6,90)
+LexToken(NON_TERMINAL,'B',7,94)
+LexToken(BIND,':=',7,98)
+LexToken(LKLEENE,'{',7,101)
+LexToken(NON_TERMINAL,'a',7,102)
+LexToken(RKLEENE,'}',7,105)
+LexToken(BIND_END,';',7,106)
+LexToken(NON_TERMINAL,'a',8,110)
+LexToken(BIND,':=',8,114)
+LexToken(TERMINAL,'z',8,117)
+LexToken(BIND_END,';',8,120)
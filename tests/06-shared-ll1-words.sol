@@ -0,0 +1 @@
+Table has 3 conflicts, cannot recognize
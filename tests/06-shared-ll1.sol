@@ -0,0 +1,25 @@
+conflicts:
+  <S> on "z": <S> := <A> <mult(a')>; <S> := <B> <mult(a')'>; <S> := <mult(a')> "x";
+  <mult(a')> on "z": <mult(a')> := <mult(a')> <a>; <mult(a')> := EPS;
+  <mult(a')'> on "a": <mult(a')'> := <mult(a')'> "a"; <mult(a')'> := EPS;
+table:
+  <S> on "x": <S> := <mult(a')> "x";
+  <S> on "y": <S> := <A> <mult(a')>;
+  <S> on "z": <S> := <A> <mult(a')>;
+  <S> on "a": <S> := <B> <mult(a')'>;
+  <S> on $end: <S> := <B> <mult(a')'>;
+  <A> on "y": <A> := <mult(a')> "y";
+  <A> on "z": <A> := <mult(a')> "y";
+  <mult(a')> on "x": <mult(a')> := EPS;
+  <mult(a')> on "y": <mult(a')> := EPS;
+  <mult(a')> on "z": <mult(a')> := <mult(a')> <a>;
+  <mult(a')> on $end: <mult(a')> := EPS;
+  <B> on "z": <B> := <mult(a')> <a>;
+  <B> on "a": <B> := EPS;
+  <B> on $end: <B> := EPS;
+  <mult(a')'> on "a": <mult(a')'> := <mult(a')'> "a";
+  <mult(a')'> on $end: <mult(a')'> := EPS;
+  <a> on "z": <a> := "z";
+compressed:
+  17 entries in 17 slots;
+
@@ -0,0 +1,11 @@
+start:
+  <S>;
+names:
+rules:
+  <S> := ((<A> <mult(a')>) | (<mult(a')> <mult(a')'>) | (<mult(a')> "x"));
+  <A> := (<mult(a')> "y");
+  <mult(a')> := ((<mult(a')> <a>) | EPS);
+  <mult(a')'> := ((<mult(a')'> "a") | EPS);
+  <a> := "z";
+
+eliminated 2 of 11 productions: removed 0 useless non-terminals, merged 1 equivalent ones
@@ -0,0 +1,9 @@
+accepted: y
+accepted: z z y z
+rejected: z x
+accepted: a
+accepted: z a
+accepted: a a
+rejected: z z x
+rejected: a z x
+memo: 49 lookups, 10 hits (20.4%), 39 stores, 0 evictions, peak size 7
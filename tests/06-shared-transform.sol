@@ -0,0 +1,14 @@
+start:
+  <S>;
+names:
+rules:
+  <S> := ((<A> <mult(a')>) | (<B> <mult(a')'>) | (<mult(a')> <S'>) | "x" | "y" | (<mult(a')'> "a") | "a" | "z" | EPS);
+  <A> := ((<mult(a')> "y") | "y");
+  <mult(a')> := ("z" <mult(a')-mult(a')>);
+  <B> := ((<mult(a')> <a>) | "z");
+  <mult(a')'> := ("a" <mult(a')'-mult(a')'>);
+  <a> := "z";
+  <mult(a')-mult(a')> := ((<a> <mult(a')-mult(a')>) | EPS);
+  <mult(a')'-mult(a')'> := (("a" <mult(a')'-mult(a')'>) | EPS);
+  <S'> := ("x" | "y" | <a>);
+
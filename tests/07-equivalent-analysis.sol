@@ -0,0 +1,14 @@
+nullable:
+first:
+  <S> : "w" "x" "y";
+  <A> : "x" "y";
+  <B> : "x" "y";
+  <C> : "x" "y";
+  <D> : "x" "y";
+follow:
+  <S> : $end;
+  <A> : "x" "y" $end;
+  <B> : "x" "y" $end;
+  <C> : "z" $end;
+  <D> : "z" $end;
+
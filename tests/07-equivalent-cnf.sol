@@ -0,0 +1,13 @@
+start:
+  <S>;
+names:
+rules:
+  <S> := ((<A> <B>) | (<C> <z>) | (<w> <D>));
+  <A> := ((<x> <B>) | "y");
+  <B> := ((<x> <A>) | "y");
+  <C> := ((<x> <D>) | "y");
+  <D> := ((<x> <C>) | "y");
+  <z> := "z";
+  <w> := "w";
+  <x> := "x";
+
@@ -0,0 +1,25 @@
+symbols:
+  0 "z"
+  1 "w"
+  2 "x"
+  3 "y"
+  4 <S>
+  5 <A>
+  6 <B>
+  7 <C>
+  8 <D>
+start:
+  4;
+productions:
+  4 := 5 6;
+  4 := 7 0;
+  4 := 1 8;
+  5 := 2 6;
+  5 := 3;
+  6 := 2 5;
+  6 := 3;
+  7 := 2 8;
+  7 := 3;
+  8 := 2 7;
+  8 := 3;
+
@@ -0,0 +1,6 @@
+accepted: y y
+accepted: x y x x y
+accepted: x x y z
+accepted: w x y
+rejected: x y
+rejected: y
@@ -0,0 +1,6 @@
+accepted, 1 tree: y y
+accepted, 1 tree: x y x x y
+accepted, 1 tree: x x y z
+accepted, 1 tree: w x y
+rejected at end of input: x y
+rejected at end of input: y
@@ -0,0 +1,51 @@
+LexToken(START,'start:',1,0)
+LexToken(NON_TERMINAL,'S',2,9)
+LexToken(BIND_END,';',2,12)
+LexToken(NAMES,'names:',3,14)
+LexToken(RULES,'rules:',4,21)
+LexToken(NON_TERMINAL,'S',5,30)
+LexToken(BIND,':=',5,34)
+LexToken(NON_TERMINAL,'A',5,37)
+LexToken(NON_TERMINAL,'B',5,41)
+LexToken(ALT_SEP,'|',5,45)
+LexToken(NON_TERMINAL,'C',5,47)
+LexToken(TERMINAL,'z',5,51)
+LexToken(ALT_SEP,'|',5,55)
+LexToken(TERMINAL,'w',5,57)
+LexToken(NON_TERMINAL,'D',5,61)
+LexToken(BIND_END,';',5,64)
+LexToken(NON_TERMINAL,'A',6,68)
+LexToken(BIND,':=',6,72)
+LexToken(TERMINAL,'x',6,75)
+LexToken(NON_TERMINAL,'B',6,79)
+LexToken(ALT_SEP,'|',6,83)
+LexToken(TERMINAL,'y',6,85)
+LexToken(BIND_END,';',6,88)
+LexToken(NON_TERMINAL,'B',7,92)
+LexToken(BIND,':=',7,96)
+LexToken(TERMINAL,'x',7,99)
+LexToken(NON_TERMINAL,'A',7,103)
+LexToken(ALT_SEP,'|',7,107)
+LexToken(TERMINAL,'y',7,109)
+LexToken(BIND_END,';',7,112)
+LexToken(NON_TERMINAL,'C',8,116)
+LexToken(BIND,':=',8,120)
+LexToken(TERMINAL,'x',8,123)
+LexToken(NON_TERMINAL,'D',8,127)
+LexToken(ALT_SEP,'|',8,131)
+LexToken(TERMINAL,'y',8,133)
+LexToken(BIND_END,';',8,136)
+LexToken(NON_TERMINAL,'D',9,140)
+LexToken(BIND,':=',9,144)
+LexToken(TERMINAL,'x',9,147)
+LexToken(NON_TERMINAL,'C',9,151)
+LexToken(ALT_SEP,'|',9,155)
+LexToken(TERMINAL,'y',9,157)
+LexToken(BIND_END,';',9,160)
+LexToken(NON_TERMINAL,'E',10,164)
+LexToken(BIND,':=',10,168)
+LexToken(TERMINAL,'x',10,171)
+LexToken(NON_TERMINAL,'E',10,175)
+LexToken(ALT_SEP,'|',10,179)
+LexToken(TERMINAL,'y',10,181)
+LexToken(BIND_END,';',10,184)
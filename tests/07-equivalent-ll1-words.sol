@@ -0,0 +1 @@
+Table has 2 conflicts, cannot recognize
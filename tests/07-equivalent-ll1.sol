@@ -0,0 +1,18 @@
+conflicts:
+  <S> on "x": <S> := <A> <B>; <S> := <C> "z";
+  <S> on "y": <S> := <A> <B>; <S> := <C> "z";
+table:
+  <S> on "w": <S> := "w" <D>;
+  <S> on "x": <S> := <A> <B>;
+  <S> on "y": <S> := <A> <B>;
+  <A> on "x": <A> := "x" <B>;
+  <A> on "y": <A> := "y";
+  <B> on "x": <B> := "x" <A>;
+  <B> on "y": <B> := "y";
+  <C> on "x": <C> := "x" <D>;
+  <C> on "y": <C> := "y";
+  <D> on "x": <D> := "x" <C>;
+  <D> on "y": <D> := "y";
+compressed:
+  11 entries in 11 slots;
+
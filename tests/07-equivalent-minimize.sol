@@ -0,0 +1,8 @@
+start:
+  <S>;
+names:
+rules:
+  <S> := ((<A> <A>) | (<A> "z") | ("w" <A>));
+  <A> := (("x" <A>) | "y");
+
+eliminated 6 of 11 productions: removed 0 useless non-terminals, merged 3 equivalent ones
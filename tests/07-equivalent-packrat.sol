@@ -0,0 +1,7 @@
+accepted: y y
+accepted: x y x x y
+accepted: x x y z
+accepted: w x y
+rejected: x y
+rejected: y
+memo: 32 lookups, 0 hits (0.0%), 32 stores, 0 evictions, peak size 8
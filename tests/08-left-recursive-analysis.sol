@@ -0,0 +1,17 @@
+nullable:
+  <opt(o)>;
+first:
+  <E> : "(" "n" "[" "y";
+  <T> : "(" "n" "[" "y";
+  <F> : "(" "n" "[" "y";
+  <G> : "(" "n" "[" "y";
+  <H> : "k" "o";
+  <opt(o)> : "o";
+follow:
+  <E> : "+" "-" ")" $end;
+  <T> : "+" "-" ")" $end;
+  <F> : "*" "/" "x";
+  <G> : "!";
+  <H> : "]" "h";
+  <opt(o)> : "k" "o";
+
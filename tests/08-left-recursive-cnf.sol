@@ -0,0 +1,31 @@
+start:
+  <E'>;
+names:
+rules:
+  <E'> := ((<E> <(+ T)>) | (<E> <(- T)>) | (<F> <(* T)>) | (<F> <(* * T)>) | (<F> <(/ T)>) | (<(> <(E ))>) | "n" | (<G> <!>) | (<[> <(H ])>));
+  <E> := ((<E> <(+ T)>) | (<E> <(- T)>) | (<F> <(* T)>) | (<F> <(* * T)>) | (<F> <(/ T)>) | (<(> <(E ))>) | "n" | (<G> <!>) | (<[> <(H ])>));
+  <T> := ((<F> <(* T)>) | (<F> <(* * T)>) | (<F> <(/ T)>) | (<(> <(E ))>) | "n" | (<G> <!>) | (<[> <(H ])>));
+  <F> := ((<(> <(E ))>) | "n" | (<G> <!>) | (<[> <(H ])>));
+  <G> := ((<F> <x>) | "y");
+  <H> := ((<opt(o)> <(H h)>) | "k" | (<H> <h>));
+  <opt(o)> := "o";
+  <+> := "+";
+  <-> := "-";
+  <*> := "*";
+  </> := "/";
+  <(> := "(";
+  <)> := ")";
+  <!> := "!";
+  <[> := "[";
+  <]> := "]";
+  <x> := "x";
+  <h> := "h";
+  <(+ T)> := (<+> <T>);
+  <(- T)> := (<-> <T>);
+  <(* T)> := (<*> <T>);
+  <(* * T)> := (<*> <(* T)>);
+  <(/ T)> := (</> <T>);
+  <(E ))> := (<E> <)>);
+  <(H ])> := (<H> <]>);
+  <(H h)> := (<H> <h>);
+
@@ -0,0 +1,52 @@
+symbols:
+  0 "+"
+  1 "-"
+  2 "*"
+  3 "/"
+  4 "("
+  5 ")"
+  6 "n"
+  7 "!"
+  8 "["
+  9 "]"
+  10 "x"
+  11 "y"
+  12 "h"
+  13 "k"
+  14 "o"
+  15 <E>
+  16 <T>
+  17 <F>
+  18 <G>
+  19 <H>
+  20 <opt(o)>
+start:
+  15;
+productions:
+  15 := 15 0 16;
+  15 := 15 1 16;
+  15 := 17 2 16;
+  15 := 17 2 2 16;
+  15 := 17 3 16;
+  15 := 4 15 5;
+  15 := 6;
+  15 := 18 7;
+  15 := 8 19 9;
+  16 := 17 2 16;
+  16 := 17 2 2 16;
+  16 := 17 3 16;
+  16 := 4 15 5;
+  16 := 6;
+  16 := 18 7;
+  16 := 8 19 9;
+  17 := 4 15 5;
+  17 := 6;
+  17 := 18 7;
+  17 := 8 19 9;
+  18 := 17 10;
+  18 := 11;
+  19 := 20 19 12;
+  19 := 13;
+  20 := 14;
+  20 :=;
+
@@ -0,0 +1,11 @@
+start:
+  <E>;
+names:
+rules:
+  <E> := ((<E> "+" <T>) | (<E> "-" <T>) | (<F> "*" <T>) | (<F> "*" "*" <T>) | (<F> "/" <T>) | ("(" <E> ")") | "n" | (<G> "!") | ("[" <H> "]"));
+  <T> := ((<F> "*" <T>) | (<F> "*" "*" <T>) | (<F> "/" <T>) | ("(" <E> ")") | "n" | (<G> "!") | ("[" <H> "]"));
+  <F> := (("(" <E> ")") | "n" | (<G> "!") | ("[" <H> "]"));
+  <G> := ((<F> "x") | "y");
+  <H> := ((<J> <H> "h") | "k");
+  <J> := ("o" | EPS);
+
@@ -0,0 +1,10 @@
+start:
+  <E>;
+names:
+rules:
+  <E> := ((<E> "+" <T>) | (<E> "-" <T>) | (<T>));
+  <T> := ((<F> "*" <T>) | (<F> "*" "*" <T>) | (<F> "/" <T>) | (<F>));
+  <F> := (("(" <E> ")") | ("n") | (<G> "!") | ("[" <H> "]"));
+  <G> := ((<F> "x") | ("y"));
+  <H> := (([("o")] <H> "h") | ("k"));
+
@@ -0,0 +1,66 @@
+LexToken(START,'start:',1,0)
+LexToken(NON_TERMINAL,'E',2,9)
+LexToken(BIND_END,';',2,12)
+LexToken(NAMES,'names:',3,14)
+LexToken(RULES,'rules:',4,21)
+LexToken(NON_TERMINAL,'E',5,30)
+LexToken(BIND,':=',5,34)
+LexToken(NON_TERMINAL,'E',5,37)
+LexToken(TERMINAL,'+',5,41)
+LexToken(NON_TERMINAL,'T',5,45)
+LexToken(ALT_SEP,'|',5,49)
+LexToken(NON_TERMINAL,'E',5,51)
+LexToken(TERMINAL,'-',5,55)
+LexToken(NON_TERMINAL,'T',5,59)
+LexToken(ALT_SEP,'|',5,63)
+LexToken(NON_TERMINAL,'T',5,65)
+LexToken(BIND_END,';',5,68)
+LexToken(NON_TERMINAL,'T',6,72)
+LexToken(BIND,':=',6,76)
+LexToken(NON_TERMINAL,'F',6,79)
+LexToken(TERMINAL,'*',6,83)
+LexToken(NON_TERMINAL,'T',6,87)
+LexToken(ALT_SEP,'|',6,91)
+LexToken(NON_TERMINAL,'F',6,93)
+LexToken(TERMINAL,'*',6,97)
+LexToken(TERMINAL,'*',6,101)
+LexToken(NON_TERMINAL,'T',6,105)
+LexToken(ALT_SEP,'|',6,109)
+LexToken(NON_TERMINAL,'F',6,111)
+LexToken(TERMINAL,'/',6,115)
+LexToken(NON_TERMINAL,'T',6,119)
+LexToken(ALT_SEP,'|',6,123)
+LexToken(NON_TERMINAL,'F',6,125)
+LexToken(BIND_END,';',6,128)
+LexToken(NON_TERMINAL,'F',7,132)
+LexToken(BIND,':=',7,136)
+LexToken(TERMINAL,'(',7,139)
+LexToken(NON_TERMINAL,'E',7,143)
+LexToken(TERMINAL,')',7,147)
+LexToken(ALT_SEP,'|',7,151)
+LexToken(TERMINAL,'n',7,153)
+LexToken(ALT_SEP,'|',7,157)
+LexToken(NON_TERMINAL,'G',7,159)
+LexToken(TERMINAL,'!',7,163)
+LexToken(ALT_SEP,'|',7,167)
+LexToken(TERMINAL,'[',7,169)
+LexToken(NON_TERMINAL,'H',7,173)
+LexToken(TERMINAL,']',7,177)
+LexToken(BIND_END,';',7,180)
+LexToken(NON_TERMINAL,'G',8,184)
+LexToken(BIND,':=',8,188)
+LexToken(NON_TERMINAL,'F',8,191)
+LexToken(TERMINAL,'x',8,195)
+LexToken(ALT_SEP,'|',8,199)
+LexToken(TERMINAL,'y',8,201)
+LexToken(BIND_END,';',8,204)
+LexToken(NON_TERMINAL,'H',9,208)
+LexToken(BIND,':=',9,212)
+LexToken(LOPT,'[',9,215)
+LexToken(TERMINAL,'o',9,216)
+LexToken(ROPT,']',9,219)
+LexToken(NON_TERMINAL,'H',9,221)
+LexToken(TERMINAL,'h',9,225)
+LexToken(ALT_SEP,'|',9,229)
+LexToken(TERMINAL,'k',9,231)
+LexToken(BIND_END,';',9,234)
@@ -0,0 +1,39 @@
+conflicts:
+  <E> on "(": <E> := <E> "+" <T>; <E> := <E> "-" <T>; <E> := <F> "*" <T>; <E> := <F> "*" "*" <T>; <E> := <F> "/" <T>; <E> := "(" <E> ")"; <E> := <G> "!";
+  <E> on "n": <E> := <E> "+" <T>; <E> := <E> "-" <T>; <E> := <F> "*" <T>; <E> := <F> "*" "*" <T>; <E> := <F> "/" <T>; <E> := "n"; <E> := <G> "!";
+  <E> on "[": <E> := <E> "+" <T>; <E> := <E> "-" <T>; <E> := <F> "*" <T>; <E> := <F> "*" "*" <T>; <E> := <F> "/" <T>; <E> := <G> "!"; <E> := "[" <H> "]";
+  <E> on "y": <E> := <E> "+" <T>; <E> := <E> "-" <T>; <E> := <F> "*" <T>; <E> := <F> "*" "*" <T>; <E> := <F> "/" <T>; <E> := <G> "!";
+  <T> on "(": <T> := <F> "*" <T>; <T> := <F> "*" "*" <T>; <T> := <F> "/" <T>; <T> := "(" <E> ")"; <T> := <G> "!";
+  <T> on "n": <T> := <F> "*" <T>; <T> := <F> "*" "*" <T>; <T> := <F> "/" <T>; <T> := "n"; <T> := <G> "!";
+  <T> on "[": <T> := <F> "*" <T>; <T> := <F> "*" "*" <T>; <T> := <F> "/" <T>; <T> := <G> "!"; <T> := "[" <H> "]";
+  <T> on "y": <T> := <F> "*" <T>; <T> := <F> "*" "*" <T>; <T> := <F> "/" <T>; <T> := <G> "!";
+  <F> on "(": <F> := "(" <E> ")"; <F> := <G> "!";
+  <F> on "n": <F> := "n"; <F> := <G> "!";
+  <F> on "[": <F> := <G> "!"; <F> := "[" <H> "]";
+  <G> on "y": <G> := <F> "x"; <G> := "y";
+  <H> on "k": <H> := <opt(o)> <H> "h"; <H> := "k";
+  <opt(o)> on "o": <opt(o)> := "o"; <opt(o)> := EPS;
+table:
+  <E> on "(": <E> := <E> "+" <T>;
+  <E> on "n": <E> := <E> "+" <T>;
+  <E> on "[": <E> := <E> "+" <T>;
+  <E> on "y": <E> := <E> "+" <T>;
+  <T> on "(": <T> := <F> "*" <T>;
+  <T> on "n": <T> := <F> "*" <T>;
+  <T> on "[": <T> := <F> "*" <T>;
+  <T> on "y": <T> := <F> "*" <T>;
+  <F> on "(": <F> := "(" <E> ")";
+  <F> on "n": <F> := "n";
+  <F> on "[": <F> := <G> "!";
+  <F> on "y": <F> := <G> "!";
+  <G> on "(": <G> := <F> "x";
+  <G> on "n": <G> := <F> "x";
+  <G> on "[": <G> := <F> "x";
+  <G> on "y": <G> := <F> "x";
+  <H> on "k": <H> := <opt(o)> <H> "h";
+  <H> on "o": <H> := <opt(o)> <H> "h";
+  <opt(o)> on "k": <opt(o)> := EPS;
+  <opt(o)> on "o": <opt(o)> := "o";
+compressed:
+  20 entries in 22 slots;
+
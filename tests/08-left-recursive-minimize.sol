@@ -0,0 +1,12 @@
+start:
+  <E>;
+names:
+rules:
+  <E> := ((<E> "+" <T>) | (<E> "-" <T>) | (<F> "*" <T>) | (<F> "*" "*" <T>) | (<F> "/" <T>) | ("(" <E> ")") | "n" | (<G> "!") | ("[" <H> "]"));
+  <T> := ((<F> "*" <T>) | (<F> "*" "*" <T>) | (<F> "/" <T>) | ("(" <E> ")") | "n" | (<G> "!") | ("[" <H> "]"));
+  <F> := (("(" <E> ")") | "n" | (<G> "!") | ("[" <H> "]"));
+  <G> := ((<F> "x") | "y");
+  <H> := ((<opt(o)> <H> "h") | "k");
+  <opt(o)> := ("o" | EPS);
+
+eliminated 0 of 26 productions: removed 0 useless non-terminals, merged 0 equivalent ones
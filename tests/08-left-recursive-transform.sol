@@ -0,0 +1,23 @@
+start:
+  <E>;
+names:
+rules:
+  <E> := (("(" <E> ")" <E'>) | ("n" <E'>) | ("[" <H> "]" <E'>) | ("y" <E-G>));
+  <T> := ((<F> <T''>) | ("(" <E> ")") | "n" | (<G> "!") | ("[" <H> "]"));
+  <F> := (("(" <E> ")" <F-F>) | ("n" <F-F>) | ("[" <H> "]" <F-F>) | ("y" <F-G>));
+  <G> := (("y" <G-G>) | ("(" <E> ")" <G-F>) | ("n" <G-F>) | ("[" <H> "]" <G-F>));
+  <H> := ((<opt(o)> <H> "h" <H-H>) | ("k" <H-H>));
+  <opt(o)> := "o";
+  <E-E> := (("+" <T> <E-E>) | ("-" <T> <E-E>) | EPS);
+  <E-F> := (("*" <E-F'>) | ("/" <T> <E-E>) | ("x" <E-G>));
+  <E-G> := ("!" <E'>);
+  <F-F> := (("x" <F-G>) | EPS);
+  <F-G> := ("!" <F-F>);
+  <G-G> := (("!" <G-F>) | EPS);
+  <G-F> := ("x" <G-G>);
+  <H-H> := (("h" <H-H>) | EPS);
+  <E'> := (<E-E> | <E-F>);
+  <T'> := (<T> | ("*" <T>));
+  <T''> := (("*" <T'>) | ("/" <T>));
+  <E-F'> := ((<T> <E-E>) | ("*" <T> <E-E>));
+
@@ -0,0 +1,7 @@
+accepted: b
+accepted: a b
+accepted: a a a b
+accepted: a
+accepted: 
+rejected: b b
+rejected: c
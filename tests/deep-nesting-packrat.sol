@@ -0,0 +1,8 @@
+accepted: b
+accepted: a b
+accepted: a a a b
+accepted: a
+accepted: 
+rejected: b b
+rejected: c
+memo: 12 lookups, 0 hits (0.0%), 12 stores, 0 evictions, peak size 4
@@ -0,0 +1,7 @@
+accepted: b
+accepted: a b
+accepted: a a c d a b
+accepted: a c c d b
+rejected: a
+rejected: c d b
+rejected: 
@@ -0,0 +1,109 @@
+import mmap
+import sys
+from array import array
+from typing import Iterator, Union
+from ply.lex import LexToken
+from lexer import tokens
+from scanner import Scanner, make_token
+from diagnostics import Diagnostics
+
+# Columnar token stream: tokens of a grammar are stored as parallel arrays
+# referencing the original buffer, and token objects and values are only
+# created when they are accessed.
+
+TYPE_IDS = {name: type_id for type_id, name in enumerate(tokens)}
+
+# Tokens whose value does not start at the token position
+PREFIXED_TYPES = {TYPE_IDS[name] for name in ["TERMINAL", "NON_TERMINAL", "NAME"]}
+
+
+class TokenStream:
+    """
+    Tokens of a `bytes`-like buffer (`bytes`, `mmap`) kept as four columns:
+    type id (an index into `lexer.tokens`), start and end byte offsets of
+    the token value in the buffer, and line number.
+
+    Iterating over the stream yields `LexToken`s equal to the ones produced
+    by the lexer (for ASCII input; offsets are in bytes), so it can be
+    passed directly to `GrammarParser.parse_tokens`.
+    """
+
+    buffer: memoryview
+    types: array
+    starts: array
+    ends: array
+    lines: array
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap], diagnostics: Diagnostics = None):
+        self.source = buffer
+        self.buffer = memoryview(buffer)
+        self.types = array("B")
+        self.starts = array("q")
+        self.ends = array("q")
+        self.lines = array("L")
+        for kind, _, begin, end, lineno in Scanner(diagnostics).spans(buffer):
+            self.types.append(TYPE_IDS[kind])
+            self.starts.append(begin)
+            self.ends.append(end)
+            self.lines.append(lineno)
+
+    @classmethod
+    def from_file(cls, input_file: str, diagnostics: Diagnostics = None) -> "TokenStream":
+        with open(input_file, "rb") as grammar_definition:
+            try:
+                buffer = mmap.mmap(grammar_definition.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                buffer = b""
+        return cls(buffer, diagnostics)
+
+    def close(self):
+        self.buffer.release()
+        if isinstance(self.source, mmap.mmap):
+            self.source.close()
+
+    def __enter__(self) -> "TokenStream":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def type(self, index: int) -> str:
+        return tokens[self.types[index]]
+
+    def value(self, index: int) -> str:
+        return str(self.buffer[self.starts[index]:self.ends[index]], "utf-8")
+
+    def lexpos(self, index: int) -> int:
+        if self.types[index] in PREFIXED_TYPES:
+            return self.starts[index] - 1
+        return self.starts[index]
+
+    def token(self, index: int) -> LexToken:
+        return make_token(self.type(index), self.value(index),
+                          self.lines[index], self.lexpos(index))
+
+    def __iter__(self) -> Iterator[LexToken]:
+        for index in range(len(self.types)):
+            yield self.token(index)
+
+
+def main():
+    if len(sys.argv) > 1:
+        input_file = sys.argv[1]
+        if len(sys.argv) > 2:
+            output_file = sys.argv[2]
+        else:
+            output_file = input_file + ".out"
+        with TokenStream.from_file(input_file) as stream, open(output_file, "w") as processed_grammar:
+            for tok in stream:
+                print(tok, file=processed_grammar)
+    else:
+        print("Expected at least one argument: input file containing grammar")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,3 +19,6 @@ RGROUP_REGEX = r"\)"
 ALT_SEP_REGEX = r"\|"
 BIND_REGEX = r":="
 BIND_END_REGEX = r";"
+
+RESERVED = {"start:": "START", "rules:": "RULES",
+            "names:": "NAMES", "EPS": "EPSILON"}
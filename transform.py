@@ -0,0 +1,219 @@
+import argparse
+import sys
+from typing import Dict, FrozenSet, Iterator, List, Set, Tuple
+
+import ebnf_parser
+from cnf import CNFConverter
+from converter import Converter
+from EBNF import *
+
+# Removal of left recursion and left factoring of grammars in classic form,
+# preparing them for predictive parsers.
+#
+# Left recursion, direct and indirect, is removed by the left-corner
+# transform restricted to left-recursive non-terminals. Such non-terminal
+# `A` derives `b A-X` for every production `X := b` of a left-recursive `X`
+# that derivations from `A` may start with, unless `b` starts with a
+# left-recursive non-terminal. The helper `A-X` derives what follows an
+# `X` at the start of `A`: `c A-B` for every production `B := X c`, and
+# the empty string for `A-A`. The result is at most the size of the grammar
+# times the number of left-recursive non-terminals. Epsilon productions
+# and chain rules, which hide left recursion, are removed first, but only
+# when the grammar is left-recursive, so other grammars keep their shape.
+# Productions with several nullable symbols are binarized past the first
+# of them beforehand, so removing epsilons does not expand a production
+# into every subset of its nullable symbols.
+#
+# Alternatives are left-factored over a trie of their right-hand sides:
+# every node where alternatives diverge becomes one helper non-terminal,
+# so the longest common prefix of any number of alternatives is factored
+# in one pass over the symbols, and helpers deriving the same set of
+# suffixes are shared.
+
+Production = Tuple[int, ...]
+
+# Key marking the end of a right-hand side in a trie node
+END = None
+
+
+class GrammarTransformer(CNFConverter):
+    """
+    Shares the representation and the passes removing chain rules and
+    useless symbols with `CNFConverter`. Helpers of the left-corner
+    transform are named `A-X`, helpers of left factoring after the
+    non-terminal they are created for; names are primed when taken.
+    """
+
+    def leftmost(self, non_terminal: int) -> Iterator[int]:
+        # Non-terminals a derivation from `non_terminal` may start with after one step
+        for rhs in self.productions[non_terminal]:
+            for symbol in rhs:
+                if self.is_terminal(symbol):
+                    break
+                yield symbol
+                if not self.nullable[symbol]:
+                    break
+
+    def left_recursive(self) -> Set[int]:
+        """
+        Non-terminals deriving sentential forms that start with themselves
+        """
+        recursive: Set[int] = set()
+        for component in strongly_connected_components(list(self.productions), self.leftmost):
+            if len(component) > 1 or component[0] in self.leftmost(component[0]):
+                recursive.update(component)
+        return recursive
+
+    def split_nullable(self):
+        # The symbols after the first nullable one of a production are
+        # replaced by a binarized suffix, as `CNFConverter.binarize` builds
+        # it, when they contain nullable symbols too. Every production is
+        # then left with at most two nullable symbols
+        suffixes: Dict[Production, int] = {}
+        for non_terminal in list(self.productions):
+            split: Dict[Production, None] = {}
+            for rhs in self.productions[non_terminal]:
+                first = next((index for index, symbol in enumerate(rhs) if self.nullable[symbol]), len(rhs))
+                rest = rhs[first + 1:]
+                if len(rest) > 1 and any(self.nullable[symbol] for symbol in rest):
+                    rhs = rhs[:first + 1] + (self.suffix(rest, suffixes),)
+                split[rhs] = None
+            self.productions[non_terminal] = split
+
+    def remove_epsilons(self):
+        # Every nullable non-terminal is either kept or dropped, so after
+        # `split_nullable` a production expands to at most four ones
+        self.split_nullable()
+        for non_terminal, productions in self.productions.items():
+            expanded: Dict[Production, None] = {}
+            for rhs in productions:
+                variants: List[Production] = [()]
+                for symbol in rhs:
+                    kept = [variant + (symbol,) for variant in variants]
+                    variants = kept + variants if self.nullable[symbol] else kept
+                expanded.update(dict.fromkeys(variant for variant in variants if variant))
+            self.productions[non_terminal] = expanded
+        self.nullable = bytearray(len(self.names))
+
+    def left_corner_rules(self, non_terminal: int, recursive: Set[int],
+                          transformed: Dict[int, Dict[Production, None]]):
+        # Left-recursive non-terminals `X` that derivations from
+        # `non_terminal` may start with, each with its helper `A-X`
+        corners = {non_terminal: self.new_non_terminal(f"{self.names[non_terminal]}-{self.names[non_terminal]}")}
+        worklist = [non_terminal]
+        while worklist:
+            for symbol in self.leftmost(worklist.pop()):
+                if symbol in recursive and symbol not in corners:
+                    corners[symbol] = self.new_non_terminal(f"{self.names[non_terminal]}-{self.names[symbol]}")
+                    worklist.append(symbol)
+        productions = transformed[non_terminal] = {}
+        for helper in corners.values():
+            transformed[helper] = {}
+        for corner, helper in corners.items():
+            for rhs in self.productions[corner]:
+                if rhs[0] in recursive:
+                    transformed[corners[rhs[0]]][rhs[1:] + (helper,)] = None
+                else:
+                    productions[rhs + (helper,)] = None
+        transformed[corners[non_terminal]][()] = None
+
+    def remove_left_recursion(self):
+        if not self.left_recursive():
+            return
+        nullable_start = self.nullable[self.start]
+        self.remove_epsilons()
+        self.remove_units()
+        self.remove_useless()
+        recursive = self.left_recursive()
+        transformed: Dict[int, Dict[Production, None]] = {}
+        for non_terminal in list(self.productions):
+            if non_terminal in recursive:
+                self.left_corner_rules(non_terminal, recursive, transformed)
+        self.productions.update(transformed)
+        if nullable_start:
+            self.add_start()
+            self.productions.setdefault(self.start, {})[()] = None
+        self.remove_useless()
+
+    def factor(self, node: Dict, owner: int, helpers: Dict[FrozenSet[Production], int]) -> Dict[Production, None]:
+        """
+        Productions deriving the suffixes stored in a trie node: a path
+        without branches becomes a prefix, a branching node a helper
+        """
+        factored: Dict[Production, None] = {}
+        for symbol, child in node.items():
+            if symbol is END:
+                factored[()] = None
+                continue
+            prefix = [symbol]
+            while len(child) == 1 and END not in child:
+                [(symbol, child)] = child.items()
+                prefix.append(symbol)
+            if len(child) == 1:
+                factored[tuple(prefix)] = None
+                continue
+            suffixes = self.factor(child, owner, helpers)
+            helper = helpers.get(frozenset(suffixes))
+            if helper is None:
+                helper = self.new_non_terminal(self.names[owner], () in suffixes)
+                helpers[frozenset(suffixes)] = helper
+                self.productions[helper] = suffixes
+            factored[tuple(prefix) + (helper,)] = None
+        return factored
+
+    def left_factor(self):
+        helpers: Dict[FrozenSet[Production], int] = {}
+        for non_terminal in list(self.productions):
+            trie: Dict = {}
+            for rhs in self.productions[non_terminal]:
+                node = trie
+                for symbol in rhs:
+                    node = node.setdefault(symbol, {})
+                node[END] = {}
+            self.productions[non_terminal] = self.factor(trie, non_terminal, helpers)
+
+    def convert(self) -> EBNF:
+        self.remove_left_recursion()
+        self.left_factor()
+        return self.to_grammar()
+
+
+def remove_left_recursion(grammar: EBNF) -> EBNF:
+    transformer = GrammarTransformer(grammar)
+    transformer.remove_left_recursion()
+    return transformer.to_grammar()
+
+
+def left_factor(grammar: EBNF) -> EBNF:
+    transformer = GrammarTransformer(grammar)
+    transformer.left_factor()
+    return transformer.to_grammar()
+
+
+def to_predictive(grammar: EBNF) -> EBNF:
+    """
+    Removes left recursion from a grammar in classic form, as produced by
+    `Converter.convert`, and left-factors it
+    """
+    return GrammarTransformer(grammar).convert()
+
+
+def main():
+    p = argparse.ArgumentParser("Converts CF formal grammar from EBNF to classic form "
+                                "without left recursion and left-factors it")
+    p.add_argument('input', nargs=1, type=str)
+    p.add_argument('output', nargs='?')
+    args = p.parse_args()
+    if not args.output:
+        args.output = args.input[0] + ".out"
+    ebnf, diagnostics = ebnf_parser.parse_ebnf(args.input[0])
+    diagnostics.write(sys.stderr)
+    with open(args.output, "w") as processed_grammar:
+        if ebnf is None:
+            print("Grammar is incorrect, cannot parse", file=processed_grammar)
+            return
+        print_grammar(to_predictive(Converter(ebnf, False).convert()), processed_grammar)
+
+
+if __name__ == "__main__":
+    main()